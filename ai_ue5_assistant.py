@@ -19,9 +19,15 @@ AI駆動UE5ゲーム開発アシスタント
     - "ジャンプ力が2倍になるパワーアップアイテムを実装して"
 
 使用方法:
-    python ai_ue5_assistant.py
+    python ai_ue5_assistant.py [--strict-ai] [--batch]
     > コマンドを入力してください: 
 
+    python ai_ue5_assistant.py < commands.txt  # 1行1コマンドのファイルを一括実行
+
+オプション:
+    --strict-ai  キーワードによる簡易分類を行わず、常にAIでコマンドを解析する
+    --batch      空行が入力されるまでコマンドを溜めて、まとめて解析する
+
 制限事項:
 - MCPサーバーが起動している必要があります
 - 自然言語解析には、設定済みのOpenAI APIキーが必要です
@@ -32,8 +38,54 @@ import logging
 import time
 import sys
 import os
+import hashlib
+import sqlite3
+import argparse
+import numpy as np
 import readline  # 入力履歴とコマンド編集のサポート用
 
+# キーワード照合の高速化（pyahocorasickが利用可能な場合はAho-Corasick法で一括照合）
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 数値計算の高速化（numbaが利用可能な場合はJITコンパイル）
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numbaがない場合は関数をそのまま返す"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# JSON処理の高速化（orjsonが利用可能な場合はそちらを使用）
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def json_loads(data):
+        """JSON文字列（またはバイト列）を解析する"""
+        return orjson.loads(data)
+
+    def json_dumps(obj):
+        """オブジェクトをJSON文字列に変換する（UTF-8のまま出力）"""
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    JSONDecodeError = json.JSONDecodeError
+
+    def json_loads(data):
+        """JSON文字列（またはバイト列）を解析する"""
+        return json.loads(data)
+
+    def json_dumps(obj):
+        """オブジェクトをJSON文字列に変換する（UTF-8のまま出力）"""
+        return json.dumps(obj, ensure_ascii=False)
+
 # ロギングの設定
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +97,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ai_ue5_assistant")
 
+# AI解析結果キャッシュの設定
+AI_CACHE_PATH = os.getenv("AI_CACHE_PATH", "ai_cache.db")
+AI_CACHE_SCHEMA_VERSION = 1  # 解析結果の形式を変更した場合はインクリメントしてキャッシュを無効化
+
+# 一括解析で1回のAI呼び出しにまとめるコマンド数
+BATCH_SIZE = 8
+
+# キーワードによる簡易分類で使用するフレーズとカテゴリ
+KEYWORD_CATEGORIES = {
+    "地形": ("terrain",),
+    "環境": ("terrain",),
+    "山": ("mountain",),
+    "レベル": ("level",),
+    "マップ": ("level",),
+    "ブループリント": ("blueprint",),
+    "機能": ("blueprint",),
+    "アイテム": ("blueprint", "item"),
+}
+
+# 地形ハイトマップ生成の設定
+TERRAIN_OCTAVES = 6  # 重ね合わせるノイズの数
+TERRAIN_BASE_FREQUENCY = 1.0 / 256.0  # 最も粗いノイズの周波数（1/ピクセル）
+HEIGHT_VARIATION_AMPLITUDE = {"low": 0.25, "medium": 0.5, "high": 1.0}  # 起伏の大きさ
+
+@njit(cache=True)
+def _lattice_value(ix, iy, seed):
+    """格子点の疑似乱数値（0〜1）を返す"""
+    h = (ix * 374761393 + iy * 668265263 + seed * 2147483647) & 0xFFFFFFFF
+    h = ((h ^ (h >> 13)) * 1274126177) & 0xFFFFFFFF
+    return (h ^ (h >> 16)) / 4294967295.0
+
+@njit(parallel=True, cache=True)
+def _terrain_heightmap(size_x, size_y, seed, variation):
+    """
+    フラクタルなバリューノイズで地形のハイトマップを生成する
+    
+    引数:
+        size_x (int): X方向のサイズ（ピクセル）
+        size_y (int): Y方向のサイズ（ピクセル）
+        seed (int): 乱数シード
+        variation (float): 起伏の大きさ（高さの最大値）
+        
+    戻り値:
+        np.ndarray: (size_y, size_x) のハイトマップ（0〜variation）
+    """
+    heightmap = np.empty((size_y, size_x), dtype=np.float32)
+    for y in prange(size_y):
+        for x in range(size_x):
+            value = 0.0
+            total = 0.0
+            amplitude = 1.0
+            frequency = TERRAIN_BASE_FREQUENCY
+            for _ in range(TERRAIN_OCTAVES):
+                fx = x * frequency
+                fy = y * frequency
+                ix = int(np.floor(fx))
+                iy = int(np.floor(fy))
+                tx = fx - ix
+                ty = fy - iy
+                sx = tx * tx * (3.0 - 2.0 * tx)
+                sy = ty * ty * (3.0 - 2.0 * ty)
+                v00 = _lattice_value(ix, iy, seed)
+                v10 = _lattice_value(ix + 1, iy, seed)
+                v01 = _lattice_value(ix, iy + 1, seed)
+                v11 = _lattice_value(ix + 1, iy + 1, seed)
+                top = v00 + (v10 - v00) * sx
+                bottom = v01 + (v11 - v01) * sx
+                value += (top + (bottom - top) * sy) * amplitude
+                total += amplitude
+                amplitude *= 0.5
+                frequency *= 2.0
+            heightmap[y, x] = value / total * variation
+    return heightmap
+
+def generate_heightmap(size_x, size_y, seed=0, height_variation="medium"):
+    """
+    地形生成コマンドのパラメータからハイトマップを生成する
+    
+    引数:
+        size_x (int): X方向のサイズ（ピクセル）
+        size_y (int): Y方向のサイズ（ピクセル）
+        seed (int): 乱数シード
+        height_variation (str): 起伏の大きさ（low, medium, high）
+        
+    戻り値:
+        np.ndarray: (size_y, size_x) のハイトマップ
+    """
+    variation = HEIGHT_VARIATION_AMPLITUDE.get(height_variation, HEIGHT_VARIATION_AMPLITUDE["medium"])
+    return _terrain_heightmap(int(size_x), int(size_y), int(seed), float(variation))
+
 # UE5クライアントのモック化の準備
 try:
     # UE5のモックモジュール
@@ -95,13 +237,22 @@ class AIUE5Assistant:
     AI駆動UE5アシスタントクラス
     """
     
-    def __init__(self):
+    def __init__(self, strict_ai=False):
         """
         初期化メソッド
+        
+        引数:
+            strict_ai (bool): Trueの場合、キーワードによる簡易分類を行わず常にAIで解析する
         """
         # UE5 MCPクライアントを作成
         self.client = None
         
+        # AIのみで解析するかどうか
+        self.strict_ai = strict_ai
+        
+        # キーワード照合用のオートマトン
+        self.keyword_automaton = self._build_keyword_automaton()
+        
         # コマンド履歴
         self.command_history = []
         
@@ -115,6 +266,88 @@ class AIUE5Assistant:
             "build_lighting": "ライティングをビルドします",
             "place_asset": "アセットを配置します"
         }
+        
+        # AI解析結果のキャッシュ
+        self.cache = self._open_cache(AI_CACHE_PATH)
+    
+    def _open_cache(self, cache_path):
+        """
+        AI解析結果のキャッシュ（SQLite）を開く
+        
+        引数:
+            cache_path (str): キャッシュファイルのパス
+            
+        戻り値:
+            sqlite3.Connection: キャッシュ接続（開けない場合はNone）
+        """
+        try:
+            conn = sqlite3.connect(cache_path)
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+            row = conn.execute("SELECT value FROM meta WHERE name = 'schema_version'").fetchone()
+            if row is None or row[0] != AI_CACHE_SCHEMA_VERSION:
+                # スキーマのバージョンが異なる場合はキャッシュを破棄
+                conn.execute("DELETE FROM cache")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('schema_version', ?)",
+                    (AI_CACHE_SCHEMA_VERSION,)
+                )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"AIキャッシュを開けませんでした。キャッシュなしで続行します: {str(e)}")
+            return None
+    
+    def _cache_key(self, text):
+        """
+        キャッシュキーを生成する
+        
+        引数:
+            text (str): 自然言語コマンド
+            
+        戻り値:
+            str: キャッシュキー
+        """
+        normalized = " ".join(text.split())
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key):
+        """
+        キャッシュから解析結果を取得する
+        
+        引数:
+            key (str): キャッシュキー
+            
+        戻り値:
+            dict: 解析結果（キャッシュにない場合はNone）
+        """
+        if self.cache is None:
+            return None
+        try:
+            row = self.cache.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"AIキャッシュの読み込みに失敗しました: {str(e)}")
+            return None
+        return json_loads(row[0]) if row else None
+    
+    def _cache_put(self, key, parsed_command):
+        """
+        解析結果をキャッシュに保存する
+        
+        引数:
+            key (str): キャッシュキー
+            parsed_command (dict): 解析結果
+        """
+        if self.cache is None:
+            return
+        try:
+            self.cache.execute(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                (key, json_dumps(parsed_command).encode("utf-8"))
+            )
+            self.cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"AIキャッシュの書き込みに失敗しました: {str(e)}")
     
     def connect(self):
         """
@@ -122,6 +355,8 @@ class AIUE5Assistant:
         """
         logger.info("MCPサーバーに接続しています...")
         try:
+            # connect_to_mcpのステータス確認でクライアントのHTTPセッションが接続済みになり、
+            # 以降のAI呼び出しは同じ接続を再利用する
             self.client = connect_to_mcp()
             status = self.client.check_server_status()
             
@@ -149,6 +384,93 @@ class AIUE5Assistant:
             print(f"❌ エラー: {str(e)}")
             return False
     
+    def _build_keyword_automaton(self):
+        """
+        キーワード照合用のAho-Corasickオートマトンを構築する
+        
+        戻り値:
+            ahocorasick.Automaton: オートマトン（pyahocorasickがない場合はNone）
+        """
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword, categories in KEYWORD_CATEGORIES.items():
+            automaton.add_word(keyword, categories)
+        automaton.make_automaton()
+        return automaton
+    
+    def _match_categories(self, text):
+        """
+        テキストに含まれるキーワードのカテゴリを取得する
+        
+        引数:
+            text (str): 自然言語コマンド
+            
+        戻り値:
+            set: 一致したカテゴリ
+        """
+        if self.keyword_automaton is not None:
+            # テキストを1回走査するだけで全キーワードを照合
+            return {c for _, categories in self.keyword_automaton.iter(text) for c in categories}
+        return {c for keyword, categories in KEYWORD_CATEGORIES.items() if keyword in text for c in categories}
+    
+    def _fast_classify(self, text):
+        """
+        キーワードによる簡易分類を行う
+        
+        引数:
+            text (str): 自然言語コマンド
+            
+        戻り値:
+            dict: 解析結果（キーワードで分類できない場合はNone）
+        """
+        categories = self._match_categories(text)
+        if "terrain" in categories:
+            mountainous = "mountain" in categories
+            return {
+                "command": "generate_terrain",
+                "params": {
+                    "size_x": 8192,
+                    "size_y": 8192,
+                    "height_variation": "high" if mountainous else "medium",
+                    "terrain_type": "mountainous" if mountainous else "plains"
+                }
+            }
+        if "level" in categories:
+            return {
+                "command": "create_level",
+                "params": {
+                    "name": "GeneratedLevel",
+                    "template": "ThirdPerson"
+                }
+            }
+        if "blueprint" in categories:
+            return {
+                "command": "create_blueprint",
+                "params": {
+                    "name": "BP_" + ("Item" if "item" in categories else "Actor"),
+                    "class": "Actor",
+                    "description": text,
+                    "ai_generate": True
+                }
+            }
+        return None
+    
+    def _decode_ai_content(self, content):
+        """
+        AIの応答内容をJSONとして解析する
+        
+        引数:
+            content (str | bytes | dict | list): AIの応答内容
+            
+        戻り値:
+            dict | list: 解析結果
+        """
+        # 解析済みの応答はそのまま使用し、文字列・バイト列は中間変換なしで解析する
+        if isinstance(content, (dict, list)):
+            return content
+        return json_loads(content)
+    
     def parse_natural_language(self, text):
         """
         自然言語コマンドを解析する
@@ -162,6 +484,22 @@ class AIUE5Assistant:
         # AIを使ってテキストを解析し、UE5コマンドに変換
         logger.info(f"自然言語コマンドを解析: {text}")
         
+        # キーワードで分類できる場合はAIを呼び出さない
+        if not self.strict_ai:
+            fast_command = self._fast_classify(text)
+            if fast_command is not None:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("キーワードから解析しました: %s", json_dumps(fast_command))
+                return fast_command
+        
+        # キャッシュを確認
+        cache_key = self._cache_key(text)
+        cached_command = self._cache_get(cache_key)
+        if cached_command is not None:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("キャッシュから解析結果を取得しました: %s", json_dumps(cached_command))
+            return cached_command
+        
         try:
             # AIに自然言語を解析してもらう
             ai_result = self.client.generate_ai_content(
@@ -172,51 +510,25 @@ class AIUE5Assistant:
             
             result_content = ai_result.get("data", {}).get("content", "{}")
             
-            # 文字列からJSONを解析
+            # 文字列（またはバイト列）からJSONを解析
             try:
-                parsed_command = json.loads(result_content)
-                logger.info(f"解析結果: {json.dumps(parsed_command, ensure_ascii=False)}")
+                parsed_command = self._decode_ai_content(result_content)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("解析結果: %s", json_dumps(parsed_command))
+                self._cache_put(cache_key, parsed_command)
                 return parsed_command
-            except json.JSONDecodeError:
+            except JSONDecodeError:
                 # AIからの応答がJSONでない場合、簡易パース
                 logger.warning(f"AIからの応答がJSONではありません: {result_content}")
                 
-                # 簡易的なパーシング（実際の環境では、より堅牢な実装が必要）
-                if "地形" in text or "環境" in text:
-                    return {
-                        "command": "generate_terrain",
-                        "params": {
-                            "size_x": 8192,
-                            "size_y": 8192,
-                            "height_variation": "high" if "山" in text else "medium",
-                            "terrain_type": "mountainous" if "山" in text else "plains"
-                        }
-                    }
-                elif "レベル" in text or "マップ" in text:
-                    return {
-                        "command": "create_level",
-                        "params": {
-                            "name": "GeneratedLevel",
-                            "template": "ThirdPerson"
-                        }
-                    }
-                elif "ブループリント" in text or "機能" in text or "アイテム" in text:
-                    return {
-                        "command": "create_blueprint",
-                        "params": {
-                            "name": "BP_" + ("Item" if "アイテム" in text else "Actor"),
-                            "class": "Actor",
-                            "description": text,
-                            "ai_generate": True
-                        }
-                    }
-                else:
-                    return {
-                        "command": "unknown",
-                        "params": {
-                            "original_text": text
-                        }
+                # 簡易的なパーシング（strict_aiでなければ分類済みで一致しなかったため再走査しない）
+                fast_command = self._fast_classify(text) if self.strict_ai else None
+                return fast_command or {
+                    "command": "unknown",
+                    "params": {
+                        "original_text": text
                     }
+                }
         except Exception as e:
             logger.exception(f"コマンド解析中にエラーが発生しました: {str(e)}")
             return {
@@ -227,6 +539,62 @@ class AIUE5Assistant:
                 }
             }
     
+    def parse_natural_language_batch(self, texts):
+        """
+        複数の自然言語コマンドを1回のAI呼び出しでまとめて解析する
+        
+        引数:
+            texts (list): 自然言語コマンドのリスト
+            
+        戻り値:
+            list: 解析結果（コマンドとパラメータ）のリスト（入力と同じ順序）
+        """
+        results = [None] * len(texts)
+        pending = []  # AIでの解析が必要なコマンド (インデックス, テキスト, キャッシュキー)
+        
+        # キーワード分類とキャッシュで解決できるものを先に処理
+        for i, text in enumerate(texts):
+            if not self.strict_ai:
+                fast_command = self._fast_classify(text)
+                if fast_command is not None:
+                    results[i] = fast_command
+                    continue
+            cache_key = self._cache_key(text)
+            cached_command = self._cache_get(cache_key)
+            if cached_command is not None:
+                results[i] = cached_command
+                continue
+            pending.append((i, text, cache_key))
+        
+        if len(pending) == 1:
+            i, text, _ = pending[0]
+            results[i] = self.parse_natural_language(text)
+        elif pending:
+            logger.info(f"{len(pending)}件のコマンドをまとめて解析します")
+            try:
+                numbered = "\n".join(f"{n + 1}. {text}" for n, (_, text, _) in enumerate(pending))
+                ai_result = self.client.generate_ai_content(
+                    f"以下の{len(pending)}件の自然言語コマンドをそれぞれ解析して、Unreal Engine 5のコマンドとパラメータに変換してください。"
+                    f"各コマンドの解析結果を同じ順序で並べたJSON配列で返してください。\nコマンド:\n{numbered}",
+                    "command_parser"
+                )
+                result_content = ai_result.get("data", {}).get("content", "[]")
+                parsed_commands = self._decode_ai_content(result_content)
+                
+                if not isinstance(parsed_commands, list) or len(parsed_commands) != len(pending):
+                    raise ValueError(f"AIからの応答の件数が一致しません: {result_content}")
+                
+                for (i, _, cache_key), parsed_command in zip(pending, parsed_commands):
+                    results[i] = parsed_command
+                    self._cache_put(cache_key, parsed_command)
+            except Exception as e:
+                # 一括解析に失敗した場合は1件ずつ解析
+                logger.warning(f"一括解析に失敗しました。1件ずつ解析します: {str(e)}")
+                for i, text, _ in pending:
+                    results[i] = self.parse_natural_language(text)
+        
+        return results
+    
     def execute_command(self, parsed_command):
         """
         解析されたコマンドを実行する
@@ -244,13 +612,15 @@ class AIUE5Assistant:
         command = parsed_command.get("command", "")
         params = parsed_command.get("params", {})
         
-        logger.info(f"コマンド実行: {command}, パラメータ: {json.dumps(params, ensure_ascii=False)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("コマンド実行: %s, パラメータ: %s", command, json_dumps(params))
         
         try:
             # コマンドに応じて実行
             if command in self.available_commands:
                 result = self.client.execute_unreal_command(command, params)
-                logger.info(f"実行結果: {json.dumps(result, ensure_ascii=False)}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("実行結果: %s", json_dumps(result))
                 return result
             elif command == "unknown":
                 # 未知のコマンドの場合、AIに生成してもらう
@@ -260,7 +630,8 @@ class AIUE5Assistant:
                     "Actor",
                     description
                 )
-                logger.info(f"Blueprint生成結果: {json.dumps(blueprint_result, ensure_ascii=False)}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Blueprint生成結果: %s", json_dumps(blueprint_result))
                 return {
                     "status": "success",
                     "message": f"指定された機能を実装するBlueprintを生成しました: {description}",
@@ -273,9 +644,64 @@ class AIUE5Assistant:
             logger.exception(f"コマンド実行中にエラーが発生しました: {str(e)}")
             return {"status": "error", "message": str(e)}
     
-    def run_interactive(self):
+    def run_commands(self, texts):
+        """
+        自然言語コマンドを解析して順に実行する
+        
+        引数:
+            texts (list): 自然言語コマンドのリスト
+        """
+        # コマンド履歴に追加
+        self.command_history.extend(texts)
+        
+        # コマンドの解析
+        if len(texts) == 1:
+            print(f"\n🔍 '{texts[0]}' を解析しています...")
+            parsed_commands = [self.parse_natural_language(texts[0])]
+        else:
+            print(f"\n🔍 {len(texts)}件のコマンドをまとめて解析しています...")
+            parsed_commands = self.parse_natural_language_batch(texts)
+        
+        # コマンドの実行
+        for text, parsed_command in zip(texts, parsed_commands):
+            if not isinstance(parsed_command, dict):
+                print(f"❌ エラー: '{text}' の解析結果が不正です")
+                continue
+            
+            if parsed_command.get("command") == "error":
+                print(f"❌ エラー: {parsed_command.get('params', {}).get('error_message', '不明なエラー')}")
+                continue
+            
+            print(f"🚀 コマンド '{parsed_command.get('command')}' を実行しています...")
+            result = self.execute_command(parsed_command)
+            
+            if result.get("status") == "success":
+                print(f"✅ 成功: {result.get('message', '操作が完了しました')}")
+            else:
+                print(f"❌ 失敗: {result.get('message', '不明なエラー')}")
+    
+    def run_batch(self, stream, batch_size=BATCH_SIZE):
+        """
+        ストリーム（標準入力など）から読み込んだコマンドを一括で実行する
+        
+        引数:
+            stream: 1行に1コマンドを含むテキストストリーム
+            batch_size (int): 1回のAI呼び出しでまとめて解析するコマンド数
+        """
+        # MCPサーバーに接続
+        if not self.connect():
+            return
+        
+        texts = [line.strip() for line in stream if line.strip()]
+        for start in range(0, len(texts), batch_size):
+            self.run_commands(texts[start:start + batch_size])
+    
+    def run_interactive(self, batch=False):
         """
         対話モードで実行する
+        
+        引数:
+            batch (bool): Trueの場合、空行が入力されるまでコマンドを溜めてまとめて解析する
         """
         # MCPサーバーに接続
         if not self.connect():
@@ -285,20 +711,27 @@ class AIUE5Assistant:
         print("自然言語でUE5コマンドを実行できます。")
         print("'exit'または'quit'と入力すると終了します。")
         print("'help'と入力するとヘルプを表示します。")
+        if batch:
+            print("一括モード: 空行を入力すると、それまでのコマンドをまとめて実行します。")
         print("============================================\n")
         
+        pending_inputs = []
         while True:
             try:
                 # コマンド入力
-                user_input = input("\n> コマンドを入力してください: ").strip()
+                prompt = "... " if pending_inputs else "\n> コマンドを入力してください: "
+                user_input = input(prompt).strip()
                 
                 # 終了コマンド
                 if user_input.lower() in ["exit", "quit", "終了"]:
                     print("アシスタントを終了します。")
                     break
                 
-                # 空のコマンド
+                # 空のコマンド（一括モードでは溜めたコマンドをまとめて実行）
                 if not user_input:
+                    if pending_inputs:
+                        batch_inputs, pending_inputs = pending_inputs, []
+                        self.run_commands(batch_inputs)
                     continue
                 
                 # ヘルプコマンド
@@ -306,24 +739,12 @@ class AIUE5Assistant:
                     self.show_help()
                     continue
                 
-                # コマンド履歴に追加
-                self.command_history.append(user_input)
-                
-                # コマンドの解析と実行
-                print(f"\n🔍 '{user_input}' を解析しています...")
-                parsed_command = self.parse_natural_language(user_input)
-                
-                if parsed_command.get("command") == "error":
-                    print(f"❌ エラー: {parsed_command.get('params', {}).get('error_message', '不明なエラー')}")
+                # 一括モードでは空行が入力されるまでコマンドを溜める
+                if batch:
+                    pending_inputs.append(user_input)
                     continue
                 
-                print(f"🚀 コマンド '{parsed_command.get('command')}' を実行しています...")
-                result = self.execute_command(parsed_command)
-                
-                if result.get("status") == "success":
-                    print(f"✅ 成功: {result.get('message', '操作が完了しました')}")
-                else:
-                    print(f"❌ 失敗: {result.get('message', '不明なエラー')}")
+                self.run_commands([user_input])
                 
             except KeyboardInterrupt:
                 print("\nキャンセルされました。終了するには 'exit' と入力してください。")
@@ -350,9 +771,18 @@ class AIUE5Assistant:
         print("====================")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AI駆動UE5ゲーム開発アシスタント")
+    parser.add_argument("--strict-ai", action="store_true", help="キーワードによる簡易分類を行わず、常にAIでコマンドを解析する")
+    parser.add_argument("--batch", action="store_true", help="空行が入力されるまでコマンドを溜めて、まとめて解析する")
+    args = parser.parse_args()
+    
     try:
-        assistant = AIUE5Assistant()
-        assistant.run_interactive()
+        assistant = AIUE5Assistant(strict_ai=args.strict_ai)
+        if sys.stdin.isatty():
+            assistant.run_interactive(batch=args.batch)
+        else:
+            # パイプやファイルからの入力は一括で解析して実行
+            assistant.run_batch(sys.stdin)
     except Exception as e:
         logger.exception(f"実行中にエラーが発生しました: {str(e)}")
         print(f"致命的なエラーが発生しました: {str(e)}")
@@ -30,13 +30,25 @@ import logging
 import subprocess
 import threading
 import signal
+import socket
 import requests
+from requests.adapters import HTTPAdapter
 import shutil
 import atexit
 import argparse
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
+# JSON解析の高速化（orjsonが利用可能な場合はそちらを使用）
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # 引数のパース
 parser = argparse.ArgumentParser(description='UE5自動ゲーム開発スクリプト')
 parser.add_argument('--mock', action='store_true', help='モックモードでサーバーを起動')
@@ -62,24 +74,94 @@ logger = logging.getLogger("auto_launch_ue5")
 
 # グローバル変数
 PROCESSES = []  # 起動したプロセスのリスト
+PROCESSES_LOCK = threading.Lock()  # ワーカースレッドからPROCESSESを更新する際のロック
+STOP_EVENT = threading.Event()  # 終了シグナルを受け取るとセットされる
+PLUGIN_MANIFEST_NAME = ".install_manifest"  # インストール済みプラグインのハッシュを記録するファイル
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 MOCK_MODE = args.mock
+BLENDER_READY_FILE = os.path.join(SCRIPT_DIR, "temp", "blender_ready")  # Blender API起動完了の目印ファイル
+BLENDER_STARTUP_TIMEOUT = 30  # Blender APIの起動待機の上限（秒）
+UE5_STARTUP_TIMEOUT = 120  # UE5エディタの起動待機の上限（秒）
+HTTP_TIMEOUT = (0.2, 1.0)  # ステータス確認の（接続, 読み込み）タイムアウト（秒）
+
+# ステータス確認用のHTTPセッション（接続を再利用）
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
 
 # 設定の読み込み
+@functools.lru_cache(maxsize=1)
+def _load_settings_cached(settings_path, mtime):
+    """設定ファイルを解析する（更新時刻が変わらない限り結果を再利用）"""
+    with open(settings_path, "rb") as f:
+        return json_loads(f.read())
+
 def load_settings():
     """設定ファイルを読み込む"""
     settings_path = os.path.join(SCRIPT_DIR, "mcp_settings.json")
     try:
-        with open(settings_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _load_settings_cached(settings_path, os.path.getmtime(settings_path))
     except Exception as e:
         logger.error(f"設定ファイルの読み込みエラー: {str(e)}")
         return {}
 
+# 起動したプロセスを登録する関数
+def register_process(process):
+    """終了時のクリーンアップ対象としてプロセスを登録（スレッドセーフ）"""
+    with PROCESSES_LOCK:
+        PROCESSES.append(process)
+
+# 子プロセスを実行して出力をログに流す関数
+def run_and_stream(cmd, env=None):
+    """子プロセスを実行し、標準出力・標準エラーを1行ずつログに出力して終了コードを返す"""
+    process = subprocess.Popen(
+        cmd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    register_process(process)
+    name = os.path.basename(cmd[-1])
+    for line in iter(process.stdout.readline, ""):
+        logger.info(f"[{name}] {line.rstrip()}")
+    process.stdout.close()
+    return process.wait()
+
+# 準備完了を待機する関数
+def wait_for_file(path, timeout, interval=0.1, process=None):
+    """ファイルが作成されるまで待機する（プロセスが終了した場合や終了が要求された場合は中断）"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            return True
+        if process is not None and process.poll() is not None:
+            return False
+        if STOP_EVENT.wait(interval):
+            return False
+    return False
+
+def wait_for_port(host, port, timeout, interval=0.1, process=None):
+    """TCPポートが接続を受け付けるまで待機する（プロセスが終了した場合や終了が要求された場合は中断）"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, int(port)), timeout=interval):
+                return True
+        except OSError:
+            pass
+        if process is not None and process.poll() is not None:
+            return False
+        if STOP_EVENT.wait(interval):
+            return False
+    return False
+
 # 終了時にプロセスをクリーンアップする関数
 def cleanup():
     """すべての子プロセスを終了"""
-    for proc in PROCESSES:
+    with PROCESSES_LOCK:
+        processes = list(PROCESSES)
+    for proc in processes:
         try:
             if proc.poll() is None:  # プロセスがまだ実行中
                 logger.info(f"プロセス (PID: {proc.pid}) を停止しています...")
@@ -94,8 +176,22 @@ def cleanup():
 
 # 終了ハンドラを登録
 atexit.register(cleanup)
-signal.signal(signal.SIGINT, lambda sig, frame: sys.exit(0))
-signal.signal(signal.SIGTERM, lambda sig, frame: sys.exit(0))
+
+# 終了シグナル受信時の処理
+def exit_on_signal(sig, frame):
+    """起動処理中に終了シグナルを受け取ったらatexitのクリーンアップを経て終了する"""
+    sys.exit(0)
+
+def stop_on_signal(sig, frame):
+    """待機中に終了シグナルを受け取ったらメインスレッドの待機を解除する"""
+    STOP_EVENT.set()
+
+def install_signal_handlers(handler):
+    """シグナルハンドラを登録（signal.signalはメインスレッドでのみ呼び出せる）"""
+    if threading.current_thread() is not threading.main_thread():
+        return
+    signal.signal(signal.SIGINT, handler)
+    signal.signal(signal.SIGTERM, handler)
 
 # MCPサーバーを起動
 def start_mcp_server():
@@ -114,12 +210,11 @@ def start_mcp_server():
         
         # サーバープロセス起動
         process = subprocess.Popen([sys.executable, server_script], env=env)
-        PROCESSES.append(process)
+        register_process(process)
         
         logger.info(f"MCPサーバーを起動しました (PID: {process.pid})")
         
-        # サーバーの起動を待機
-        time.sleep(5)  # 少し長めに待機
+        # サーバーの準備完了はcheck_server_connectionのポーリングで確認する
         return process
     
     except Exception as e:
@@ -139,18 +234,30 @@ def start_blender_api():
         # APIスクリプト
         api_script = os.path.join(SCRIPT_DIR, "mcp_blender_api.py")
         
+        # 前回の起動完了ファイルを削除
+        if os.path.exists(BLENDER_READY_FILE):
+            os.remove(BLENDER_READY_FILE)
+        env = os.environ.copy()
+        env["BLENDER_READY_FILE"] = BLENDER_READY_FILE
+        
         # Blenderを起動
         process = subprocess.Popen([
             blender_path,
             "--background",
             "--python", api_script
-        ])
-        PROCESSES.append(process)
+        ], env=env)
+        register_process(process)
         
         logger.info(f"Blender APIを起動しました (PID: {process.pid})")
         
-        # 起動を待機
-        time.sleep(3)
+        # 起動完了ファイルが作成されるまで待機
+        if wait_for_file(BLENDER_READY_FILE, BLENDER_STARTUP_TIMEOUT, process=process):
+            logger.info("Blender APIの準備が完了しました")
+        elif process.poll() is not None:
+            logger.error(f"Blender APIが終了しました (コード: {process.returncode})")
+            return None
+        else:
+            logger.warning(f"Blender APIの準備完了を確認できませんでした ({BLENDER_STARTUP_TIMEOUT}秒)")
         return process
     
     except Exception as e:
@@ -167,14 +274,13 @@ def create_mock_assets():
         mock_script = os.path.join(SCRIPT_DIR, "create_mock_assets.py")
         
         # スクリプト実行
-        process = subprocess.Popen([sys.executable, mock_script])
-        process.wait()
+        returncode = run_and_stream([sys.executable, mock_script])
         
-        if process.returncode == 0:
+        if returncode == 0:
             logger.info("モックアセットの作成が完了しました")
             return True
         else:
-            logger.error(f"モックアセット作成エラー (コード: {process.returncode})")
+            logger.error(f"モックアセット作成エラー (コード: {returncode})")
             return False
     
     except Exception as e:
@@ -182,7 +288,7 @@ def create_mock_assets():
         return False
 
 # サーバー接続をチェック
-def check_server_connection(max_retries=15, retry_interval=2):
+def check_server_connection(max_retries=150, retry_interval=0.2):
     """MCPサーバーへの接続を確認"""
     logger.info("MCPサーバーへの接続を確認しています...")
     
@@ -201,7 +307,7 @@ def check_server_connection(max_retries=15, retry_interval=2):
             endpoints = ["/api/status", "/status"]
             for endpoint in endpoints:
                 try:
-                    response = requests.get(f"{server_url}{endpoint}", timeout=2)
+                    response = HTTP_SESSION.get(f"{server_url}{endpoint}", timeout=HTTP_TIMEOUT)
                     if response.status_code == 200:
                         data = response.json()
                         if data.get("status") == "running":
@@ -218,6 +324,70 @@ def check_server_connection(max_retries=15, retry_interval=2):
     logger.error(f"MCPサーバーに接続できませんでした: {server_url}")
     return False
 
+# ファイルを高速にコピー
+def fast_copy(src, dst):
+    """
+    ファイルをコピー（ハードリンク → APFSクローン → 通常コピーの順に試行）
+    
+    コピー先の方が新しい場合はスキップし、コピーしたかどうかを返す
+    """
+    if os.path.exists(dst):
+        if os.stat(dst).st_mtime >= os.stat(src).st_mtime:
+            return False
+        os.remove(dst)
+    
+    # 同一ファイルシステムならハードリンク（データのコピーなし）
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        pass
+    
+    # macOS (APFS) ではクローンを試す
+    if sys.platform == "darwin":
+        result = subprocess.run(["cp", "-c", "-p", src, dst], capture_output=True)
+        if result.returncode == 0:
+            return True
+    
+    shutil.copy2(src, dst)
+    return True
+
+def _collect_copy_jobs(src_dir, dst_dir, jobs):
+    """os.scandirでツリーを走査し、コピー先ディレクトリを作成してファイルの(コピー元, コピー先)を集める"""
+    os.makedirs(dst_dir, exist_ok=True)
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            dst_path = os.path.join(dst_dir, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _collect_copy_jobs(entry.path, dst_path, jobs)
+            else:
+                jobs.append((entry.path, dst_path))
+    return jobs
+
+def copy_tree_fast(src_dir, dst_dir, max_workers=8):
+    """ディレクトリツリーをfast_copyで並行コピーし、コピーしたファイル数を返す"""
+    jobs = _collect_copy_jobs(src_dir, dst_dir, [])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(lambda job: fast_copy(*job), jobs))
+
+def _manifest_entries(root, rel_dir=""):
+    """ツリー内の全ファイルの(相対パス, サイズ, 更新時刻)を列挙する"""
+    with os.scandir(os.path.join(root, rel_dir)) as it:
+        for entry in it:
+            rel_path = os.path.join(rel_dir, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                yield from _manifest_entries(root, rel_path)
+            else:
+                stat = entry.stat()
+                yield rel_path, stat.st_size, stat.st_mtime_ns
+
+def _plugin_manifest(root):
+    """プラグインソースツリーの内容を表すハッシュを計算する"""
+    digest = hashlib.blake2b(digest_size=16)
+    for rel_path, size, mtime in sorted(_manifest_entries(root)):
+        digest.update(f"{rel_path}\0{size}\0{mtime}\n".encode("utf-8"))
+    return digest.hexdigest()
+
 # UE5プラグインをインストール
 def install_ue5_plugin():
     """UE5プロジェクトにMCPプラグインをインストール"""
@@ -242,20 +412,30 @@ def install_ue5_plugin():
         # プラグインソースディレクトリ
         plugin_src_dir = os.path.join(SCRIPT_DIR, "ue5_plugin")
         
+        # ソースツリーが前回のインストールから変わっていなければスキップ
+        src_hash = _plugin_manifest(plugin_src_dir)
+        manifest_path = os.path.join(plugin_dest_dir, PLUGIN_MANIFEST_NAME)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                if f.read().strip() == src_hash:
+                    logger.info(f"UE5プラグインは最新です: {plugin_dest_dir}")
+                    return True
+        except FileNotFoundError:
+            pass
+        
         # ディレクトリが存在しない場合は作成
         os.makedirs(plugin_dest_dir, exist_ok=True)
         
-        # プラグインファイルをコピー
-        for item in os.listdir(plugin_src_dir):
-            src_item = os.path.join(plugin_src_dir, item)
-            dst_item = os.path.join(plugin_dest_dir, item)
-            
-            if os.path.isdir(src_item):
-                shutil.copytree(src_item, dst_item, dirs_exist_ok=True)
-            else:
-                shutil.copy2(src_item, dst_item)
+        # プラグインファイルをコピー（変更のないファイルはスキップ）
+        copied = copy_tree_fast(plugin_src_dir, plugin_dest_dir)
+        
+        # マニフェストをアトミックに更新
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(src_hash)
+        os.replace(tmp_path, manifest_path)
         
-        logger.info(f"UE5プラグインをインストールしました: {plugin_dest_dir}")
+        logger.info(f"UE5プラグインをインストールしました: {plugin_dest_dir} (更新ファイル数: {copied})")
         return True
     
     except Exception as e:
@@ -286,12 +466,17 @@ def start_ue5_editor():
         
         # UE5を起動
         process = subprocess.Popen([ue5_path, project_path])
-        PROCESSES.append(process)
+        register_process(process)
         
         logger.info(f"Unreal Engineを起動しました (PID: {process.pid})")
         
-        # UE5の起動を待機
-        time.sleep(10)
+        # UE5プラグインのポートが応答するまで待機
+        logger.info("UE5エディタの起動を待機しています...")
+        ue5_port = settings.get("unreal", {}).get("port", os.getenv("UE5_MCP_PORT", "9082"))
+        if wait_for_port("127.0.0.1", ue5_port, UE5_STARTUP_TIMEOUT, process=process):
+            logger.info("UE5エディタの準備が完了しました")
+        else:
+            logger.warning(f"UE5エディタの準備完了を確認できませんでした (ポート: {ue5_port})")
         return process
     
     except Exception as e:
@@ -313,14 +498,13 @@ def create_treasure_game():
             env["MOCK_MODE"] = "true"
         
         # スクリプト実行
-        process = subprocess.Popen([sys.executable, game_script], env=env)
-        process.wait()
+        returncode = run_and_stream([sys.executable, game_script], env=env)
         
-        if process.returncode == 0:
+        if returncode == 0:
             logger.info("トレジャーハントゲームの作成が完了しました！")
             return True
         else:
-            logger.error(f"ゲーム作成エラー (コード: {process.returncode})")
+            logger.error(f"ゲーム作成エラー (コード: {returncode})")
             return False
     
     except Exception as e:
@@ -330,6 +514,7 @@ def create_treasure_game():
 # メイン関数
 def main():
     """メイン実行関数"""
+    install_signal_handlers(exit_on_signal)
     logger.info("===== UE5自動ゲーム開発を開始します =====")
     if MOCK_MODE:
         logger.info("モックモードで実行中 - UE5は実際には起動せず、挙動をシミュレートします")
@@ -344,47 +529,52 @@ def main():
     # サーバーのプロセスチェック
     existing_mcp_server = False
     try:
-        response = requests.get("http://127.0.0.1:8080/api/status", timeout=1)
+        response = HTTP_SESSION.get("http://127.0.0.1:8080/api/status", timeout=HTTP_TIMEOUT)
         if response.status_code == 200:
             logger.info("既に実行中のMCPサーバーが見つかりました")
             existing_mcp_server = True
     except:
         pass
     
-    # MCPサーバーを起動（既に起動していない場合）
-    server_process = None
-    if not existing_mcp_server:
-        server_process = start_mcp_server()
-        if not server_process:
-            logger.error("MCPサーバーの起動に失敗しました。終了します。")
-            sys.exit(1)
+    # MCPサーバー起動・Blender API起動・プラグインインストールは互いに独立しているため並行して実行
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # MCPサーバーを起動（既に起動していない場合）
+        future_mcp = None if existing_mcp_server else executor.submit(start_mcp_server)
+        # Blender APIをバックグラウンドで起動
+        future_blender = executor.submit(start_blender_api)
+        # UE5プラグインをインストール
+        future_plugin = executor.submit(install_ue5_plugin)
+        
+        startup_error = None
+        if future_mcp is not None and not future_mcp.result():
+            startup_error = "MCPサーバーの起動に失敗しました。終了します。"
+        # サーバー接続を確認
+        elif not check_server_connection():
+            startup_error = "MCPサーバーに接続できません。終了します。"
+        
+        if startup_error:
+            # 他の起動処理の準備完了待ちを打ち切り、未開始の処理は取り消す
+            STOP_EVENT.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            if not future_blender.result():
+                logger.warning("Blender APIの起動に失敗しました。代わりにモックアセットを使用します。")
+                # モックアセットを作成
+                create_mock_assets()
+            
+            # UE5エディタの起動前にプラグインのインストール完了を待つ
+            if not future_plugin.result():
+                logger.warning("UE5プラグインのインストールに失敗しました。一部の機能が制限される可能性があります。")
     
-    # サーバー接続を確認
-    if not check_server_connection():
-        logger.error("MCPサーバーに接続できません。終了します。")
+    if startup_error:
+        logger.error(startup_error)
         sys.exit(1)
     
-    # Blender APIをバックグラウンドで起動
-    blender_process = start_blender_api()
-    if not blender_process:
-        logger.warning("Blender APIの起動に失敗しました。代わりにモックアセットを使用します。")
-        # モックアセットを作成
-        create_mock_assets()
-    
-    # UE5プラグインをインストール
-    if not install_ue5_plugin():
-        logger.warning("UE5プラグインのインストールに失敗しました。一部の機能が制限される可能性があります。")
-    
     # UE5エディタを起動
     ue5_process = start_ue5_editor()
     if not ue5_process and not MOCK_MODE:
         logger.error("UE5エディタの起動に失敗しました。ゲーム作成を続行しますが、結果を視覚的に確認できません。")
     
-    # UE5エディタの起動を待機（モックモードでなければ）
-    if not MOCK_MODE:
-        logger.info("UE5エディタの起動を待機しています...")
-        time.sleep(15)
-    
     # トレジャーゲームを作成
     if create_treasure_game():
         logger.info("===== ゲームの作成が完了しました =====")
@@ -394,11 +584,10 @@ def main():
             logger.info("UE5エディタが実行中です。ゲームを確認してください。")
         logger.info("終了するには Ctrl+C を押してください。")
         
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("ユーザーによる終了操作を検出しました。プロセスを終了します。")
+        # シグナルを受け取るまでカーネル内で待機
+        install_signal_handlers(stop_on_signal)
+        STOP_EVENT.wait()
+        logger.info("ユーザーによる終了操作を検出しました。プロセスを終了します。")
     else:
         logger.error("ゲームの作成に失敗しました。")
         sys.exit(1)
@@ -12,97 +12,196 @@ Blenderゲームオブジェクト作成スクリプト
 1. Blenderを起動
 2. スクリプトエディタでこのファイルを開く
 3. 実行ボタンを押すか、Alt+Pでスクリプトを実行
+
+コマンドラインから1つのアセットだけを作成する場合:
+  blender --background --python blender_direct_script.py -- --asset chest
 """
 
 import bpy
+import bmesh
 import os
 import math
 import sys
+import argparse
+from contextlib import contextmanager
+
+# Blenderスクリプト共通処理（Blenderの--pythonやテキストエディタから実行した場合も、このファイルと同じディレクトリから読み込む）
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.append(_SCRIPT_DIR)
+from blender_utils import MATERIAL_CACHE, get_template, set_bsdf_inputs, cached_material, deferred_updates
 
 # エクスポートディレクトリの設定
 EXPORT_DIR = "./exports"
 os.makedirs(EXPORT_DIR, exist_ok=True)
 
+# よく使う角度（ラジアン）
+_RAD60 = math.radians(60)
+_RAD90 = math.radians(90)
+
 def clear_scene():
     """
     シーンをクリアする
     """
-    # 既存のオブジェクトを削除
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    # オペレーターを使わずにデータブロックを一括削除する（アンドゥ登録も一時的に無効化）
+    edit_prefs = bpy.context.preferences.edit
+    use_global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+    try:
+        # 既存のオブジェクトを削除
+        bpy.data.batch_remove(list(bpy.data.objects))
+        
+        # オブジェクトを失ったメッシュ・コレクション・マテリアルをクリア
+        bpy.data.batch_remove([mesh for mesh in bpy.data.meshes if mesh.users == 0])
+        bpy.data.batch_remove(list(bpy.data.collections))
+        bpy.data.batch_remove(list(bpy.data.materials))
+    finally:
+        edit_prefs.use_global_undo = use_global_undo
+
+def create_material(name, inputs):
+    """
+    テンプレートを複製してマテリアルを作成する（同じ名前と入力値のマテリアルは再利用する）
     
-    # コレクションをクリア
-    for collection in bpy.data.collections:
-        bpy.data.collections.remove(collection)
+    引数:
+        name (str): マテリアル名
+        inputs (dict): Principled BSDFの入力名と値
+    """
+    key = (name, tuple(sorted(inputs.items())))
+    material = cached_material(key)
+    if material is not None:
+        return material
     
-    # マテリアルをクリア
-    for material in bpy.data.materials:
-        bpy.data.materials.remove(material)
+    material = get_template().copy()
+    material.name = name
+    bsdf = material.node_tree.nodes.get('Principled BSDF')
+    if bsdf:
+        set_bsdf_inputs(bsdf, inputs)
+    MATERIAL_CACHE[key] = material
+    return material
 
-def create_treasure_chest():
+def add_cube(bm, size=1.0):
     """
-    宝箱を作成する
+    bmeshに立方体を追加する（primitive_cube_addと同じ形状）
     """
-    # 新しいコレクションを作成
-    chest_collection = bpy.data.collections.new("TreasureChest")
-    bpy.context.scene.collection.children.link(chest_collection)
-    
-    # 箱の本体を作成
-    bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0.5))
-    chest_base = bpy.context.active_object
-    chest_base.name = "ChestBase"
-    chest_base.scale = (1.0, 0.7, 0.5)
-    chest_collection.objects.link(chest_base)
-    bpy.context.scene.collection.objects.unlink(chest_base)
-    
-    # 箱の蓋を作成
-    bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 1.0))
-    chest_lid = bpy.context.active_object
-    chest_lid.name = "ChestLid"
-    chest_lid.scale = (1.0, 0.7, 0.1)
-    # 蓋の回転軸を設定
-    chest_lid.location.z = 0.8
-    chest_lid.location.y = -0.7 * 0.5
-    chest_collection.objects.link(chest_lid)
-    bpy.context.scene.collection.objects.unlink(chest_lid)
+    bmesh.ops.create_cube(bm, size=size, calc_uvs=True)
+
+def add_cylinder(bm, radius, depth, segments=32):
+    """
+    bmeshに円柱を追加する（primitive_cylinder_addと同じ形状）
+    """
+    bmesh.ops.create_cone(
+        bm,
+        cap_ends=True,
+        cap_tris=False,
+        segments=segments,
+        radius1=radius,
+        radius2=radius,
+        depth=depth,
+        calc_uvs=True
+    )
+
+def add_circle(bm, radius, segments=32):
+    """
+    bmeshに塗りつぶした円を追加する（primitive_circle_add(fill_type='NGON')と同じ形状）
+    """
+    bmesh.ops.create_circle(bm, cap_ends=True, cap_tris=False, segments=segments, radius=radius, calc_uvs=True)
+
+def add_modifier(obj, name, modifier_type, **settings):
+    """
+    モディファイアを追加して設定をまとめて適用する
     
-    # 宝箱用マテリアルを作成
-    wood_material = bpy.data.materials.new(name="WoodMaterial")
-    wood_material.use_nodes = True
-    bsdf = wood_material.node_tree.nodes.get('Principled BSDF')
-    if bsdf:
-        bsdf.inputs['Base Color'].default_value = (0.6, 0.3, 0.1, 1.0)
-        bsdf.inputs['Metallic'].default_value = 0.0
-        bsdf.inputs['Roughness'].default_value = 0.7
+    モディファイアはここでは評価されず、エクスポート前のbake_modifiersで
+    オブジェクトごとに1度だけ評価される
     
-    # 金属部分用マテリアルを作成
-    metal_material = bpy.data.materials.new(name="MetalMaterial")
-    metal_material.use_nodes = True
-    bsdf = metal_material.node_tree.nodes.get('Principled BSDF')
-    if bsdf:
-        bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.2, 1.0)
-        bsdf.inputs['Metallic'].default_value = 1.0
-        bsdf.inputs['Roughness'].default_value = 0.2
+    引数:
+        obj (bpy.types.Object): 対象オブジェクト
+        name (str): モディファイア名
+        modifier_type (str): モディファイアの種類
+        **settings: モディファイアのプロパティと値
+    """
+    modifier = obj.modifiers.new(name=name, type=modifier_type)
+    for key, value in settings.items():
+        setattr(modifier, key, value)
+    return modifier
+
+def create_mesh_object(name, collection, build, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+    """
+    bmeshでメッシュを構築し、コレクションに直接リンクしたオブジェクトを作成する
     
-    # マテリアルを適用
-    chest_base.data.materials.append(wood_material)
-    chest_lid.data.materials.append(wood_material)
+    bpy.opsを使わないため、プリミティブごとのコンテキスト更新・アンドゥ登録が発生せず、
+    シーンコレクションへのリンク・解除も不要になる
     
-    # 装飾を追加（金属部分）
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.1, depth=0.8, location=(0, 0, 0.5))
-    lock = bpy.context.active_object
-    lock.name = "ChestLock"
-    lock.rotation_euler[0] = math.radians(90)
-    lock.location = (0, -0.35, 0.8)
-    lock.data.materials.append(metal_material)
-    chest_collection.objects.link(lock)
-    bpy.context.scene.collection.objects.unlink(lock)
+    引数:
+        name (str): オブジェクト名
+        collection (bpy.types.Collection): リンク先のコレクション
+        build (callable): bmeshを受け取って形状を追加する関数
+        location (tuple): 位置
+        rotation (tuple): 回転（オイラー角、ラジアン）
+        scale (tuple): スケール
+    """
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    build(bm)
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
     
-    # エッジを出すためのモディファイアを追加
-    for obj in [chest_base, chest_lid]:
-        bevel = obj.modifiers.new(name="Bevel", type='BEVEL')
-        bevel.width = 0.02
-        bevel.segments = 3
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
+    obj.scale = scale
+    collection.objects.link(obj)
+    return obj
+
+def create_treasure_chest():
+    """
+    宝箱を作成する
+    """
+    with deferred_updates():
+        # 新しいコレクションを作成
+        chest_collection = bpy.data.collections.new("TreasureChest")
+        bpy.context.scene.collection.children.link(chest_collection)
+        
+        # 箱の本体を作成
+        chest_base = create_mesh_object(
+            "ChestBase", chest_collection, lambda bm: add_cube(bm, 1.0),
+            location=(0, 0, 0.5), scale=(1.0, 0.7, 0.5)
+        )
+        
+        # 箱の蓋を作成（蓋の回転軸に合わせて配置）
+        chest_lid = create_mesh_object(
+            "ChestLid", chest_collection, lambda bm: add_cube(bm, 1.0),
+            location=(0, -0.7 * 0.5, 0.8), scale=(1.0, 0.7, 0.1)
+        )
+        
+        # 宝箱用マテリアルを作成
+        wood_material = create_material("WoodMaterial", {
+            "Base Color": (0.6, 0.3, 0.1, 1.0),
+            "Metallic": 0.0,
+            "Roughness": 0.7
+        })
+        
+        # 金属部分用マテリアルを作成
+        metal_material = create_material("MetalMaterial", {
+            "Base Color": (0.8, 0.8, 0.2, 1.0),
+            "Metallic": 1.0,
+            "Roughness": 0.2
+        })
+        
+        # マテリアルを適用
+        chest_base.data.materials.append(wood_material)
+        chest_lid.data.materials.append(wood_material)
+        
+        # 装飾を追加（金属部分）
+        lock = create_mesh_object(
+            "ChestLock", chest_collection, lambda bm: add_cylinder(bm, 0.1, 0.8),
+            location=(0, -0.35, 0.8), rotation=(_RAD90, 0, 0)
+        )
+        lock.data.materials.append(metal_material)
+        
+        # エッジを出すためのモディファイアを追加
+        for obj in [chest_base, chest_lid]:
+            add_modifier(obj, "Bevel", 'BEVEL', width=0.02, segments=3)
     
     return [chest_base, chest_lid, lock]
 
@@ -110,64 +209,56 @@ def create_potion_bottle():
     """
     ポーション瓶を作成する
     """
-    # 新しいコレクションを作成
-    potion_collection = bpy.data.collections.new("PotionBottle")
-    bpy.context.scene.collection.children.link(potion_collection)
-    
-    # 瓶の本体を作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=0.4, location=(0, 0, 0.2))
-    bottle = bpy.context.active_object
-    bottle.name = "PotionBottle"
-    potion_collection.objects.link(bottle)
-    bpy.context.scene.collection.objects.unlink(bottle)
-    
-    # 瓶の首部分を作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.07, depth=0.15, location=(0, 0, 0.475))
-    neck = bpy.context.active_object
-    neck.name = "BottleNeck"
-    potion_collection.objects.link(neck)
-    bpy.context.scene.collection.objects.unlink(neck)
-    
-    # 栓を作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.08, depth=0.05, location=(0, 0, 0.575))
-    cork = bpy.context.active_object
-    cork.name = "BottleCork"
-    potion_collection.objects.link(cork)
-    bpy.context.scene.collection.objects.unlink(cork)
-    
-    # ガラス用マテリアルを作成
-    glass_material = bpy.data.materials.new(name="GlassMaterial")
-    glass_material.use_nodes = True
-    bsdf = glass_material.node_tree.nodes.get('Principled BSDF')
-    if bsdf:
-        bsdf.inputs['Base Color'].default_value = (0.1, 0.5, 0.8, 0.7)  # 青いポーション
-        bsdf.inputs['Metallic'].default_value = 0.0
-        bsdf.inputs['Roughness'].default_value = 0.1
-        bsdf.inputs['Transmission'].default_value = 0.8  # 透明度
+    with deferred_updates():
+        # 新しいコレクションを作成
+        potion_collection = bpy.data.collections.new("PotionBottle")
+        bpy.context.scene.collection.children.link(potion_collection)
         
-    # コルク用マテリアルを作成
-    cork_material = bpy.data.materials.new(name="CorkMaterial")
-    cork_material.use_nodes = True
-    bsdf = cork_material.node_tree.nodes.get('Principled BSDF')
-    if bsdf:
-        bsdf.inputs['Base Color'].default_value = (0.8, 0.5, 0.2, 1.0)
-        bsdf.inputs['Metallic'].default_value = 0.0
-        bsdf.inputs['Roughness'].default_value = 0.9
-    
-    # マテリアルを適用
-    bottle.data.materials.append(glass_material)
-    neck.data.materials.append(glass_material)
-    cork.data.materials.append(cork_material)
-    
-    # エッジを滑らかにする
-    for obj in [bottle, neck, cork]:
-        obj.data.use_auto_smooth = True
-        obj.data.auto_smooth_angle = math.radians(60)
+        # 瓶の本体を作成
+        bottle = create_mesh_object(
+            "PotionBottle", potion_collection, lambda bm: add_cylinder(bm, 0.15, 0.4),
+            location=(0, 0, 0.2)
+        )
+        
+        # 瓶の首部分を作成
+        neck = create_mesh_object(
+            "BottleNeck", potion_collection, lambda bm: add_cylinder(bm, 0.07, 0.15),
+            location=(0, 0, 0.475)
+        )
+        
+        # 栓を作成
+        cork = create_mesh_object(
+            "BottleCork", potion_collection, lambda bm: add_cylinder(bm, 0.08, 0.05),
+            location=(0, 0, 0.575)
+        )
         
-        # サブディビジョンモディファイアを追加
-        subsurf = obj.modifiers.new(name="Subsurf", type='SUBSURF')
-        subsurf.levels = 2
-        subsurf.render_levels = 2
+        # ガラス用マテリアルを作成
+        glass_material = create_material("GlassMaterial", {
+            "Base Color": (0.1, 0.5, 0.8, 0.7),  # 青いポーション
+            "Metallic": 0.0,
+            "Roughness": 0.1,
+            "Transmission": 0.8  # 透明度
+        })
+            
+        # コルク用マテリアルを作成
+        cork_material = create_material("CorkMaterial", {
+            "Base Color": (0.8, 0.5, 0.2, 1.0),
+            "Metallic": 0.0,
+            "Roughness": 0.9
+        })
+        
+        # マテリアルを適用
+        bottle.data.materials.append(glass_material)
+        neck.data.materials.append(glass_material)
+        cork.data.materials.append(cork_material)
+        
+        # エッジを滑らかにする
+        for obj in [bottle, neck, cork]:
+            obj.data.use_auto_smooth = True
+            obj.data.auto_smooth_angle = _RAD60
+            
+            # サブディビジョンモディファイアを追加
+            add_modifier(obj, "Subsurf", 'SUBSURF', levels=2, render_levels=2)
     
     return [bottle, neck, cork]
 
@@ -175,49 +266,81 @@ def create_game_coin():
     """
     ゲーム用コインを作成する
     """
-    # 新しいコレクションを作成
-    coin_collection = bpy.data.collections.new("GameCoin")
-    bpy.context.scene.collection.children.link(coin_collection)
-    
-    # コインを作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.3, depth=0.05, location=(0, 0, 0.025))
-    coin = bpy.context.active_object
-    coin.name = "Coin"
-    coin_collection.objects.link(coin)
-    bpy.context.scene.collection.objects.unlink(coin)
-    
-    # コインの装飾を作成
-    bpy.ops.mesh.primitive_circle_add(radius=0.2, fill_type='NGON', location=(0, 0, 0.051))
-    coin_deco = bpy.context.active_object
-    coin_deco.name = "CoinDecoration"
-    coin_collection.objects.link(coin_deco)
-    bpy.context.scene.collection.objects.unlink(coin_deco)
+    with deferred_updates():
+        # 新しいコレクションを作成
+        coin_collection = bpy.data.collections.new("GameCoin")
+        bpy.context.scene.collection.children.link(coin_collection)
+        
+        # コインを作成
+        coin = create_mesh_object(
+            "Coin", coin_collection, lambda bm: add_cylinder(bm, 0.3, 0.05),
+            location=(0, 0, 0.025)
+        )
+        
+        # コインの装飾を作成
+        coin_deco = create_mesh_object(
+            "CoinDecoration", coin_collection, lambda bm: add_circle(bm, 0.2),
+            location=(0, 0, 0.051)
+        )
+        
+        # 金属用マテリアルを作成
+        gold_material = create_material("GoldMaterial", {
+            "Base Color": (1.0, 0.8, 0.0, 1.0),
+            "Metallic": 1.0,
+            "Roughness": 0.1,
+            "Specular": 0.9
+        })
+        
+        # マテリアルを適用
+        coin.data.materials.append(gold_material)
+        coin_deco.data.materials.append(gold_material)
+        
+        # エッジを滑らかにする
+        for obj in [coin, coin_deco]:
+            obj.data.use_auto_smooth = True
+            obj.data.auto_smooth_angle = _RAD60
+            
+            # ベベルモディファイアを追加
+            add_modifier(obj, "Bevel", 'BEVEL', width=0.02, segments=3)
     
-    # 金属用マテリアルを作成
-    gold_material = bpy.data.materials.new(name="GoldMaterial")
-    gold_material.use_nodes = True
-    bsdf = gold_material.node_tree.nodes.get('Principled BSDF')
-    if bsdf:
-        bsdf.inputs['Base Color'].default_value = (1.0, 0.8, 0.0, 1.0)
-        bsdf.inputs['Metallic'].default_value = 1.0
-        bsdf.inputs['Roughness'].default_value = 0.1
-        bsdf.inputs['Specular'].default_value = 0.9
+    return [coin, coin_deco]
+
+def bake_modifiers(objects):
+    """
+    モディファイアを適用済みのメッシュに置き換える
     
-    # マテリアルを適用
-    coin.data.materials.append(gold_material)
-    coin_deco.data.materials.append(gold_material)
+    作成後に形状が変わらないオブジェクトのモディファイアを1度だけ評価しておき、
+    エクスポーターがモディファイアスタックを再評価しなくて済むようにする
     
-    # エッジを滑らかにする
-    for obj in [coin, coin_deco]:
-        obj.data.use_auto_smooth = True
-        obj.data.auto_smooth_angle = math.radians(60)
-        
-        # ベベルモディファイアを追加
-        bevel = obj.modifiers.new(name="Bevel", type='BEVEL')
-        bevel.width = 0.02
-        bevel.segments = 3
+    引数:
+        objects (list): 対象オブジェクトリスト
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for obj in objects:
+        if obj.type != 'MESH' or not obj.modifiers:
+            continue
+        old_mesh = obj.data
+        new_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        obj.modifiers.clear()
+        obj.data = new_mesh
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+@contextmanager
+def active_collection(collection):
+    """
+    指定コレクションを一時的にアクティブなコレクションにする
     
-    return [coin, coin_deco]
+    引数:
+        collection (bpy.types.Collection): アクティブにするコレクション
+    """
+    view_layer = bpy.context.view_layer
+    previous = view_layer.active_layer_collection
+    view_layer.active_layer_collection = view_layer.layer_collection.children[collection.name]
+    try:
+        yield
+    finally:
+        view_layer.active_layer_collection = previous
 
 def export_objects(name, objects, export_format="fbx"):
     """
@@ -225,42 +348,73 @@ def export_objects(name, objects, export_format="fbx"):
     
     引数:
         name (str): エクスポートファイル名
-        objects (list): エクスポートするオブジェクトリスト
+        objects (list): エクスポートするオブジェクトリスト（同じコレクションに属すること）
         export_format (str): エクスポート形式
     """
-    # 現在選択を解除
-    bpy.ops.object.select_all(action='DESELECT')
-    
-    # 指定オブジェクトを選択
-    for obj in objects:
-        obj.select_set(True)
+    # モディファイアを事前に適用
+    bake_modifiers(objects)
     
     # エクスポートパスを設定
     export_path = os.path.join(EXPORT_DIR, f"{name}.{export_format.lower()}")
     
-    # エクスポート
+    # 書き込み途中のファイルを監視側に読まれないよう、一時ファイルに書き出してから置き換える
+    root, ext = os.path.splitext(export_path)
+    tmp_path = f"{root}.part{ext}"
+    
+    # エクスポート（オブジェクトが属するコレクション単位で実行するため選択操作は不要）
     if export_format.lower() == "fbx":
-        bpy.ops.export_scene.fbx(
-            filepath=export_path,
-            use_selection=True,
-            global_scale=1.0,
-            apply_unit_scale=True,
-            apply_scale_options='FBX_SCALE_NONE',
-            bake_space_transform=False,
-            object_types={'MESH', 'ARMATURE'},
-            use_mesh_modifiers=True,
-            mesh_smooth_type='OFF',
-            use_mesh_edges=False,
-            path_mode='AUTO'
-        )
+        with active_collection(objects[0].users_collection[0]):
+            bpy.ops.export_scene.fbx(
+                filepath=tmp_path,
+                use_selection=False,
+                use_active_collection=True,
+                global_scale=1.0,
+                apply_unit_scale=True,
+                apply_scale_options='FBX_SCALE_NONE',
+                bake_space_transform=False,
+                object_types={'MESH', 'ARMATURE'},
+                use_mesh_modifiers=False,
+                mesh_smooth_type='OFF',
+                use_mesh_edges=False,
+                use_custom_props=False,
+                add_leaf_bones=False,
+                bake_anim=False,
+                path_mode='STRIP'  # テクスチャを使用しないためパス解決を省略
+            )
+        os.replace(tmp_path, export_path)
     
     print(f"{name}を{export_path}にエクスポートしました")
     return export_path
 
-def main():
+# アセット名 -> (エクスポート名, 作成関数, 表示名)
+ASSETS = {
+    "chest": ("TreasureChest", create_treasure_chest, "宝箱"),
+    "potion": ("PotionBottle", create_potion_bottle, "ポーション瓶"),
+    "coin": ("GameCoin", create_game_coin, "ゲームコイン"),
+}
+
+def parse_args():
+    """
+    コマンドライン引数を解析する（Blenderの引数と区別するため「--」以降のみを対象にする）
+    
+    戻り値:
+        argparse.Namespace: 解析結果
+    """
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Blenderゲームオブジェクト作成スクリプト")
+    parser.add_argument("--asset", choices=list(ASSETS), help="作成するアセット（省略時はすべて作成）")
+    return parser.parse_args(argv)
+
+def main(assets=None):
     """
     メイン関数
+    
+    引数:
+        assets (list): 作成するアセット名のリスト（省略時はすべて作成）
     """
+    if assets is None:
+        assets = list(ASSETS)
+    
     try:
         # 開始メッセージ
         print("======================================")
@@ -270,27 +424,19 @@ def main():
         # シーンをクリア
         clear_scene()
         
-        # 宝箱を作成
-        print("\n1. 宝箱を作成しています...")
-        chest_objects = create_treasure_chest()
-        export_objects("TreasureChest", chest_objects)
-        
-        # シーンをクリア
-        clear_scene()
+        # アセットを1つのシーンにコレクション単位で作成し、それぞれエクスポート
+        created = []
+        for index, asset in enumerate(assets, 1):
+            export_name, create, label = ASSETS[asset]
+            print(f"\n{index}. {label}を作成しています...")
+            created.append((export_name, create()))
         
-        # ポーション瓶を作成
-        print("\n2. ポーション瓶を作成しています...")
-        potion_objects = create_potion_bottle()
-        export_objects("PotionBottle", potion_objects)
+        for export_name, objects in created:
+            export_objects(export_name, objects)
         
         # シーンをクリア
         clear_scene()
         
-        # コインを作成
-        print("\n3. ゲームコインを作成しています...")
-        coin_objects = create_game_coin()
-        export_objects("GameCoin", coin_objects)
-        
         # 完了メッセージ
         print("\n======================================")
         print("すべてのオブジェクトが正常に作成され、エクスポートされました")
@@ -302,4 +448,5 @@ def main():
 
 # Blenderから直接実行された場合のみ実行
 if __name__ == "__main__":
-    main() 
+    args = parse_args()
+    main([args.asset] if args.asset else None)
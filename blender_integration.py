@@ -23,26 +23,59 @@ MCPサーバーと連携してMCPフレームワークを使用できるよう
 """
 
 import bpy
+import bmesh
 import json
 import os
 import sys
-import requests
+import http.client
 import tempfile
 import mathutils
 import time
 import logging
 from pathlib import Path
 
-# ロギングの設定
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+# Blenderスクリプト共通処理（Blenderの--pythonやテキストエディタから実行した場合も、このファイルと同じディレクトリから読み込む）
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.append(_SCRIPT_DIR)
+from blender_utils import MATERIAL_CACHE, get_template, set_bsdf_inputs, cached_material, deferred_updates
+
+# ロギングの設定（ホスト側で既に設定されている場合は上書きしない）
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler()
+        ]
+    )
 logger = logging.getLogger("blender_integration")
 
+# report()の通知レベルとloggingのレベルの対応表
+_REPORT_LEVELS = {
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+}
+
+# requestsは読み込みが重いため、UE5への送信で必要になった時点で読み込む
+requests = None
+
+def _get_requests():
+    """
+    requestsモジュールを遅延読み込みする
+    
+    戻り値:
+        module: requestsモジュール
+    """
+    global requests
+    if requests is None:
+        import requests as _requests
+        requests = _requests
+    return requests
+
+# Blenderのバージョン文字列（実行中に変わらないため1度だけ取得）
+BLENDER_VERSION = bpy.app.version_string
+
 class BlenderMCPIntegration:
     """
     BlenderとMCP連携のためのクラス
@@ -56,20 +89,42 @@ class BlenderMCPIntegration:
             server_host (str): MCPサーバーのホスト
             server_port (int): MCPサーバーのポート
         """
+        self.server_host = server_host
+        self.server_port = server_port
         self.server_url = f"http://{server_host}:{server_port}"
+        
+        # HTTPセッション（初回の送信時に作成し、以降はkeep-aliveで接続を再利用）
+        self._session = None
+        self.request_timeout = (1, 30)  # （接続, 読み込み）タイムアウト（秒）
+        
         self.export_dir = os.path.join(tempfile.gettempdir(), "blender_mcp_exports")
         
         # エクスポートディレクトリが存在しなければ作成
-        if not os.path.exists(self.export_dir):
-            os.makedirs(self.export_dir)
+        os.makedirs(self.export_dir, exist_ok=True)
+        
+        # UE5インポートコマンドの雛形
+        self._import_cmd_template = {"command": "import_asset", "params": {}}
         
-        logger.info(f"MCPサーバーURL: {self.server_url}")
-        logger.info(f"エクスポートディレクトリ: {self.export_dir}")
-        logger.info(f"Blenderバージョン: {bpy.app.version_string}")
+        logger.info("MCPサーバーURL: %s", self.server_url)
+        logger.info("エクスポートディレクトリ: %s", self.export_dir)
+        logger.info("Blenderバージョン: %s", BLENDER_VERSION)
         
         # Blenderの通知UI設定
         self.report_level = {'INFO'}
     
+    @property
+    def session(self):
+        """
+        UE5への送信に使うHTTPセッション（初回アクセス時に作成）
+        """
+        if self._session is None:
+            requests = _get_requests()
+            from requests.adapters import HTTPAdapter
+            self._session = requests.Session()
+            self._session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+            self._session.headers.update({"Connection": "keep-alive"})
+        return self._session
+    
     def connect_to_server(self):
         """
         MCPサーバーへの接続を確認する
@@ -79,10 +134,18 @@ class BlenderMCPIntegration:
         """
         try:
             logger.info("MCPサーバーへの接続を確認しています...")
-            response = requests.get(f"{self.server_url}/status")
+            # ステータス確認は小さなGETのみのため、requestsを読み込まずにhttp.clientで行う
+            conn = http.client.HTTPConnection(self.server_host, self.server_port, timeout=1)
+            try:
+                conn.request("GET", "/status")
+                response = conn.getresponse()
+                status_code = response.status
+                body = response.read()
+            finally:
+                conn.close()
             
-            if response.status_code == 200:
-                status_data = response.json()
+            if status_code == 200:
+                status_data = json.loads(body)
                 server_status = status_data.get("status", "unknown")
                 
                 if server_status == "running":
@@ -90,15 +153,15 @@ class BlenderMCPIntegration:
                     self.report({'INFO'}, "MCPサーバーに正常に接続しました")
                     return True
                 else:
-                    logger.warning(f"MCPサーバーのステータスが異常: {server_status}")
+                    logger.warning("MCPサーバーのステータスが異常: %s", server_status)
                     self.report({'WARNING'}, f"MCPサーバーのステータスが異常: {server_status}")
                     return False
             else:
-                logger.error(f"MCPサーバーへの接続に失敗しました: {response.status_code}")
-                self.report({'ERROR'}, f"MCPサーバーへの接続に失敗しました: {response.status_code}")
+                logger.error("MCPサーバーへの接続に失敗しました: %s", status_code)
+                self.report({'ERROR'}, f"MCPサーバーへの接続に失敗しました: {status_code}")
                 return False
         except Exception as e:
-            logger.exception(f"MCPサーバーへの接続中にエラーが発生しました: {str(e)}")
+            logger.exception("MCPサーバーへの接続中にエラーが発生しました: %s", e)
             self.report({'ERROR'}, f"MCPサーバーへの接続中にエラーが発生しました: {str(e)}")
             return False
     
@@ -110,13 +173,10 @@ class BlenderMCPIntegration:
             level (set): 通知レベル
             message (str): 通知メッセージ
         """
-        level_str = list(level)[0]
-        logger.log(
-            logging.INFO if level_str == 'INFO' else 
-            logging.WARNING if level_str == 'WARNING' else
-            logging.ERROR,
-            f"[{level_str}] {message}"
-        )
+        level_str = next(iter(level))
+        log_level = _REPORT_LEVELS.get(level_str, logging.ERROR)
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, "[%s] %s", level_str, message)
         
         # Blenderのインタラクティブコンソールに出力
         if hasattr(bpy, "ops") and hasattr(bpy.ops, "wm") and hasattr(bpy.ops.wm, "redraw_timer"):
@@ -147,18 +207,21 @@ class BlenderMCPIntegration:
             file_extension = f".{export_format.lower()}"
             export_path = os.path.join(self.export_dir, f"{model_name}{file_extension}")
             
-            # 現在のカーソル位置とモードを記憶
-            original_cursor_location = bpy.context.scene.cursor.location.copy()
-            original_mode = bpy.context.object.mode if bpy.context.object else 'OBJECT'
+            # 書き込み途中のファイルを監視側に読まれないよう、一時ファイルに書き出してから置き換える
+            tmp_path = os.path.join(self.export_dir, f"{model_name}.part{file_extension}")
+            
+            # 現在のモードを記憶（エクスポーターはカーソルを変更しないため、カーソルの退避は不要）
+            original_mode = getattr(bpy.context.object, "mode", 'OBJECT')
+            need_restore = original_mode != 'OBJECT'
             
             # オブジェクトモードに切り替え
-            if bpy.context.object and original_mode != 'OBJECT':
+            if need_restore:
                 bpy.ops.object.mode_set(mode='OBJECT')
             
             # エクスポート処理
             if export_format.lower() == "fbx":
                 bpy.ops.export_scene.fbx(
-                    filepath=export_path,
+                    filepath=tmp_path,
                     use_selection=True,
                     global_scale=1.0,
                     apply_unit_scale=True,
@@ -168,33 +231,36 @@ class BlenderMCPIntegration:
                     use_mesh_modifiers=True,
                     mesh_smooth_type='OFF',
                     use_mesh_edges=False,
-                    path_mode='AUTO'
+                    use_custom_props=False,
+                    add_leaf_bones=False,
+                    bake_anim=False,
+                    path_mode='STRIP'  # テクスチャを使用しないためパス解決を省略
                 )
             elif export_format.lower() == "obj":
                 bpy.ops.export_scene.obj(
-                    filepath=export_path,
+                    filepath=tmp_path,
                     use_selection=True,
                     global_scale=1.0,
                     path_mode='AUTO'
                 )
             elif export_format.lower() == "glb":
                 bpy.ops.export_scene.gltf(
-                    filepath=export_path,
+                    filepath=tmp_path,
                     export_format='GLB',
                     use_selection=True
                 )
             else:
                 self.report({'ERROR'}, f"未サポートのエクスポート形式: {export_format}")
                 return {"status": "error", "message": f"Unsupported export format: {export_format}"}
+            os.replace(tmp_path, export_path)
             
-            # カーソル位置とモードを元に戻す
-            bpy.context.scene.cursor.location = original_cursor_location
-            if bpy.context.object and original_mode != 'OBJECT':
+            # モードを元に戻す
+            if need_restore:
                 bpy.ops.object.mode_set(mode=original_mode)
             
             # エクスポート成功を報告
             self.report({'INFO'}, f"{model_name}を{export_format}形式でエクスポートしました: {export_path}")
-            logger.info(f"モデル'{model_name}'を'{export_path}'にエクスポートしました")
+            logger.info("モデル'%s'を'%s'にエクスポートしました", model_name, export_path)
             
             return {
                 "status": "success",
@@ -206,7 +272,7 @@ class BlenderMCPIntegration:
             }
         
         except Exception as e:
-            logger.exception(f"エクスポート中にエラーが発生しました: {str(e)}")
+            logger.exception("エクスポート中にエラーが発生しました: %s", e)
             self.report({'ERROR'}, f"エクスポート中にエラーが発生しました: {str(e)}")
             return {"status": "error", "message": str(e)}
     
@@ -272,7 +338,7 @@ class BlenderMCPIntegration:
             }
         
         except Exception as e:
-            logger.exception(f"モデル作成中にエラーが発生しました: {str(e)}")
+            logger.exception("モデル作成中にエラーが発生しました: %s", e)
             self.report({'ERROR'}, f"モデル作成中にエラーが発生しました: {str(e)}")
             return {"status": "error", "message": str(e)}
     
@@ -284,49 +350,52 @@ class BlenderMCPIntegration:
             model_name (str): モデル名
             location (tuple): 位置座標
         """
-        # まず刀身（長い直方体）を作成
-        bpy.ops.mesh.primitive_cube_add(size=1.0, location=location)
-        blade = bpy.context.active_object
-        blade.name = f"{model_name}_blade"
-        blade.scale = mathutils.Vector((0.1, 0.1, 1.0))
+        with deferred_updates():
+            # 4つのパーツを1つのbmeshに直接構築する（オブジェクトの結合処理が不要）
+            bm = bmesh.new()
+            bm.loops.layers.uv.new("UVMap")
+        
+            # 刀身（長い直方体）を作成
+            blade = bmesh.ops.create_cube(
+                bm, size=1.0, calc_uvs=True,
+                matrix=mathutils.Matrix.Diagonal((0.1, 0.1, 1.0, 1.0))
+            )
         
-        # 刀の先端を尖らせる（モディファイア適用）
-        bpy.ops.object.modifier_add(type='TAPER')
-        blade.modifiers["Taper"].object = blade
-        blade.modifiers["Taper"].factor = 0.5
+            # 刀の先端を尖らせる（上端の頂点を細くする）
+            for vert in blade["verts"]:
+                if vert.co.z > 0:
+                    vert.co.x *= 0.5
+                    vert.co.y *= 0.5
         
-        # ガード（横棒）を作成
-        bpy.ops.mesh.primitive_cube_add(size=1.0, location=(location[0], location[1], location[2] - 0.8))
-        guard = bpy.context.active_object
-        guard.name = f"{model_name}_guard"
-        guard.scale = mathutils.Vector((0.4, 0.05, 0.05))
+            # ガード（横棒）を作成
+            bmesh.ops.create_cube(
+                bm, size=1.0, calc_uvs=True,
+                matrix=mathutils.Matrix.Translation((0, 0, -0.8)) @ mathutils.Matrix.Diagonal((0.4, 0.05, 0.05, 1.0))
+            )
         
-        # グリップ（柄）を作成
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.05, 
-            depth=0.4, 
-            location=(location[0], location[1], location[2] - 1.0)
-        )
-        grip = bpy.context.active_object
-        grip.name = f"{model_name}_grip"
+            # グリップ（柄）を作成
+            bmesh.ops.create_cone(
+                bm, cap_ends=True, cap_tris=False, segments=32,
+                radius1=0.05, radius2=0.05, depth=0.4, calc_uvs=True,
+                matrix=mathutils.Matrix.Translation((0, 0, -1.0))
+            )
         
-        # ポンメル（柄の先端）を作成
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            radius=0.07, 
-            location=(location[0], location[1], location[2] - 1.2)
-        )
-        pommel = bpy.context.active_object
-        pommel.name = f"{model_name}_pommel"
+            # ポンメル（柄の先端）を作成
+            bmesh.ops.create_uvsphere(
+                bm, u_segments=32, v_segments=16, radius=0.07, calc_uvs=True,
+                matrix=mathutils.Matrix.Translation((0, 0, -1.2))
+            )
         
-        # 全てのパーツを選択
-        blade.select_set(True)
-        guard.select_set(True)
-        grip.select_set(True)
-        pommel.select_set(True)
+            mesh = bpy.data.meshes.new(model_name)
+            bm.to_mesh(mesh)
+            bm.free()
         
-        # 結合
-        bpy.ops.object.join()
-        bpy.context.active_object.name = model_name
+            # オブジェクトを作成してアクティブにする
+            sword = bpy.data.objects.new(model_name, mesh)
+            sword.location = location
+            bpy.context.collection.objects.link(sword)
+            bpy.context.view_layer.objects.active = sword
+            sword.select_set(True)
     
     def apply_material(self, obj_name, material_name, color=(0.8, 0.8, 0.8, 1.0), 
                        metallic=0.0, roughness=0.5, specular=0.5):
@@ -352,21 +421,29 @@ class BlenderMCPIntegration:
             
             obj = bpy.data.objects[obj_name]
             
-            # マテリアルが既に存在するか確認し、なければ作成
-            if material_name not in bpy.data.materials:
-                mat = bpy.data.materials.new(name=material_name)
-                mat.use_nodes = True
-                
-                # ノードの取得
-                bsdf = mat.node_tree.nodes.get('Principled BSDF')
-                if bsdf:
-                    # マテリアルプロパティの設定
-                    bsdf.inputs['Base Color'].default_value = color
-                    bsdf.inputs['Metallic'].default_value = metallic
-                    bsdf.inputs['Roughness'].default_value = roughness
-                    bsdf.inputs['Specular'].default_value = specular
-            else:
-                mat = bpy.data.materials[material_name]
+            # 同じ設定で作成済みのマテリアルがあれば再利用する
+            key = (material_name, tuple(color), metallic, roughness, specular)
+            mat = cached_material(key)
+            
+            if mat is None:
+                # マテリアルが既に存在するか確認し、なければ作成
+                if material_name not in bpy.data.materials:
+                    mat = get_template().copy()
+                    mat.name = material_name
+                    
+                    # ノードの取得
+                    bsdf = mat.node_tree.nodes.get('Principled BSDF')
+                    if bsdf:
+                        # マテリアルプロパティの設定
+                        set_bsdf_inputs(bsdf, {
+                            "Base Color": color,
+                            "Metallic": metallic,
+                            "Roughness": roughness,
+                            "Specular": specular
+                        })
+                else:
+                    mat = bpy.data.materials[material_name]
+                MATERIAL_CACHE[key] = mat
             
             # オブジェクトにマテリアルを割り当て
             if len(obj.data.materials) == 0:
@@ -389,7 +466,7 @@ class BlenderMCPIntegration:
             }
         
         except Exception as e:
-            logger.exception(f"マテリアル適用中にエラーが発生しました: {str(e)}")
+            logger.exception("マテリアル適用中にエラーが発生しました: %s", e)
             self.report({'ERROR'}, f"マテリアル適用中にエラーが発生しました: {str(e)}")
             return {"status": "error", "message": str(e)}
 
@@ -413,29 +490,29 @@ class BlenderMCPIntegration:
             
             export_path = export_result["export_info"]["path"]
             
-            # MCPサーバーを通じてUE5にインポートコマンドを送信
-            response = requests.post(
+            # MCPサーバーを通じてUE5にインポートコマンドを送信（本文は1度だけ組み立てて再利用）
+            body = self._import_cmd_template.copy()
+            body["params"] = {
+                "path": export_path,
+                "destination": f"/Game/Assets/{model_name}"
+            }
+            payload = json.dumps(body, separators=(",", ":")).encode("utf-8")
+            headers = {"Content-Type": "application/json"}
+            
+            response = self.session.post(
                 f"{self.server_url}/unreal/command",
-                json={
-                    "command": "import_asset",
-                    "params": {
-                        "path": export_path,
-                        "destination": f"/Game/Assets/{model_name}"
-                    }
-                }
+                data=payload,
+                headers=headers,
+                timeout=self.request_timeout
             )
             
             # 404エラーが発生した場合は別のエンドポイントを試す
             if response.status_code == 404:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.server_url}/api/unreal/execute",
-                    json={
-                        "command": "import_asset",
-                        "params": {
-                            "path": export_path,
-                            "destination": f"/Game/Assets/{model_name}"
-                        }
-                    }
+                    data=payload,
+                    headers=headers,
+                    timeout=self.request_timeout
                 )
             
             if response.status_code == 200:
@@ -463,7 +540,7 @@ class BlenderMCPIntegration:
                 }
         
         except Exception as e:
-            logger.exception(f"UE5送信中にエラーが発生しました: {str(e)}")
+            logger.exception("UE5送信中にエラーが発生しました: %s", e)
             self.report({'ERROR'}, f"UE5送信中にエラーが発生しました: {str(e)}")
             return {"status": "error", "message": str(e)}
 
@@ -21,26 +21,88 @@ Blenderとの通信を行い、シーン生成、アセット管理、テクス
 import os
 import sys
 import logging
+import logging.handlers
+import queue
+import atexit
 import json
-import requests
-from flask import Flask, request, jsonify, render_template_string
-import yaml
-from dotenv import load_dotenv
+import hashlib
+import copy
+import time
+import threading
+import itertools
+from collections import OrderedDict
+from flask import Flask, Response, request, jsonify, stream_with_context
+from werkzeug.exceptions import HTTPException
 
-# 環境変数のロード
-load_dotenv()
+# 高速なJSONライブラリ（インストールされていない場合は標準のjsonを使用）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# FlaskのJSONプロバイダー（Flask 2.2以降）
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    DefaultJSONProvider = None
+
+# 読み込みに時間がかかるモジュールは、実際に必要になった時点で読み込む
+# （requests: AI生成要求の送信時、yaml: JSONキャッシュのない設定ファイルの解析時）
+requests = None
+yaml = None
+_SafeLoader = None
+
+# 環境変数のロード（BLENDER_MCP_SKIP_DOTENV=1の場合は省略）
+if os.getenv('BLENDER_MCP_SKIP_DOTENV') != '1':
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # ロギングの設定
+# ファイルへの書き込みはリスナースレッドで行い、リクエスト処理のスレッドはキューに追加するだけにする
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler("blender_mcp.log"),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
+# 終了時（sys.exitやCtrl+Cを含む）にキューに残っているログを書き出してからリスナーを停止
+atexit.register(log_listener.stop)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # 書式はリスナー側のハンドラーで適用する
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("blender_mcp.log"),
-        logging.StreamHandler()
+        _queue_handler
     ]
 )
 logger = logging.getLogger("blender_mcp")
 
+# 解析済み設定ファイルのキャッシュ（(絶対パス, 更新時刻) -> 設定情報）
+_CONFIG_CACHE = {}
+
+# コマンドごとの必須パラメータとエラーメッセージ（受信時にまとめて検証する）
+# 必須パラメータはいずれかの組み合わせを満たせばよい
+COMMAND_REQUIRED_PARAMS = {
+    'generate_scene': ((frozenset(['description']),), '説明が指定されていません'),
+    'add_object': ((frozenset(['type']),), 'オブジェクトタイプが指定されていません'),
+    'modify_object': ((frozenset(['name']), frozenset(['objects'])), 'オブジェクト名が指定されていません'),
+    'generate_texture': ((frozenset(['object_name', 'description']),), 'オブジェクト名または説明が指定されていません'),
+    'optimize_asset': ((frozenset(['asset_name']),), 'アセット名が指定されていません'),
+    'export_asset': ((frozenset(['asset_name', 'format']),), 'アセット名またはフォーマットが指定されていません'),
+}
+
+# AI生成結果のキャッシュ設定（件数の上限と有効期限（秒））
+AI_CACHE_SIZE = 256
+AI_CACHE_TTL = 600
+
+# YAMLの解析結果を保存するJSONキャッシュファイルの拡張子
+# （v2: JSONを経由しても内容が変わらない設定だけを保存する。以前の形式のファイルは読み込まない）
+CONFIG_JSON_CACHE_SUFFIX = '.v2.cache.json'
+
 # HTML テンプレート
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -150,6 +212,19 @@ HTML_TEMPLATE = '''
         </pre>
     </div>
     
+    <div class="endpoint">
+        <div><span class="method">POST</span> <span class="url">/api/command/batch</span></div>
+        <div class="description">複数のBlenderコマンドを1回のリクエストでまとめて実行します。</div>
+        <pre>
+{
+  "commands": [
+    {"command": "コマンド名", "params": {}},
+    {"command": "コマンド名", "params": {}}
+  ]
+}
+        </pre>
+    </div>
+    
     <h2>使用可能なコマンド</h2>
     
     <div class="command">
@@ -192,6 +267,17 @@ HTML_TEMPLATE = '''
     "scale": [1, 1, 1], // オプション
     "rotation": [0, 0, 0] // オプション
   }
+}
+        </pre>
+        <div class="description">複数のオブジェクトをまとめて修正する場合</div>
+        <pre>
+{
+  "command": "modify_object",
+  "params": {
+    "objects": [
+      {"name": "オブジェクト名", "location": [1, 2, 3], "scale": [1, 1, 1], "rotation": [0, 0, 0]}
+    ]
+  }
 }
         </pre>
     </div>
@@ -219,7 +305,8 @@ HTML_TEMPLATE = '''
   "params": {
     "asset_name": "アセット名",
     "lod": 1, // オプション: LODレベル
-    "polycount": 5000 // オプション: ポリゴン数の上限
+    "polycount": 5000, // オプション: ポリゴン数の上限
+    "stream": false // オプション: LODごとの結果をJSON配列でストリーミング
   }
 }
         </pre>
@@ -249,6 +336,99 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+def _get_requests():
+    """
+    requestsモジュールを遅延読み込みする
+    
+    戻り値:
+        module: requestsモジュール
+    """
+    global requests
+    if requests is None:
+        import requests as _requests
+        requests = _requests
+    return requests
+
+def _load_yaml(f):
+    """
+    YAMLを解析する（初回呼び出し時にyamlを読み込み、libyamlが利用可能であればC実装のローダーを使用）
+    
+    引数:
+        f (file): YAMLファイル
+        
+    戻り値:
+        dict: 解析結果
+    """
+    global yaml, _SafeLoader
+    if yaml is None:
+        import yaml as _yaml
+        try:
+            _SafeLoader = _yaml.CSafeLoader
+        except AttributeError:
+            _SafeLoader = _yaml.SafeLoader
+        yaml = _yaml
+    return yaml.load(f, Loader=_SafeLoader)
+
+def _json_bytes(obj):
+    """
+    オブジェクトをJSONのバイト列に変換する
+    
+    引数:
+        obj (object): 変換するオブジェクト
+        
+    戻り値:
+        bytes: JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def _json_loads(data):
+    """
+    JSONのバイト列を解析する
+    
+    引数:
+        data (bytes): JSON
+        
+    戻り値:
+        object: 解析結果
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _iter_json_array(items):
+    """
+    要素を1つずつJSONに変換しながら、JSON配列としてバイト列を出力する
+    
+    引数:
+        items (iterable): 配列の要素
+        
+    戻り値:
+        generator: JSON配列のバイト列
+    """
+    yield b'['
+    for index, item in enumerate(items):
+        if index:
+            yield b','
+        yield _json_bytes(item)
+    yield b']'
+
+if orjson is not None and DefaultJSONProvider is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """
+        jsonifyやrequest.jsonでorjsonを使用するJSONプロバイダー
+        """
+        
+        def dumps(self, obj, **kwargs):
+            # orjsonで扱えない型（Decimalなど）はFlask標準の変換処理に任せる
+            return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+else:
+    OrjsonProvider = None
+
 class BlenderMCP:
     """
     Blender-MCPクラス
@@ -265,10 +445,74 @@ class BlenderMCP:
         """
         self.config = self.loadConfig(config_path)
         self.app = Flask(__name__)
+        if OrjsonProvider is not None:
+            self.app.json = OrjsonProvider(self.app)
+        
+        # コマンド名 -> 処理メソッド
+        self._dispatch = {
+            'generate_scene': self.generateScene,
+            'add_object': self.addObject,
+            'modify_object': self.modifyObject,
+            'generate_texture': self.generateTexture,
+            'optimize_asset': self.optimizeAsset,
+            'export_asset': self.exportAsset
+        }
+        
+        # ステータス情報（起動後に変わらないため1度だけ作成）
+        self._status = {
+            'status': 'running',
+            'version': '1.0.0',
+            'blender_version': '3.6.0',  # 実際のBlenderバージョンを取得するコードに置き換え
+            'available_commands': tuple(self._dispatch)
+        }
+        self._status_bytes = _json_bytes(self._status)
+        self._status_etag = hashlib.blake2b(self._status_bytes, digest_size=8).hexdigest()
+        
+        # ホームページのテンプレートはリクエストごとにコンパイルせず、1度だけコンパイルしておく
+        self._home_template = self.app.jinja_env.from_string(HTML_TEMPLATE)
         self.setupRoutes()
         self.mcp_server_url = f"http://{self.config['mcp_server']['host']}:{self.config['mcp_server']['port']}"
+        
+        # MCPサーバーへのHTTPセッション（初回のAI生成要求時に作成）
+        self._session = None
+        
+        # 作成済みのエクスポートディレクトリ（同じディレクトリへのmakedirsを繰り返さない）
+        self._mkdir_cache = set()
+        
+        # 名前が指定されなかったオブジェクトの連番
+        self._obj_seq = itertools.count()
+        
+        # AI生成結果のLRUキャッシュ（(プロンプト, タイプ) -> (有効期限, 結果)）
+        self._ai_cache = OrderedDict()
+        self._ai_cache_lock = threading.Lock()
+        
+        # ホームページの内容は起動後に変わらないため、1度だけ描画して使い回す
+        self._home_html = self._renderHome()
+        self._home_etag = hashlib.blake2b(self._home_html, digest_size=16).hexdigest()
         logger.info("Blender-MCPモジュールが初期化されました")
     
+    @property
+    def _http(self):
+        """
+        MCPサーバーへのHTTPセッション（keep-aliveで接続を再利用）
+        
+        AI生成のPOSTは冪等ではないため、再試行は接続できなかった場合（要求が届いていない場合）に限る
+        """
+        if self._session is None:
+            requests = _get_requests()
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.1)
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+    
     def loadConfig(self, config_path=None):
         """
         設定ファイルを読み込む
@@ -281,11 +525,9 @@ class BlenderMCP:
         """
         try:
             if config_path and os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f)
+                return self._loadConfigFile(config_path)
             elif os.path.exists('blender_mcp_config.yml'):
-                with open('blender_mcp_config.yml', 'r') as f:
-                    return yaml.safe_load(f)
+                return self._loadConfigFile('blender_mcp_config.yml')
             else:
                 logger.warning("設定ファイルが見つかりません。デフォルト設定を使用します。")
                 return {
@@ -306,6 +548,54 @@ class BlenderMCP:
             logger.error(f"設定ファイルの読み込み中にエラーが発生しました: {str(e)}")
             raise
     
+    def _loadConfigFile(self, path):
+        """
+        YAML設定ファイルを読み込む（更新時刻が変わらない限り解析結果を再利用する）
+        
+        YAMLより新しいJSONキャッシュファイルがあればそれを読み込み、
+        なければYAMLを解析してJSONキャッシュファイルを書き出す
+        
+        引数:
+            path (str): 設定ファイルのパス
+            
+        戻り値:
+            dict: 設定情報
+        """
+        path = os.path.abspath(path)
+        mtime = os.path.getmtime(path)
+        key = (path, mtime)
+        if key in _CONFIG_CACHE:
+            return _CONFIG_CACHE[key]
+        
+        json_path = path + CONFIG_JSON_CACHE_SUFFIX
+        config = None
+        try:
+            if os.path.getmtime(json_path) > mtime:
+                with open(json_path, 'r') as f:
+                    config = json.load(f)
+        except (OSError, ValueError):
+            config = None
+        
+        if config is None:
+            with open(path, 'r') as f:
+                config = _load_yaml(f)
+            try:
+                data = json.dumps(config)
+                # JSONを経由すると内容が変わる設定（文字列以外のキーなど）はキャッシュしない
+                if json.loads(data) != config:
+                    raise ValueError("JSONに変換すると内容が変わる値が含まれています")
+                # 一時ファイルに書き込んでから置き換える（同時に起動したプロセスが書きかけのファイルを読まないように）
+                tmp_path = f"{json_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_path, json_path)
+            except (OSError, TypeError, ValueError) as e:
+                # 書き込めない場合やJSONでそのまま表せない値を含む場合はキャッシュしない
+                logger.debug(f"設定ファイルのキャッシュを書き出せませんでした: {str(e)}")
+        
+        _CONFIG_CACHE[key] = config
+        return config
+    
     def setupRoutes(self):
         """
         Flaskルートの設定
@@ -313,6 +603,42 @@ class BlenderMCP:
         self.app.route('/')(self.home)
         self.app.route('/api/status', methods=['GET'])(self.getStatus)
         self.app.route('/api/command', methods=['POST'])(self.executeCommand)
+        self.app.route('/api/command/batch', methods=['POST'])(self.executeBatch)
+        self.app.errorhandler(Exception)(self.handleError)
+    
+    def handleError(self, e):
+        """
+        各エンドポイントで発生した例外をまとめて処理する
+        
+        引数:
+            e (Exception): 発生した例外
+            
+        戻り値:
+            JSON: エラー情報
+        """
+        # 404や不正なJSONなどのHTTPエラーはそのままのステータスコードで返す
+        if isinstance(e, HTTPException):
+            return jsonify({'error': e.description}), e.code
+        logger.exception(f"リクエスト処理中にエラーが発生しました: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+    
+    def _renderHome(self):
+        """
+        ホームページのHTMLを描画する
+        
+        戻り値:
+            bytes: UTF-8でエンコードしたHTML
+        """
+        # サーバー設定を取得
+        mcp_server_host = self.config['mcp_server']['host']
+        mcp_server_port = self.config['mcp_server']['port']
+        ue5_port = self.config.get('ue5_mcp', {}).get('port', 5002)
+        
+        # HTMLテンプレートを描画
+        return self._home_template.render(status=self._status,
+                                          mcp_server_host=mcp_server_host,
+                                          mcp_server_port=mcp_server_port,
+                                          ue5_port=ue5_port).encode('utf-8')
     
     def home(self):
         """
@@ -321,38 +647,13 @@ class BlenderMCP:
         Blender-MCP APIに関する情報を表示します。
         
         戻り値:
-            HTML: APIドキュメントページ
+            HTML: APIドキュメントページ（起動時に描画したもの）
         """
-        try:
-            # ステータス情報を取得
-            status_data = {
-                'status': 'running',
-                'version': '1.0.0',
-                'blender_version': '3.6.0',  # 実際のBlenderバージョンを取得するコードに置き換え
-                'available_commands': [
-                    'generate_scene',
-                    'add_object',
-                    'modify_object',
-                    'generate_texture',
-                    'optimize_asset',
-                    'export_asset'
-                ]
-            }
-            
-            # サーバー設定を取得
-            mcp_server_host = self.config['mcp_server']['host']
-            mcp_server_port = self.config['mcp_server']['port']
-            ue5_port = self.config.get('ue5_mcp', {}).get('port', 5002)
-            
-            # HTMLテンプレートを描画
-            return render_template_string(HTML_TEMPLATE, 
-                                          status=status_data,
-                                          mcp_server_host=mcp_server_host,
-                                          mcp_server_port=mcp_server_port,
-                                          ue5_port=ue5_port)
-        except Exception as e:
-            logger.error(f"ホームページ表示中にエラーが発生しました: {str(e)}")
-            return f"エラーが発生しました: {str(e)}", 500
+        response = Response(self._home_html, mimetype='text/html')
+        response.headers['Cache-Control'] = 'public, max-age=300'
+        response.set_etag(self._home_etag)
+        # If-None-Matchが一致する場合は304を返す
+        return response.make_conditional(request)
     
     def getStatus(self):
         """
@@ -361,25 +662,12 @@ class BlenderMCP:
         戻り値:
             JSON: ステータス情報
         """
-        try:
-            # Blenderの状態を確認するコードをここに実装
-            status = {
-                'status': 'running',
-                'version': '1.0.0',
-                'blender_version': '3.6.0',  # 実際のBlenderバージョンを取得するコードに置き換え
-                'available_commands': [
-                    'generate_scene',
-                    'add_object',
-                    'modify_object',
-                    'generate_texture',
-                    'optimize_asset',
-                    'export_asset'
-                ]
-            }
-            return jsonify(status)
-        except Exception as e:
-            logger.error(f"ステータス取得中にエラーが発生しました: {str(e)}")
-            return jsonify({'error': str(e)}), 500
+        # Blenderの状態を確認するコードをここに実装
+        # ステータスは起動後に変わらないため、変換済みのJSONを返す
+        response = Response(self._status_bytes, mimetype='application/json')
+        response.set_etag(self._status_etag)
+        # If-None-Matchが一致する場合は304を返す
+        return response.make_conditional(request)
     
     def executeCommand(self):
         """
@@ -388,33 +676,108 @@ class BlenderMCP:
         戻り値:
             JSON: コマンド実行結果
         """
-        try:
-            data = request.json
-            if not data or 'command' not in data:
-                return jsonify({'error': 'コマンドが指定されていません'}), 400
+        data = request.json
+        if not data or 'command' not in data:
+            return jsonify({'error': 'コマンドが指定されていません'}), 400
+        
+        command = data['command']
+        params = data.get('params', {})
+        logger.info(f"コマンドを受信: {command}, パラメータ: {params}")
+        
+        # コマンドの実行
+        handler = self._dispatch.get(command)
+        if handler is None:
+            return jsonify({'error': f'未知のコマンド: {command}'}), 400
+        error = self._validateParams(command, params)
+        if error:
+            return jsonify({'error': error}), 400
+        return handler(params)
+    
+    def _validateParams(self, command, params):
+        """
+        コマンドのパラメータを検証する
+        
+        引数:
+            command (str): コマンド名
+            params (dict): パラメータ
+            
+        戻り値:
+            str: エラーメッセージ（問題がなければNone）
+        """
+        if not isinstance(params, dict):
+            return 'パラメータはオブジェクトで指定してください'
+        alternatives, message = COMMAND_REQUIRED_PARAMS[command]
+        keys = params.keys()
+        if not any(required <= keys for required in alternatives):
+            return message
+        return None
+    
+    def executeBatch(self):
+        """
+        複数のコマンドをまとめて実行するAPIエンドポイント
+        
+        シーン全体のコマンドを1回のHTTPリクエストで送信できるようにし、
+        コマンドごとの往復のオーバーヘッドを削減します。
+        
+        戻り値:
+            JSON: コマンドごとの実行結果
+        """
+        data = request.json
+        commands = data.get('commands') if isinstance(data, dict) else None
+        if not isinstance(commands, list):
+            return jsonify({'error': 'コマンドの一覧が指定されていません'}), 400
+        
+        logger.info(f"コマンドを一括受信: {len(commands)}件")
+        
+        results = []
+        for item in commands:
+            if not isinstance(item, dict) or 'command' not in item:
+                results.append({'status_code': 400, 'result': {'error': 'コマンドが指定されていません'}})
+                continue
             
-            command = data['command']
-            params = data.get('params', {})
-            logger.info(f"コマンドを受信: {command}, パラメータ: {params}")
+            command = item['command']
+            handler = self._dispatch.get(command)
+            if handler is None:
+                results.append({'status_code': 400, 'result': {'error': f'未知のコマンド: {command}'}})
+                continue
+            params = item.get('params', {})
+            error = self._validateParams(command, params)
+            if error:
+                results.append({'status_code': 400, 'result': {'error': error}})
+                continue
             
-            # コマンドの実行
-            if command == 'generate_scene':
-                return self.generateScene(params)
-            elif command == 'add_object':
-                return self.addObject(params)
-            elif command == 'modify_object':
-                return self.modifyObject(params)
-            elif command == 'generate_texture':
-                return self.generateTexture(params)
-            elif command == 'optimize_asset':
-                return self.optimizeAsset(params)
-            elif command == 'export_asset':
-                return self.exportAsset(params)
-            else:
-                return jsonify({'error': f'未知のコマンド: {command}'}), 400
-        except Exception as e:
-            logger.error(f"コマンド実行中にエラーが発生しました: {str(e)}")
-            return jsonify({'error': str(e)}), 500
+            try:
+                response = handler(params)
+            except Exception as e:
+                logger.error(f"コマンド実行中にエラーが発生しました: {str(e)}")
+                results.append({'status_code': 500, 'result': {'error': str(e)}})
+                continue
+            
+            # 各処理メソッドは (レスポンス, ステータスコード) またはレスポンスを返す
+            status_code = 200
+            if isinstance(response, tuple):
+                response, status_code = response
+            results.append({'status_code': status_code, 'result': response.get_json()})
+        
+        return jsonify({
+            'status': 'success' if all(r['status_code'] == 200 for r in results) else 'partial',
+            'results': results
+        })
+    
+    def streamJSON(self, items):
+        """
+        要素を1つずつ変換しながらJSON配列をストリーミングで返す
+        
+        レスポンス全体を辞書として組み立ててから変換しないため、
+        要素数が多くてもメモリ使用量が増えません。
+        
+        引数:
+            items (iterable): 配列の要素
+            
+        戻り値:
+            Response: JSON配列のストリーミングレスポンス
+        """
+        return Response(stream_with_context(_iter_json_array(items)), mimetype='application/json')
     
     # 以下、各コマンドの実装
     
@@ -428,9 +791,6 @@ class BlenderMCP:
         戻り値:
             JSON: 処理結果
         """
-        if 'description' not in params:
-            return jsonify({'error': '説明が指定されていません'}), 400
-        
         description = params['description']
         logger.info(f"シーン生成: {description}")
         
@@ -455,12 +815,9 @@ class BlenderMCP:
         戻り値:
             JSON: 処理結果
         """
-        if 'type' not in params:
-            return jsonify({'error': 'オブジェクトタイプが指定されていません'}), 400
-        
         obj_type = params['type']
         location = params.get('location', [0, 0, 0])
-        name = params.get('name', f'{obj_type}_{id(obj_type)}')
+        name = params.get('name') or f'{obj_type}_{next(self._obj_seq)}'
         
         logger.info(f"オブジェクト追加: {obj_type}, 位置: {location}, 名前: {name}")
         
@@ -481,13 +838,13 @@ class BlenderMCP:
         オブジェクトを修正する
         
         引数:
-            params (dict): パラメータ
+            params (dict): パラメータ（"objects"を指定した場合は複数のオブジェクトをまとめて修正）
             
         戻り値:
             JSON: 処理結果
         """
-        if 'name' not in params:
-            return jsonify({'error': 'オブジェクト名が指定されていません'}), 400
+        if 'objects' in params:
+            return self._modifyObjects(params['objects'])
         
         name = params['name']
         location = params.get('location', None)
@@ -509,6 +866,48 @@ class BlenderMCP:
             }
         })
     
+    def _modifyObjects(self, objects):
+        """
+        複数のオブジェクトをまとめて修正し、ワールド行列を一括で計算する
+        
+        引数:
+            objects (list): オブジェクトごとのパラメータ（name, location, scale, rotation）
+            
+        戻り値:
+            JSON: 処理結果
+        """
+        if not isinstance(objects, list) or not all(isinstance(obj, dict) and 'name' in obj for obj in objects):
+            return jsonify({'error': 'オブジェクト名が指定されていません'}), 400
+        
+        # numbaのJITコンパイルを含むため、一括修正が要求された時点で読み込む
+        from transforms_numba import compose_matrices
+        
+        logger.info(f"オブジェクト一括修正: {len(objects)}件")
+        
+        # オブジェクトごとの値を配列（SoA）にまとめて一括計算する
+        matrices = compose_matrices(
+            [obj.get('location') or (0, 0, 0) for obj in objects],
+            [obj.get('scale') or (1, 1, 1) for obj in objects],
+            [obj.get('rotation') or (0, 0, 0) for obj in objects]
+        )
+        
+        # ここに実際のBlender APIを使用したオブジェクト修正コードが入ります
+        # デモ用の応答
+        return jsonify({
+            'status': 'success',
+            'message': f'{len(objects)}個のオブジェクトが修正されました',
+            'object_info': [
+                {
+                    'name': obj['name'],
+                    'location': obj.get('location'),
+                    'scale': obj.get('scale'),
+                    'rotation': obj.get('rotation'),
+                    'matrix_world': matrix
+                }
+                for obj, matrix in zip(objects, matrices.tolist())
+            ]
+        })
+    
     def generateTexture(self, params):
         """
         テクスチャを生成する
@@ -519,54 +918,33 @@ class BlenderMCP:
         戻り値:
             JSON: 処理結果
         """
-        if 'object_name' not in params or 'description' not in params:
-            return jsonify({'error': 'オブジェクト名または説明が指定されていません'}), 400
-        
         object_name = params['object_name']
         description = params['description']
         
         logger.info(f"テクスチャ生成: オブジェクト: {object_name}, 説明: {description}")
         
-        # AIによるテクスチャ生成リクエスト
-        try:
-            ai_response = self.requestAIGeneration(
-                prompt=f"Create a texture for {object_name}: {description}",
-                type="texture"
-            )
-            
-            # AIレスポンスの処理
-            # モックモードでもエラーなく処理を続行できるようにする
-            
-            # ここに実際のBlender APIを使用したテクスチャ適用コードが入ります
-            # デモ用の応答
-            return jsonify({
-                'status': 'success',
-                'message': f'テクスチャが "{object_name}" に適用されました',
-                'texture_info': {
-                    'object': object_name,
-                    'description': description,
-                    'texture_type': 'diffuse',
-                    'resolution': '2048x2048',
-                    'ai_generated': 'ai_response' in locals()
-                }
-            })
-        except requests.exceptions.ConnectionError:
-            logger.warning(f"MCPサーバーに接続できません。ローカルでテクスチャ生成を続行します。")
-            # MCPサーバーが利用できない場合のフォールバック処理
-            return jsonify({
-                'status': 'success',
-                'message': f'テクスチャが "{object_name}" に適用されました（ローカル生成）',
-                'texture_info': {
-                    'object': object_name,
-                    'description': description,
-                    'texture_type': 'diffuse',
-                    'resolution': '2048x2048',
-                    'ai_generated': False
-                }
-            })
-        except Exception as e:
-            logger.error(f"テクスチャ生成中にエラーが発生しました: {str(e)}")
-            return jsonify({'error': str(e)}), 500
+        # AIによるテクスチャ生成リクエスト（失敗した場合もエラーの結果が返される）
+        ai_response = self.requestAIGeneration(
+            prompt=f"Create a texture for {object_name}: {description}",
+            type="texture"
+        )
+        ai_generated = not (isinstance(ai_response, dict) and ai_response.get('status') == 'error')
+        if not ai_generated:
+            logger.warning("AIによるテクスチャ生成に失敗しました。ローカルでテクスチャ生成を続行します。")
+        
+        # ここに実際のBlender APIを使用したテクスチャ適用コードが入ります
+        # デモ用の応答
+        return jsonify({
+            'status': 'success',
+            'message': f'テクスチャが "{object_name}" に適用されました' + ('' if ai_generated else '（ローカル生成）'),
+            'texture_info': {
+                'object': object_name,
+                'description': description,
+                'texture_type': 'diffuse',
+                'resolution': '2048x2048',
+                'ai_generated': ai_generated
+            }
+        })
     
     def optimizeAsset(self, params):
         """
@@ -578,15 +956,25 @@ class BlenderMCP:
         戻り値:
             JSON: 処理結果
         """
-        if 'asset_name' not in params:
-            return jsonify({'error': 'アセット名が指定されていません'}), 400
-        
         asset_name = params['asset_name']
-        lod_level = params.get('lod', 1)
-        polycount = params.get('polycount', None)
+        
+        # ストリーミングでは応答の送信開始後にエラーを返せないため、数値は先に検証する
+        try:
+            lod_level = int(params.get('lod', 1))
+            polycount = params.get('polycount', None)
+            if polycount is not None:
+                polycount = int(polycount)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'lodとpolycountには整数を指定してください'}), 400
+        if lod_level < 0:
+            return jsonify({'error': 'lodには0以上の整数を指定してください'}), 400
         
         logger.info(f"アセット最適化: {asset_name}, LOD: {lod_level}, ポリゴン数: {polycount}")
         
+        # stream=trueの場合はLODごとの結果を完成した順にJSON配列として返す
+        if params.get('stream'):
+            return self.streamJSON(self._iterLODResults(asset_name, lod_level, polycount))
+        
         # ここに実際のBlender APIを使用したアセット最適化コードが入ります
         # デモ用の応答
         return jsonify({
@@ -601,6 +989,32 @@ class BlenderMCP:
             }
         })
     
+    def _iterLODResults(self, asset_name, lod_level, polycount=None):
+        """
+        LODごとの最適化結果を順に生成する
+        
+        引数:
+            asset_name (str): アセット名
+            lod_level (int): 生成する最大のLODレベル
+            polycount (int): ポリゴン数の上限
+            
+        戻り値:
+            generator: LODごとの最適化結果
+        """
+        original_polycount = 10000  # 例
+        for level in range(1, lod_level + 1):
+            # ここに実際のBlender APIを使用したLODごとの最適化コードが入ります
+            optimized_polycount = original_polycount >> level
+            if polycount:
+                optimized_polycount = min(optimized_polycount, polycount)
+            yield {
+                'asset': asset_name,
+                'lod_level': level,
+                'original_polycount': original_polycount,
+                'optimized_polycount': optimized_polycount,
+                'reduction_percent': optimized_polycount / original_polycount * 100
+            }
+    
     def exportAsset(self, params):
         """
         アセットをエクスポートする
@@ -611,15 +1025,15 @@ class BlenderMCP:
         戻り値:
             JSON: 処理結果
         """
-        if 'asset_name' not in params or 'format' not in params:
-            return jsonify({'error': 'アセット名またはフォーマットが指定されていません'}), 400
-        
         asset_name = params['asset_name']
         export_format = params['format']
         path = params.get('path', f'./exports/{asset_name}.{export_format.lower()}')
         
-        # エクスポートディレクトリを作成
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # エクスポートディレクトリを作成（作成済みの場合は省略）
+        export_dir = os.path.dirname(path)
+        if export_dir and export_dir not in self._mkdir_cache:
+            os.makedirs(export_dir, exist_ok=True)
+            self._mkdir_cache.add(export_dir)
         
         logger.info(f"アセットエクスポート: {asset_name}, フォーマット: {export_format}, パス: {path}")
         
@@ -647,6 +1061,13 @@ class BlenderMCP:
         戻り値:
             dict: AI生成結果
         """
+        # 同じプロンプトとタイプの成功結果がキャッシュにあれば再利用する
+        key = (prompt, type)
+        cached = self._getCachedAIResult(key)
+        if cached is not None:
+            logger.info(f"キャッシュ済みのAI生成結果を使用: {prompt}")
+            return cached
+        
         try:
             url = f"{self.mcp_server_url}/api/ai/generate"
             data = {
@@ -655,11 +1076,19 @@ class BlenderMCP:
             }
             
             logger.info(f"MCPサーバーにAI生成要求を送信: {prompt}")
-            response = requests.post(url, json=data, timeout=10)  # タイムアウトを設定
+            response = self._http.post(
+                url,
+                data=_json_bytes(data),
+                headers={'Content-Type': 'application/json'},
+                timeout=(2, 10)  # （接続, 読み込み）タイムアウトを設定
+            )
             
             if response.status_code == 200:
                 logger.info("AI生成が成功しました")
-                return response.json()
+                result = _json_loads(response.content)
+                if not (isinstance(result, dict) and result.get('status') == 'error'):
+                    self._putCachedAIResult(key, result)
+                return result
             else:
                 logger.warning(f"AI生成要求中にサーバーエラーが発生しました: {response.text}")
                 # エラーでも処理を続行できるようにレスポンスを返す
@@ -700,6 +1129,42 @@ class BlenderMCP:
                 }
             }
     
+    def _getCachedAIResult(self, key):
+        """
+        キャッシュからAI生成結果を取得する
+        
+        引数:
+            key (tuple): (プロンプト, タイプ)
+            
+        戻り値:
+            dict: AI生成結果のコピー（キャッシュにない・期限切れの場合はNone）
+        """
+        with self._ai_cache_lock:
+            entry = self._ai_cache.get(key)
+            if entry is None:
+                return None
+            expiry, value = entry
+            if expiry < time.monotonic():
+                del self._ai_cache[key]
+                return None
+            self._ai_cache.move_to_end(key)
+        return copy.deepcopy(value)
+    
+    def _putCachedAIResult(self, key, value):
+        """
+        AI生成結果をキャッシュに保存する（上限を超えた場合は最も古いものから削除）
+        
+        引数:
+            key (tuple): (プロンプト, タイプ)
+            value (dict): AI生成結果
+        """
+        value = copy.deepcopy(value)
+        with self._ai_cache_lock:
+            self._ai_cache[key] = (time.monotonic() + AI_CACHE_TTL, value)
+            self._ai_cache.move_to_end(key)
+            while len(self._ai_cache) > AI_CACHE_SIZE:
+                self._ai_cache.popitem(last=False)
+    
     def run(self):
         """
         Blender-MCPサーバーを実行する
@@ -709,8 +1174,19 @@ class BlenderMCP:
             port = self.config['blender_mcp']['port']
             debug = self.config['blender_mcp']['debug']
             
+            # 本番用WSGIサーバー（インストールされていない場合はFlaskの開発サーバーを使用）
+            try:
+                from waitress import serve as waitress_serve
+            except ImportError:
+                waitress_serve = None
+            
             logger.info(f"Blender-MCPサーバーを起動します: {host}:{port}")
-            self.app.run(host=host, port=port, debug=debug)
+            if not debug and waitress_serve is not None:
+                # デバッグ時以外はwaitressで複数のリクエストを並行して処理する
+                waitress_serve(self.app, host=host, port=port, threads=16, connection_limit=512)
+            else:
+                # AI生成要求の待ち時間で他のリクエストが止まらないよう、リクエストごとにスレッドで処理する
+                self.app.run(host=host, port=port, debug=debug, threaded=True)
         except Exception as e:
             logger.critical(f"サーバー起動中に致命的なエラーが発生しました: {str(e)}")
             raise
@@ -21,9 +21,15 @@ import os
 import sys
 import json
 import time
+import hashlib
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ロギング設定
@@ -44,38 +50,161 @@ MCP_SERVER = "http://127.0.0.1:8080"
 EXPORTS_DIR = os.path.join(os.getcwd(), "exports")
 os.makedirs(EXPORTS_DIR, exist_ok=True)
 
+# 進捗通知用のパイプが使えない場合に、Blenderスクリプトがエクスポート完了を標準出力で通知する行の接頭辞
+EXPORTED_MARKER = "MCP_MODEL_EXPORTED:"
+
+# エラー時にログへ出力するBlenderの出力行数（出力全体はメモリに溜めない）
+BLENDER_OUTPUT_TAIL_LINES = 200
+
+# モデルの作成に並列で起動するBlenderの最大数
+BLENDER_WORKERS = int(os.getenv("BLENDER_WORKERS", "2"))
+
+def _resolve_blender_path():
+    """Blenderのパスを取得する"""
+    # 環境変数から取得
+    blender_path = os.getenv("BLENDER_PATH", "")
+    
+    # 環境変数にない場合はデフォルトパスを使用
+    if not blender_path:
+        if sys.platform == "darwin":  # macOS
+            blender_path = "/Applications/Blender.app/Contents/MacOS/Blender"
+        elif sys.platform == "win32":  # Windows
+            blender_path = r"C:\Program Files\Blender Foundation\Blender\blender.exe"
+        else:  # Linux その他
+            blender_path = "blender"
+    
+    logger.info(f"Blenderパス: {blender_path}")
+    return blender_path
+
+# Blenderのパス（インポート時に1回だけ解決する）
+BLENDER_PATH = _resolve_blender_path()
+
 class BlenderShooterGameModeler:
     """Blenderでシューティングゲーム用モデルを作成するクラス"""
     
+    # 各モデル作成スクリプトの先頭（シーンの後片付けは結合したスクリプトがモデルごとに行う）
+    _HEADER = """
+import bpy
+import bmesh
+import math
+import os
+from mathutils import Euler, Matrix, Vector
+
+def trs_matrix(location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+    # 位置・回転（XYZオイラー角）・スケールから変換行列を作成
+    return (Matrix.Translation(location)
+            @ Euler(rotation, 'XYZ').to_matrix().to_4x4()
+            @ Matrix.Diagonal((*scale, 1.0)))
+
+def new_bmesh():
+    # UVを計算できるようにUVレイヤー付きのBMeshを作成
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    return bm
+
+def add_cylinder(bm, radius, depth, matrix, segments=32):
+    # 両端を閉じた円柱を追加
+    return bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=segments,
+                                 radius1=radius, radius2=radius, depth=depth,
+                                 matrix=matrix, calc_uvs=True)
+
+def add_torus(bm, major_radius, minor_radius, major_segments, minor_segments, matrix):
+    # トーラスを追加（bmesh.opsにトーラスの作成処理はないため頂点と面から作成）
+    uv_layer = bm.loops.layers.uv.active
+    rings = []
+    for i in range(major_segments):
+        u = 2 * math.pi * i / major_segments
+        ring = []
+        for j in range(minor_segments):
+            v = 2 * math.pi * j / minor_segments
+            r = major_radius + minor_radius * math.cos(v)
+            ring.append(bm.verts.new(matrix @ Vector((r * math.cos(u), r * math.sin(u), minor_radius * math.sin(v)))))
+        rings.append(ring)
+    
+    faces = []
+    for i in range(major_segments):
+        for j in range(minor_segments):
+            i2 = (i + 1) % major_segments
+            j2 = (j + 1) % minor_segments
+            face = bm.faces.new((rings[i][j], rings[i2][j], rings[i2][j2], rings[i][j2]))
+            if uv_layer is not None:
+                uvs = ((i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1))
+                for loop, (a, b) in zip(face.loops, uvs):
+                    loop[uv_layer].uv = (a / major_segments, b / minor_segments)
+            faces.append(face)
+    return faces
+
+def link_bmesh(bm, name, materials):
+    # BMeshを1回だけメッシュに書き出してオブジェクトを作成し、選択状態にする
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    for mat in materials:
+        mesh.materials.append(mat)
+    
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+"""
+    
+    # 各モデル作成スクリプトの末尾（原点の設定とFBXへのエクスポート）
+    # モディファイアやテクスチャは使わないため、それらの評価・書き出しは行わない
+    _FBX_FOOTER = """
+# 原点を設定
+bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
+
+# FBXにエクスポート
+export_path = r"{path}"
+bpy.ops.export_scene.fbx(
+    filepath=export_path,
+    use_selection=True,
+    global_scale=1.0,
+    apply_unit_scale=True,
+    apply_scale_options='FBX_SCALE_NONE',
+    bake_space_transform=False,
+    object_types={{'MESH', 'ARMATURE'}},
+    use_mesh_modifiers=False,
+    use_mesh_modifiers_render=False,
+    mesh_smooth_type='OFF',
+    use_mesh_edges=False,
+    use_custom_props=False,
+    use_metadata=False,
+    add_leaf_bones=False,
+    path_mode='STRIP',
+    embed_textures=False
+)
+
+print("{label}モデルを作成しました: " + export_path)
+"""
+    
     def __init__(self):
         """初期化"""
-        self.blender_path = self._get_blender_path()
+        self.blender_path = BLENDER_PATH
         self.server_url = MCP_SERVER
         
+        # MCPサーバーとの接続を使い回すセッション（一時的な接続エラーは再試行する）
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.2))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         # モデル名とエクスポートパスを保持する辞書
         self.models = {}
-    
-    def _get_blender_path(self):
-        """Blenderのパスを取得する"""
-        # 環境変数から取得
-        blender_path = os.getenv("BLENDER_PATH", "")
         
-        # 環境変数にない場合はデフォルトパスを使用
-        if not blender_path:
-            if sys.platform == "darwin":  # macOS
-                blender_path = "/Applications/Blender.app/Contents/MacOS/Blender"
-            elif sys.platform == "win32":  # Windows
-                blender_path = r"C:\Program Files\Blender Foundation\Blender\blender.exe"
-            else:  # Linux その他
-                blender_path = "blender"
+        # 1回のBlender起動でまとめて実行するスクリプト（(モデル名, スクリプト)のリスト）
+        self._pending_scripts = []
         
-        logger.info(f"Blenderパス: {blender_path}")
-        return blender_path
+        # 並列に実行しているBlender全体での進捗（作成が終わったモデル数, 作成するモデル数）
+        self._progress = [0, 0]
+        self._progress_lock = threading.Lock()
     
     def check_mcp_server(self):
         """MCPサーバーの接続を確認する"""
         try:
-            response = requests.get(f"{self.server_url}/api/status", timeout=5)
+            response = self.session.get(f"{self.server_url}/api/status", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("status") == "running":
@@ -95,87 +224,30 @@ class BlenderShooterGameModeler:
         """プレイヤー宇宙船モデルを作成するBlenderスクリプト"""
         model_name = "PlayerShip"
         export_path = os.path.join(EXPORTS_DIR, model_name + '.fbx')
-        script = f"""
-import bpy
-import math
-import os
-
-# シーンをクリア
-bpy.ops.wm.read_factory_settings(use_empty=True)
-
+        script = self._build_script(export_path, "プレイヤー宇宙船", """
 # プレイヤー宇宙船の作成
 def create_player_ship():
-    # ベースの立方体を作成
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    ship_body = bpy.context.active_object
-    ship_body.name = "ShipBody"
-    
-    # 船体の形状を調整
-    ship_body.scale = (1.5, 2.0, 0.4)
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-    
-    # 前方を先細りにする
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='DESELECT')
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    # 前部の頂点を選択して移動
-    for v in ship_body.data.vertices:
-        if v.co.y > 0:
-            v.select = True
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.transform.resize(value=(0.6, 1, 1))
-    bpy.ops.mesh.select_all(action='DESELECT')
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    # 翼を作成
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    wing = bpy.context.active_object
-    wing.name = "Wing"
-    wing.scale = (3.0, 1.2, 0.1)
-    wing.location = (0, 0, 0)
-    
-    # コックピットを作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.4, depth=0.6, location=(0, 0.5, 0.3))
-    cockpit = bpy.context.active_object
-    cockpit.name = "Cockpit"
-    cockpit.rotation_euler = (math.pi/2, 0, 0)
-    cockpit.scale = (0.6, 0.6, 0.6)
-    
-    # 推進器を作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=0.4, location=(0, -1.5, 0))
-    engine = bpy.context.active_object
-    engine.name = "Engine"
-    engine.rotation_euler = (math.pi/2, 0, 0)
-    
-    # サイドエンジンを作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=0.3, location=(0.8, -1.3, 0))
-    engine_right = bpy.context.active_object
-    engine_right.name = "EngineRight"
-    engine_right.rotation_euler = (math.pi/2, 0, 0)
-    
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=0.3, location=(-0.8, -1.3, 0))
-    engine_left = bpy.context.active_object
-    engine_left.name = "EngineLeft"
-    engine_left.rotation_euler = (math.pi/2, 0, 0)
-    
-    # すべてのオブジェクトを選択
-    ship_body.select_set(True)
-    wing.select_set(True)
-    cockpit.select_set(True)
-    engine.select_set(True)
-    engine_right.select_set(True)
-    engine_left.select_set(True)
-    
-    # アクティブオブジェクトを設定
-    bpy.context.view_layer.objects.active = ship_body
-    
-    # オブジェクトを結合
-    bpy.ops.object.join()
-    
-    # 名前を設定
-    bpy.context.active_object.name = "PlayerShip"
+    bm = new_bmesh()
+    
+    # 船体（立方体を平たく伸ばしたもの）
+    body = bmesh.ops.create_cube(bm, size=1, matrix=trs_matrix(scale=(1.5, 2.0, 0.4)), calc_uvs=True)
+    
+    # 前方を先細りにする（前部の頂点を前端の中心を基準にX方向へ縮める）
+    front = [v for v in body['verts'] if v.co.y > 0]
+    bmesh.ops.scale(bm, vec=(0.6, 1, 1), space=Matrix.Translation((0, -1.0, 0)), verts=front)
+    
+    # 翼
+    bmesh.ops.create_cube(bm, size=1, matrix=trs_matrix(scale=(3.0, 1.2, 0.1)), calc_uvs=True)
+    
+    # コックピット
+    add_cylinder(bm, 0.4, 0.6, trs_matrix((0, 0.5, 0.3), (math.pi/2, 0, 0), (0.6, 0.6, 0.6)))
+    
+    # 推進器
+    add_cylinder(bm, 0.2, 0.4, trs_matrix((0, -1.5, 0), (math.pi/2, 0, 0)))
+    
+    # サイドエンジン
+    add_cylinder(bm, 0.15, 0.3, trs_matrix((0.8, -1.3, 0), (math.pi/2, 0, 0)))
+    add_cylinder(bm, 0.15, 0.3, trs_matrix((-0.8, -1.3, 0), (math.pi/2, 0, 0)))
     
     # 青い艦体マテリアルを作成
     mat = bpy.data.materials.new(name="ShipMaterial")
@@ -185,36 +257,12 @@ def create_player_ship():
     bsdf.inputs['Metallic'].default_value = 0.8
     bsdf.inputs['Roughness'].default_value = 0.2
     
-    # マテリアルを割り当て
-    ship_body.data.materials.append(mat)
-    
-    return ship_body
+    return link_bmesh(bm, "PlayerShip", [mat])
 
 # モデルを作成
 player_ship = create_player_ship()
-
-# 原点を設定
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-# FBXにエクスポート
-export_path = r"{os.path.join(EXPORTS_DIR, model_name + '.fbx')}"
-bpy.ops.export_scene.fbx(
-    filepath=export_path,
-    use_selection=True,
-    global_scale=1.0,
-    apply_unit_scale=True,
-    apply_scale_options='FBX_SCALE_NONE',
-    bake_space_transform=False,
-    object_types={'MESH', 'ARMATURE'},
-    use_mesh_modifiers=True,
-    mesh_smooth_type='OFF',
-    use_mesh_edges=False,
-    path_mode='AUTO'
-)
-
-print(f"プレイヤー宇宙船モデルを作成しました: {export_path}")
-"""
-        self._run_blender_script(script, model_name)
+""")
+        self._queue_script(script, model_name)
         self.models["player_ship"] = model_name
         return model_name
     
@@ -222,79 +270,27 @@ print(f"プレイヤー宇宙船モデルを作成しました: {export_path}")
         """敵宇宙船モデルを作成するBlenderスクリプト"""
         model_name = "EnemyShip"
         export_path = os.path.join(EXPORTS_DIR, model_name + '.fbx')
-        script = f"""
-import bpy
-import math
-import os
-
-# シーンをクリア
-bpy.ops.wm.read_factory_settings(use_empty=True)
-
+        script = self._build_script(export_path, "敵宇宙船", """
 # 敵宇宙船の作成
 def create_enemy_ship():
-    # ベースの立方体を作成
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    ship_body = bpy.context.active_object
-    ship_body.name = "EnemyShipBody"
-    
-    # 船体の形状を調整
-    ship_body.scale = (1.2, 1.0, 0.3)
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-    
-    # 前方を先細りにする
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='DESELECT')
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    # 前部の頂点を選択して移動
-    for v in ship_body.data.vertices:
-        if v.co.y > 0:
-            v.select = True
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.transform.resize(value=(0.7, 1.2, 0.7))
-    bpy.ops.mesh.select_all(action='DESELECT')
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    # 翼を作成
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    wing = bpy.context.active_object
-    wing.name = "EnemyWing"
-    wing.scale = (2.0, 0.8, 0.1)
-    wing.location = (0, -0.2, 0)
-    
-    # 砲台を作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=0.4, location=(0, 0.5, -0.2))
-    turret = bpy.context.active_object
-    turret.name = "EnemyTurret"
-    turret.rotation_euler = (0, 0, 0)
-    
-    # 推進器を作成
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=0.3, location=(0.6, -0.8, 0))
-    engine_right = bpy.context.active_object
-    engine_right.name = "EnemyEngineRight"
-    engine_right.rotation_euler = (math.pi/2, 0, 0)
-    
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=0.3, location=(-0.6, -0.8, 0))
-    engine_left = bpy.context.active_object
-    engine_left.name = "EnemyEngineLeft"
-    engine_left.rotation_euler = (math.pi/2, 0, 0)
-    
-    # すべてのオブジェクトを選択
-    ship_body.select_set(True)
-    wing.select_set(True)
-    turret.select_set(True)
-    engine_right.select_set(True)
-    engine_left.select_set(True)
-    
-    # アクティブオブジェクトを設定
-    bpy.context.view_layer.objects.active = ship_body
-    
-    # オブジェクトを結合
-    bpy.ops.object.join()
-    
-    # 名前を設定
-    bpy.context.active_object.name = "EnemyShip"
+    bm = new_bmesh()
+    
+    # 船体（立方体を平たく伸ばしたもの）
+    body = bmesh.ops.create_cube(bm, size=1, matrix=trs_matrix(scale=(1.2, 1.0, 0.3)), calc_uvs=True)
+    
+    # 前方を先細りにする（前部の頂点を前端の中心を基準に縮める）
+    front = [v for v in body['verts'] if v.co.y > 0]
+    bmesh.ops.scale(bm, vec=(0.7, 1.2, 0.7), space=Matrix.Translation((0, -0.5, 0)), verts=front)
+    
+    # 翼
+    bmesh.ops.create_cube(bm, size=1, matrix=trs_matrix((0, -0.2, 0), scale=(2.0, 0.8, 0.1)), calc_uvs=True)
+    
+    # 砲台
+    add_cylinder(bm, 0.2, 0.4, trs_matrix((0, 0.5, -0.2)))
+    
+    # 推進器
+    add_cylinder(bm, 0.15, 0.3, trs_matrix((0.6, -0.8, 0), (math.pi/2, 0, 0)))
+    add_cylinder(bm, 0.15, 0.3, trs_matrix((-0.6, -0.8, 0), (math.pi/2, 0, 0)))
     
     # 赤い艦体マテリアルを作成
     mat = bpy.data.materials.new(name="EnemyShipMaterial")
@@ -304,36 +300,12 @@ def create_enemy_ship():
     bsdf.inputs['Metallic'].default_value = 0.7
     bsdf.inputs['Roughness'].default_value = 0.3
     
-    # マテリアルを割り当て
-    ship_body.data.materials.append(mat)
-    
-    return ship_body
+    return link_bmesh(bm, "EnemyShip", [mat])
 
 # モデルを作成
 enemy_ship = create_enemy_ship()
-
-# 原点を設定
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-# FBXにエクスポート
-export_path = r"{os.path.join(EXPORTS_DIR, model_name + '.fbx')}"
-bpy.ops.export_scene.fbx(
-    filepath=export_path,
-    use_selection=True,
-    global_scale=1.0,
-    apply_unit_scale=True,
-    apply_scale_options='FBX_SCALE_NONE',
-    bake_space_transform=False,
-    object_types={'MESH', 'ARMATURE'},
-    use_mesh_modifiers=True,
-    mesh_smooth_type='OFF',
-    use_mesh_edges=False,
-    path_mode='AUTO'
-)
-
-print(f"敵宇宙船モデルを作成しました: {export_path}")
-"""
-        self._run_blender_script(script, model_name)
+""")
+        self._queue_script(script, model_name)
         self.models["enemy_ship"] = model_name
         return model_name
     
@@ -341,21 +313,14 @@ print(f"敵宇宙船モデルを作成しました: {export_path}")
         """弾丸モデルを作成するBlenderスクリプト"""
         model_name = "Projectile"
         export_path = os.path.join(EXPORTS_DIR, model_name + '.fbx')
-        script = f"""
-import bpy
-import os
-
-# シーンをクリア
-bpy.ops.wm.read_factory_settings(use_empty=True)
-
+        script = self._build_script(export_path, "弾丸", """
 # 弾丸の作成
 def create_projectile():
-    # ベースのカプセルを作成
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.3, location=(0, 0, 0))
-    projectile = bpy.context.active_object
-    projectile.name = "Projectile"
-    projectile.scale = (0.2, 0.5, 0.2)
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+    bm = new_bmesh()
+    
+    # ベースのカプセル（球を縦に伸ばしたもの）
+    bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=0.3,
+                              matrix=trs_matrix(scale=(0.2, 0.5, 0.2)), calc_uvs=True)
     
     # 弾丸用マテリアルを作成（エネルギー弾のような発光マテリアル）
     mat = bpy.data.materials.new(name="ProjectileMaterial")
@@ -367,36 +332,12 @@ def create_projectile():
     bsdf.inputs['Metallic'].default_value = 0.0
     bsdf.inputs['Roughness'].default_value = 0.0
     
-    # マテリアルを割り当て
-    projectile.data.materials.append(mat)
-    
-    return projectile
+    return link_bmesh(bm, "Projectile", [mat])
 
 # モデルを作成
 projectile = create_projectile()
-
-# 原点を設定
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-# FBXにエクスポート
-export_path = r"{os.path.join(EXPORTS_DIR, model_name + '.fbx')}"
-bpy.ops.export_scene.fbx(
-    filepath=export_path,
-    use_selection=True,
-    global_scale=1.0,
-    apply_unit_scale=True,
-    apply_scale_options='FBX_SCALE_NONE',
-    bake_space_transform=False,
-    object_types={'MESH', 'ARMATURE'},
-    use_mesh_modifiers=True,
-    mesh_smooth_type='OFF',
-    use_mesh_edges=False,
-    path_mode='AUTO'
-)
-
-print(f"弾丸モデルを作成しました: {export_path}")
-"""
-        self._run_blender_script(script, model_name)
+""")
+        self._queue_script(script, model_name)
         self.models["projectile"] = model_name
         return model_name
     
@@ -404,43 +345,19 @@ print(f"弾丸モデルを作成しました: {export_path}")
         """パワーアップアイテムモデルを作成するBlenderスクリプト"""
         model_name = "PowerUp"
         export_path = os.path.join(EXPORTS_DIR, model_name + '.fbx')
-        script = f"""
-import bpy
-import math
-import os
-
-# シーンをクリア
-bpy.ops.wm.read_factory_settings(use_empty=True)
-
+        script = self._build_script(export_path, "パワーアップアイテム", """
 # パワーアップアイテムの作成
 def create_powerup():
-    # ベースの立方体を作成
-    bpy.ops.mesh.primitive_ico_sphere_add(radius=0.5, subdivisions=2, location=(0, 0, 0))
-    powerup = bpy.context.active_object
-    powerup.name = "PowerUpCore"
-    
-    # リングを作成
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=0.8, 
-        minor_radius=0.05, 
-        major_segments=32, 
-        minor_segments=12,
-        location=(0, 0, 0)
-    )
-    ring = bpy.context.active_object
-    ring.name = "PowerUpRing"
-    
-    # 内側のリングを作成
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=0.6, 
-        minor_radius=0.03, 
-        major_segments=32, 
-        minor_segments=12,
-        location=(0, 0, 0),
-        rotation=(math.pi/2, 0, 0)
-    )
-    inner_ring = bpy.context.active_object
-    inner_ring.name = "PowerUpInnerRing"
+    bm = new_bmesh()
+    
+    # コア（マテリアル0）
+    bmesh.ops.create_icosphere(bm, subdivisions=2, radius=0.5, matrix=Matrix.Identity(4), calc_uvs=True)
+    
+    # リングと内側のリング（マテリアル1）
+    ring_faces = add_torus(bm, 0.8, 0.05, 32, 12, Matrix.Identity(4))
+    ring_faces += add_torus(bm, 0.6, 0.03, 32, 12, trs_matrix(rotation=(math.pi/2, 0, 0)))
+    for face in ring_faces:
+        face.material_index = 1
     
     # 発光コアマテリアルを作成
     core_mat = bpy.data.materials.new(name="PowerUpCoreMaterial")
@@ -460,83 +377,241 @@ def create_powerup():
     bsdf.inputs['Metallic'].default_value = 1.0
     bsdf.inputs['Roughness'].default_value = 0.1
     
-    # マテリアルを割り当て
-    powerup.data.materials.append(core_mat)
-    ring.data.materials.append(ring_mat)
-    inner_ring.data.materials.append(ring_mat)
-    
-    # すべてのオブジェクトを選択
-    powerup.select_set(True)
-    ring.select_set(True)
-    inner_ring.select_set(True)
-    
-    # アクティブオブジェクトを設定
-    bpy.context.view_layer.objects.active = powerup
-    
-    # オブジェクトを結合
-    bpy.ops.object.join()
-    
-    # 名前を設定
-    bpy.context.active_object.name = "PowerUp"
-    
-    return powerup
+    return link_bmesh(bm, "PowerUp", [core_mat, ring_mat])
 
 # モデルを作成
 powerup = create_powerup()
-
-# 原点を設定
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-# FBXにエクスポート
-export_path = r"{os.path.join(EXPORTS_DIR, model_name + '.fbx')}"
-bpy.ops.export_scene.fbx(
-    filepath=export_path,
-    use_selection=True,
-    global_scale=1.0,
-    apply_unit_scale=True,
-    apply_scale_options='FBX_SCALE_NONE',
-    bake_space_transform=False,
-    object_types={'MESH', 'ARMATURE'},
-    use_mesh_modifiers=True,
-    mesh_smooth_type='OFF',
-    use_mesh_edges=False,
-    path_mode='AUTO'
-)
-
-print(f"パワーアップアイテムモデルを作成しました: {export_path}")
-"""
-        self._run_blender_script(script, model_name)
+""")
+        self._queue_script(script, model_name)
         self.models["powerup"] = model_name
         return model_name
     
-    def _run_blender_script(self, script, model_name):
-        """Blenderでスクリプトを実行する"""
-        script_path = os.path.join(EXPORTS_DIR, f"{model_name}_script.py")
+    def _build_script(self, export_path, label, body):
+        """
+        モデル固有の処理に共通の先頭・末尾を付けてBlenderスクリプトを組み立てる
+        
+        引数:
+            export_path (str): FBXのエクスポート先パス
+            label (str): ログに表示するモデルの名前
+            body (str): モデルを作成するスクリプト本体
+        
+        戻り値:
+            str: Blenderで実行するスクリプト
+        """
+        return self._HEADER + body + self._FBX_FOOTER.format(path=export_path, label=label)
+    
+    def _queue_script(self, script, model_name):
+        """
+        Blenderで実行するスクリプトをキューに追加する
+        
+        Blenderの起動には数秒かかるため、スクリプトはすぐには実行せず、
+        _flush_scriptsで1回の起動にまとめて実行する
+        """
+        self._pending_scripts.append((model_name, script))
+    
+    def _build_combined_script(self, scripts):
+        """
+        複数のモデル作成スクリプトを1つのスクリプトにまとめる
+        
+        各スクリプトは独立した名前空間で実行し、1つが失敗しても残りのモデルの作成を続ける
+        エクスポートが終わるたびにモデル名（JSON）を、"--"の後に渡された進捗通知用のファイル記述子へ書き込む
+        （記述子が渡されない場合はEXPORTED_MARKERを付けて標準出力に出力する）
+        シーンの初期化は最初の1回だけ行い、モデルごとにオブジェクトと未使用のデータを削除する
+        """
+        lines = [
+            "import json",
+            "import os",
+            "import sys",
+            "import traceback",
+            "import bpy",
+            "",
+            "progress_fd = int(sys.argv[sys.argv.index('--') + 1]) if '--' in sys.argv else None",
+            "",
+            "def report_progress(model_name):",
+            "    # エクスポートが終わったモデルを1行のJSONとして呼び出し元に通知する",
+            "    line = json.dumps({'model': model_name})",
+            "    if progress_fd is None:",
+            f"        print({EXPORTED_MARKER!r} + line, flush=True)",
+            "    else:",
+            "        os.write(progress_fd, (line + '\\n').encode('utf-8'))",
+            "",
+            "def clear_scene():",
+            "    # 作成したオブジェクトを削除し、参照されなくなったメッシュやマテリアルも解放する",
+            "    for obj in list(bpy.data.objects):",
+            "        bpy.data.objects.remove(obj, do_unlink=True)",
+            "    bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)",
+            "",
+            "bpy.ops.wm.read_factory_settings(use_empty=True)",
+            "failed = []",
+        ]
+        for model_name, script in scripts:
+            lines += [
+                "",
+                f"# {model_name}",
+                "try:",
+                f"    exec(compile({script!r}, {model_name + '_script.py'!r}, 'exec'), {{'__name__': '__main__'}})",
+                f"    report_progress({model_name!r})",
+                "except Exception:",
+                "    traceback.print_exc()",
+                f"    failed.append({model_name!r})",
+                "finally:",
+                "    clear_scene()",
+            ]
+        lines += [
+            "",
+            "if failed:",
+            "    print('作成に失敗したモデル: ' + ', '.join(failed))",
+            "    sys.exit(1)",
+            "",
+        ]
+        return "\n".join(lines)
+    
+    def _is_cached(self, model_name, script_hash):
+        """
+        前回同じスクリプトでエクスポートしたFBXが残っているかを確認する
+        
+        引数:
+            model_name (str): モデル名
+            script_hash (str): スクリプトのSHA-256ハッシュ
+        
+        戻り値:
+            bool: 前回のFBXをそのまま使える場合はTrue
+        """
+        fbx_path = os.path.join(EXPORTS_DIR, f"{model_name}.fbx")
+        hash_path = os.path.join(EXPORTS_DIR, f"{model_name}.sha256")
+        if not (os.path.exists(fbx_path) and os.path.exists(hash_path)):
+            return False
+        with open(hash_path) as f:
+            return f.read().strip() == script_hash
+    
+    def _flush_scripts(self):
+        """
+        キューに溜まったスクリプトをBlenderでまとめて実行する
+        
+        モデルはBLENDER_WORKERS個までのグループに分け、グループごとに1つのBlenderを並列に起動する
+        
+        戻り値:
+            dict: モデル名 -> 作成に成功したかどうか
+        """
+        scripts, self._pending_scripts = self._pending_scripts, []
         
-        # スクリプトをファイルに保存
-        with open(script_path, "w") as f:
-            f.write(script)
+        # スクリプトが前回から変わっておらずFBXも残っているモデルは作り直さない
+        results = {}
+        hashes = {}
+        pending = []
+        for model_name, script in scripts:
+            script_hash = hashlib.sha256(script.encode("utf-8")).hexdigest()
+            if self._is_cached(model_name, script_hash):
+                logger.info(f"{model_name}モデルは変更がないため、前回のFBXを使用します")
+                results[model_name] = True
+            else:
+                hashes[model_name] = script_hash
+                pending.append((model_name, script))
+        if not pending:
+            return results
+        self._progress = [0, len(pending)]
+        
+        # モデルを順番に各グループへ振り分けて、グループごとにBlenderを並列に実行
+        workers = max(1, min(BLENDER_WORKERS, len(pending)))
+        batches = [pending[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._run_blender_batch, index, batch, hashes)
+                for index, batch in enumerate(batches)
+            ]
+            for future in futures:
+                results.update(future.result())
+        return results
+    
+    def _run_blender_batch(self, index, scripts, hashes):
+        """
+        複数のモデル作成スクリプトを1回のBlender起動で実行する
+        
+        引数:
+            index (int): グループの番号（スクリプトのファイル名に使用）
+            scripts (list): (モデル名, スクリプト)のリスト
+            hashes (dict): モデル名 -> スクリプトのSHA-256ハッシュ
+        
+        戻り値:
+            dict: モデル名 -> 作成に成功したかどうか
+        """
+        model_names = [model_name for model_name, _ in scripts]
+        script_path = os.path.join(EXPORTS_DIR, f"combined_script_{index}.py")
+        
+        # スクリプトを一時ファイルに1回で書き込んでから置き換える（書きかけのファイルを実行しない）
+        tmp_path = script_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(self._build_combined_script(scripts))
+        os.replace(tmp_path, script_path)
         
         # Blenderを起動してスクリプトを実行
-        logger.info(f"{model_name}モデルを作成しています...")
+        logger.info(f"{', '.join(model_names)}モデルを作成しています...")
+        exported = set()
+        output = deque(maxlen=BLENDER_OUTPUT_TAIL_LINES)
+        
+        def handle_progress(line):
+            # エクスポート完了の通知を受けたら進捗をログに出し、キャッシュ用のハッシュを保存する
+            event = json.loads(line)
+            model_name = event["model"]
+            exported.add(model_name)
+            with self._progress_lock:
+                self._progress[0] += 1
+                done, total = self._progress
+            logger.info(f"{model_name}モデルの作成に成功しました ({done}/{total}, {done / total:.0%})")
+            with open(os.path.join(EXPORTS_DIR, f"{model_name}.sha256"), "w") as f:
+                f.write(hashes[model_name])
+        
+        def handle_output(stream, use_marker):
+            # Blenderの出力を1行ずつ読み、デバッグログと末尾の行だけを残す
+            for line in stream:
+                if use_marker and line.startswith(EXPORTED_MARKER):
+                    handle_progress(line[len(EXPORTED_MARKER):])
+                else:
+                    logger.debug(line.rstrip())
+                    output.append(line)
+        
+        command = [
+            self.blender_path,
+            "--background",
+            "--factory-startup",
+            "--disable-autoexec",
+            "--python", script_path
+        ]
+        popen_kwargs = dict(stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+                            env={**os.environ, "PYTHONUNBUFFERED": "1"})
         try:
-            process = subprocess.Popen([
-                self.blender_path,
-                "--background",
-                "--python", script_path
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            
-            stdout, stderr = process.communicate()
-            
-            if process.returncode == 0:
-                logger.info(f"{model_name}モデルの作成に成功しました")
-                return True
+            if os.name == "posix":
+                # 進捗は専用のパイプで受け取り、標準出力はログ用のスレッドで読み続ける
+                progress_r, progress_w = os.pipe()
+                try:
+                    process = subprocess.Popen(command + ["--", str(progress_w)],
+                                               pass_fds=(progress_w,), **popen_kwargs)
+                finally:
+                    os.close(progress_w)
+                output_thread = threading.Thread(target=handle_output, args=(process.stdout, False), daemon=True)
+                output_thread.start()
+                with os.fdopen(progress_r, encoding="utf-8") as progress:
+                    for line in progress:
+                        handle_progress(line)
+                output_thread.join()
             else:
-                logger.error(f"{model_name}モデル作成中にエラーが発生しました: {stderr.decode()}")
-                return False
+                # パイプを子プロセスに渡せない環境では標準出力の通知行を使う
+                process = subprocess.Popen(command, **popen_kwargs)
+                handle_output(process.stdout, True)
+            process.wait()
         except Exception as e:
             logger.error(f"Blender実行エラー: {str(e)}")
-            return False
+            return {model_name: model_name in exported for model_name in model_names}
+        
+        if process.returncode != 0:
+            logger.error(f"モデル作成中にエラーが発生しました: {''.join(output)}")
+        
+        results = {}
+        for model_name in model_names:
+            results[model_name] = model_name in exported
+            if not results[model_name]:
+                logger.error(f"{model_name}モデルの作成に失敗しました")
+        return results
     
     def send_to_ue5(self, model_name):
         """モデルをUE5に送信する"""
@@ -545,7 +620,7 @@ print(f"パワーアップアイテムモデルを作成しました: {export_pa
             model_path = os.path.join(EXPORTS_DIR, f"{model_name}.fbx")
             
             # MCPサーバーを通じてUE5にインポートコマンドを送信
-            response = requests.post(
+            response = self.session.post(
                 f"{self.server_url}/api/unreal/execute",
                 json={
                     "command": "import_asset",
@@ -573,6 +648,74 @@ print(f"パワーアップアイテムモデルを作成しました: {export_pa
             logger.error(f"UE5送信中にエラーが発生しました: {str(e)}")
             return False
     
+    def _write_manifest(self, model_names):
+        """
+        エクスポートしたFBXとUE5でのインポート先の一覧をmanifest.jsonに書き出す
+        
+        引数:
+            model_names (list): モデル名のリスト
+        
+        戻り値:
+            list: マニフェスト（path, destinationを持つ辞書のリスト）
+        """
+        manifest = [
+            {
+                "path": os.path.join(EXPORTS_DIR, f"{model_name}.fbx"),
+                "destination": f"/Game/ShooterGame/Assets/{model_name}"
+            }
+            for model_name in model_names
+        ]
+        with open(os.path.join(EXPORTS_DIR, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return manifest
+    
+    def send_all_to_ue5(self, model_names):
+        """
+        複数のモデルを1回のimport_assetsコマンドでUE5に送信する
+        
+        import_assetsに対応していないサーバーやエラーが返された場合は、
+        モデルごとにsend_to_ue5（import_asset）で送信し直す
+        
+        引数:
+            model_names (list): モデル名のリスト
+        
+        戻り値:
+            bool: すべてのモデルを送信できた場合はTrue
+        """
+        logger.info(f"{', '.join(model_names)}をUE5に送信しています...")
+        try:
+            manifest = self._write_manifest(model_names)
+            
+            # MCPサーバーを通じてUE5に一括インポートコマンドを送信
+            response = self.session.post(
+                f"{self.server_url}/api/unreal/execute",
+                json={
+                    "command": "import_assets",
+                    "params": {
+                        "manifest": manifest
+                    }
+                }
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                status = result.get("status", "unknown")
+                
+                if status == "success":
+                    logger.info(f"{len(manifest)}個のモデルをUE5に正常に送信しました")
+                    return True
+                logger.warning(f"一括インポートに失敗しました: {result.get('message', '')}")
+            else:
+                logger.warning(f"一括インポートコマンドが失敗しました: {response.status_code}")
+        except Exception as e:
+            logger.error(f"UE5送信中にエラーが発生しました: {str(e)}")
+            return False
+        
+        # 一括インポートが使えない場合はモデルごとに送信
+        logger.info("モデルごとにUE5へ送信します")
+        results = [self.send_to_ue5(model_name) for model_name in model_names]
+        return all(results)
+    
     def create_all_models(self):
         """すべてのモデルを作成してUE5に送信する"""
         if not self.check_mcp_server():
@@ -589,10 +732,13 @@ print(f"パワーアップアイテムモデルを作成しました: {export_pa
         # パワーアップモデルを作成
         self.create_powerup()
         
-        # UE5に送信
-        for model_type, model_name in self.models.items():
-            if not self.send_to_ue5(model_name):
-                logger.warning(f"{model_name}のUE5送信に失敗しました")
+        # キューに溜まったモデル作成スクリプトをBlenderでまとめて実行
+        results = self._flush_scripts()
+        
+        # 作成できたモデルを1回のコマンドでまとめてUE5に送信
+        model_names = [model_name for model_name in self.models.values() if results.get(model_name, False)]
+        if model_names and not self.send_all_to_ue5(model_names):
+            logger.warning(f"{', '.join(model_names)}のUE5送信に失敗しました")
         
         logger.info("すべてのモデルの作成と送信が完了しました")
         return True
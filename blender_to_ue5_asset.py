@@ -10,9 +10,12 @@ BlenderからUE5へのアセット転送スクリプト
 
 使用方法:
 python blender_to_ue5_asset.py [--model MODEL_NAME] [--format FBX|OBJ|GLB]
+python blender_to_ue5_asset.py --batch MODELS_JSON
 
 例:
 python blender_to_ue5_asset.py --model Sword --format fbx
+python blender_to_ue5_asset.py --batch models.json
+  （models.json: [{"name": "Sword", "type": "sword", "format": "fbx"}, ...]）
 """
 
 import os
@@ -20,11 +23,32 @@ import sys
 import json
 import logging
 import argparse
+import atexit
+import functools
 import subprocess
 import time
+import hashlib
+import queue
+import threading
 import requests
+import shlex
 import shutil
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# JSON出力の高速化（orjsonが利用可能な場合はそちらを使用）
+try:
+    import orjson
+
+    def json_dumps_bytes(obj):
+        """オブジェクトを整形したJSONのバイト列に変換する"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def json_dumps_bytes(obj):
+        """オブジェクトを整形したJSONのバイト列に変換する"""
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 # ロギング設定
 logging.basicConfig(
@@ -37,25 +61,510 @@ logging.basicConfig(
 )
 logger = logging.getLogger("blender_to_ue5")
 
+# 設定ファイルのパス
+SETTINGS_PATH = "mcp_settings.json"
+
+# 読み込んだ設定のキャッシュ（(パス, 更新時刻, サイズ) -> 設定内容）
+_SETTINGS_CACHE = {}
+_SETTINGS_CACHE_LOCK = threading.Lock()
+
+# MCPサーバーとの通信に使い回すHTTPセッション（keep-aliveで接続を再利用し、一時的なエラーは再試行）
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                      max_retries=Retry(total=2, backoff_factor=0.1)))
+
+# サーバーが実行中と確認できた結果を使い回す秒数
+STATUS_CACHE_TTL = 2.0
+
+# サーバーステータスの確認結果のキャッシュ（確認したURL、確認した時刻、実行中かどうか）
+_STATUS_CACHE = {"url": None, "t": 0.0, "ok": False}
+
 def load_settings():
     """
     設定ファイルを読み込む
     
+    ファイルの更新時刻とサイズが前回と同じ場合は、前回読み込んだ設定を返す
+    
     戻り値:
         dict: 設定内容
     """
     try:
-        with open("mcp_settings.json", "r", encoding="utf-8") as f:
-            settings = json.load(f)
+        st = os.stat(SETTINGS_PATH)
+        key = (os.path.abspath(SETTINGS_PATH), st.st_mtime_ns, st.st_size)
+        with _SETTINGS_CACHE_LOCK:
+            settings = _SETTINGS_CACHE.get(key)
+            if settings is None:
+                with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
+                    settings = json.load(f)
+                _SETTINGS_CACHE.clear()
+                _SETTINGS_CACHE[key] = settings
         return settings
     except Exception as e:
         logger.error(f"設定ファイルの読み込みに失敗しました: {str(e)}")
         return None
 
+# Blenderスクリプトがモデルのエクスポート完了を通知する行の接頭辞
+EXPORTED_MARKER = "MCP_ASSET_EXPORTED:"
+
+# まとめて作成するときに並列で起動するBlenderの最大数
+BLENDER_WORKERS = int(os.getenv("BLENDER_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+
+# モデル作成とエクスポートの処理（作成用スクリプトと常駐用スクリプトで共通）
+_MODEL_FUNCTIONS_SCRIPT = """
+import bpy
+import json
+import os
+import sys
+import traceback
+import mathutils
+
+def create_model(model_name, model_type):
+    # 既存のオブジェクトをクリア
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    
+    # モデルタイプに応じてオブジェクトを作成
+    model_type = model_type.lower()
+    if model_type == "cube":
+        bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0))
+    elif model_type == "sphere":
+        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5, location=(0, 0, 0))
+    elif model_type == "cylinder":
+        bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=2.0, location=(0, 0, 0))
+    elif model_type == "cone":
+        bpy.ops.mesh.primitive_cone_add(radius1=0.5, radius2=0.0, depth=2.0, location=(0, 0, 0))
+    elif model_type == "torus":
+        bpy.ops.mesh.primitive_torus_add(major_radius=1.0, minor_radius=0.25, location=(0, 0, 0))
+    elif model_type == "sword":
+        # 剣を作成
+        # 刀身
+        bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0))
+        blade = bpy.context.active_object
+        blade.name = "blade"
+        blade.scale = (0.1, 0.1, 1.0)
+        
+        # ガード
+        bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, -0.8))
+        guard = bpy.context.active_object
+        guard.name = "guard"
+        guard.scale = (0.4, 0.05, 0.05)
+        
+        # グリップ
+        bpy.ops.mesh.primitive_cylinder_add(radius=0.05, depth=0.4, location=(0, 0, -1.0))
+        grip = bpy.context.active_object
+        grip.name = "grip"
+        
+        # すべて選択して結合
+        bpy.ops.object.select_all(action='SELECT')
+        bpy.ops.object.join()
+    else:
+        # デフォルトはキューブ
+        bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0))
+    
+    # 作成したオブジェクトを選択
+    obj = bpy.context.active_object
+    
+    # オブジェクト名を設定
+    obj.name = model_name
+    
+    # マテリアルを追加
+    mat = bpy.data.materials.new(name=f"{model_name}_Material")
+    mat.use_nodes = True
+    bsdf = mat.node_tree.nodes.get('Principled BSDF')
+    if bsdf:
+        bsdf.inputs['Base Color'].default_value = (0.8, 0.2, 0.2, 1.0)  # 赤っぽい色
+        bsdf.inputs['Metallic'].default_value = 0.7
+        bsdf.inputs['Roughness'].default_value = 0.2
+    
+    # オブジェクトにマテリアルを割り当て
+    if obj.data.materials:
+        obj.data.materials[0] = mat
+    else:
+        obj.data.materials.append(mat)
+    return obj
+
+# 形式ごとのエクスポート処理
+EXPORTERS = {
+    "fbx": lambda path: bpy.ops.export_scene.fbx(
+        filepath=path,
+        use_selection=True,
+        global_scale=1.0,
+        apply_unit_scale=True,
+        apply_scale_options='FBX_SCALE_NONE',
+        bake_space_transform=False,
+        object_types={'MESH', 'ARMATURE'},
+        use_mesh_modifiers=True,
+        mesh_smooth_type='OFF',
+        use_mesh_edges=False,
+        path_mode='AUTO'
+    ),
+    "obj": lambda path: bpy.ops.export_scene.obj(
+        filepath=path,
+        use_selection=True,
+        global_scale=1.0,
+        path_mode='AUTO'
+    ),
+    "glb": lambda path: bpy.ops.export_scene.gltf(
+        filepath=path,
+        export_format='GLB',
+        use_selection=True
+    ),
+}
+"""
+
+# Blenderでモデルを作成してエクスポートするスクリプト
+_CREATE_AND_EXPORT_SCRIPT = _MODEL_FUNCTIONS_SCRIPT + """
+# コマンドライン引数を取得（作成するモデルの一覧（JSON）とエクスポートディレクトリ）
+args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+specs = json.loads(args[0]) if len(args) > 0 else [{"name": "Model", "type": "cube", "format": "fbx"}]
+export_dir = args[1] if len(args) > 1 else "./exports"
+
+# 1回のBlender起動ですべてのモデルを作成・エクスポート（1つが失敗しても残りを続ける）
+failed = []
+for spec in specs:
+    model_name = spec["name"]
+    try:
+        export_format = spec.get("format", "fbx")
+        exporter = EXPORTERS[export_format]
+        create_model(model_name, spec.get("type", "cube"))
+        export_path = os.path.join(export_dir, f"{model_name}.{export_format}")
+        exporter(export_path)
+        print(f"モデル作成とエクスポート完了: {export_path}")
+        print("MCP_ASSET_EXPORTED:" + model_name, flush=True)
+    except Exception:
+        traceback.print_exc()
+        failed.append(model_name)
+
+if failed:
+    print(f"モデル作成に失敗しました: {', '.join(failed)}")
+    sys.exit(1)
+"""
+
+# 常駐するBlenderが応答を返す行の接頭辞
+RPC_RESULT_MARKER = "MCP_RPC_RESULT:"
+
+# 常駐するBlenderの応答を待つ最大秒数（超えた場合はBlenderを強制終了する）
+BLENDER_RPC_TIMEOUT = float(os.getenv("BLENDER_RPC_TIMEOUT", "300"))
+
+# 常駐するBlenderで実行するスクリプト（標準入力から1行ずつJSONの要求を受け取り、結果を1行のJSONで返す）
+_RPC_SERVER_SCRIPT = _MODEL_FUNCTIONS_SCRIPT + """
+def handle_request(request):
+    op = request.get("op")
+    if op == "ping":
+        return {"status": "success"}
+    
+    model_name = request.get("name", "Model")
+    export_format = request.get("format", "fbx").lower()
+    exporter = EXPORTERS[export_format]
+    export_path = os.path.join(request.get("export_dir", "./exports"), f"{model_name}.{export_format}")
+    
+    if op == "create_and_export":
+        # モデルを作成してエクスポート
+        create_model(model_name, request.get("type", "cube"))
+    elif op == "export":
+        # 現在のシーンをエクスポート（何も選択されていない場合は全オブジェクトを選択）
+        if not bpy.context.selected_objects:
+            bpy.ops.object.select_all(action='SELECT')
+        if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+    else:
+        raise ValueError(f"未対応の操作です: {op}")
+    
+    exporter(export_path)
+    print(f"エクスポート完了: {export_path}")
+    return {"status": "success", "path": export_path}
+
+for line in sys.stdin:
+    line = line.strip()
+    if not line:
+        continue
+    try:
+        request = json.loads(line)
+        if request.get("op") == "quit":
+            break
+        response = handle_request(request)
+    except Exception as e:
+        traceback.print_exc()
+        response = {"status": "error", "message": str(e)}
+    print("MCP_RPC_RESULT:" + json.dumps(response), flush=True)
+"""
+
+def ensure_blender_script(script_dir, name, script):
+    """
+    Blenderで実行するスクリプトをファイルとして用意する
+    
+    ファイル名に内容のハッシュを含め、同じ内容のファイルがすでにあれば書き込まずにそのまま使う
+    
+    引数:
+        script_dir (str): スクリプトを置くディレクトリ
+        name (str): スクリプト名
+        script (str): スクリプトの内容
+        
+    戻り値:
+        str: スクリプトのファイルパス
+    """
+    digest = hashlib.blake2b(script.encode("utf-8"), digest_size=8).hexdigest()
+    script_path = os.path.join(script_dir, f"{name}_{digest}.py")
+    if not os.path.exists(script_path):
+        tmp_path = f"{script_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(script)
+        os.replace(tmp_path, script_path)
+    return script_path
+
+def stage_file(src, dst):
+    """
+    ファイルをインポートディレクトリに配置する
+    
+    同じファイルシステム上ではハードリンクを作成してデータをコピーしない
+    ハードリンクが作れない場合（別ドライブなど）はファイルをコピーする
+    
+    引数:
+        src (str): 元のファイルパス
+        dst (str): 配置先のファイルパス
+    """
+    # 配置先が元のファイルそのもの（同じディレクトリやハードリンク済み）なら何もしない
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # 中間ファイルなのでメタデータはコピーせず、OSの高速なコピー（sendfileなど）を使う
+        shutil.copyfile(src, dst)
+
+@functools.lru_cache(maxsize=8)
+def resolve_blender_path(path):
+    """
+    Blenderのパスが存在するか確認する（確認できたパスは記憶して再確認しない）
+    
+    引数:
+        path (str): Blenderの実行ファイルのパス
+        
+    戻り値:
+        str: Blenderの実行ファイルのパス
+    """
+    if not path or not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return path
+
+@functools.lru_cache(maxsize=None)
+def ensure_dir(path):
+    """
+    ディレクトリを作成する（作成済みのディレクトリは記憶して再確認しない）
+    
+    引数:
+        path (str): ディレクトリのパス
+        
+    戻り値:
+        str: ディレクトリのパス
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def write_json_atomic(path, obj):
+    """
+    JSONファイルを書き込む（一時ファイルに書いてから置き換えるため、読み込み側が途中の内容を見ることはない）
+    
+    引数:
+        path (str): 書き込み先のパス
+        obj: 書き込む内容
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps_bytes(obj))
+    os.replace(tmp_path, path)
+
+def run_blender_process(cmd):
+    """
+    Blenderを実行し、出力を1行ずつログに流す（出力全体をメモリに溜めない）
+    
+    引数:
+        cmd (list): 実行するコマンド
+        
+    戻り値:
+        tuple: (終了コード, エクスポートが完了したモデル名のリスト)
+    """
+    exported = []
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in process.stdout:
+        line = line.rstrip()
+        if line.startswith(EXPORTED_MARKER):
+            exported.append(line[len(EXPORTED_MARKER):].strip())
+        logger.info("[blender] %s", line)
+    return process.wait(), exported
+
+class BlenderDaemon:
+    """
+    常駐させたBlenderにモデルの作成・エクスポートを依頼するクラス
+    
+    Blenderの起動は最初の1回だけで、以降の依頼は起動済みのBlenderで処理する
+    """
+    
+    def __init__(self, blender_path, script_path):
+        """
+        Blenderを起動する
+        
+        引数:
+            blender_path (str): Blenderの実行ファイルのパス
+            script_path (str): 常駐用スクリプトのパス
+        """
+        self.lock = threading.Lock()
+        self.proc = subprocess.Popen(
+            [blender_path, "--background", "--python", script_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1
+        )
+        
+        # 出力は別スレッドで1行ずつ読み、キューに入れる（終了時はNone）
+        self.lines = queue.Queue()
+        self.reader = threading.Thread(target=self._read_output, daemon=True)
+        self.reader.start()
+    
+    def _read_output(self):
+        """
+        Blenderの出力を読み取ってキューに入れる
+        """
+        for line in self.proc.stdout:
+            self.lines.put(line.rstrip())
+        self.lines.put(None)
+    
+    def _kill(self):
+        """
+        Blenderを強制終了する
+        """
+        self.proc.kill()
+        self.proc.wait()
+    
+    def is_alive(self):
+        """
+        Blenderが実行中かどうかを返す
+        
+        戻り値:
+            bool: 実行中かどうか
+        """
+        return self.proc.poll() is None
+    
+    def call(self, request, timeout=BLENDER_RPC_TIMEOUT):
+        """
+        Blenderに要求を送り、応答を受け取る（応答以外の出力はログに流す）
+        
+        時間内に応答がない場合はBlenderを強制終了する（次の呼び出しで起動し直す）
+        
+        引数:
+            request (dict): 要求（opと操作ごとの引数を持つ辞書）
+            timeout (float): 応答を待つ最大秒数
+            
+        戻り値:
+            dict: 応答（statusを持つ辞書）
+        """
+        with self.lock:
+            self.proc.stdin.write(json.dumps(request) + "\n")
+            self.proc.stdin.flush()
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self.lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self._kill()
+                    raise TimeoutError(f"Blenderが{timeout}秒以内に応答しなかったため終了しました")
+                if line is None:
+                    raise RuntimeError(f"Blenderが終了しました（終了コード: {self.proc.wait()}）")
+                if line.startswith(RPC_RESULT_MARKER):
+                    return json.loads(line[len(RPC_RESULT_MARKER):])
+                logger.info("[blender] %s", line)
+    
+    def close(self, timeout=10):
+        """
+        Blenderを終了する（処理中の要求が終わらない場合は強制終了する）
+        
+        引数:
+            timeout (float): 処理中の要求やBlenderの終了を待つ最大秒数
+        """
+        if not self.lock.acquire(timeout=timeout):
+            self._kill()
+            return
+        try:
+            if self.is_alive():
+                try:
+                    self.proc.stdin.write(json.dumps({"op": "quit"}) + "\n")
+                    self.proc.stdin.close()
+                    self.proc.wait(timeout=timeout)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._kill()
+        finally:
+            self.lock.release()
+
+# 起動済みの常駐Blender（(Blenderのパス, スクリプトのパス) -> BlenderDaemon）
+_DAEMONS = {}
+_DAEMONS_LOCK = threading.Lock()
+
+def get_blender_daemon(settings):
+    """
+    常駐Blenderを取得する（まだ起動していないか終了している場合は起動する）
+    
+    引数:
+        settings (dict): 設定内容
+        
+    戻り値:
+        BlenderDaemon: 常駐Blender
+    """
+    blender_path = resolve_blender_path(settings.get("blender", {}).get("path", ""))
+    script_dir = ensure_dir(settings.get("blender", {}).get("script_dir", "./blender_scripts"))
+    script_path = ensure_blender_script(script_dir, "rpc_server", _RPC_SERVER_SCRIPT)
+    
+    key = (blender_path, script_path)
+    with _DAEMONS_LOCK:
+        daemon = _DAEMONS.get(key)
+        if daemon is None or not daemon.is_alive():
+            logger.info(f"Blenderを常駐起動します: {blender_path}")
+            daemon = BlenderDaemon(blender_path, script_path)
+            _DAEMONS[key] = daemon
+    return daemon
+
+def shutdown_blender_daemons():
+    """
+    起動済みの常駐Blenderをすべて終了する
+    """
+    with _DAEMONS_LOCK:
+        daemons = list(_DAEMONS.values())
+        _DAEMONS.clear()
+    for daemon in daemons:
+        daemon.close()
+
+atexit.register(shutdown_blender_daemons)
+
+def call_blender_daemon(settings, request):
+    """
+    常駐Blenderに要求を送り、成功したかどうかを返す
+    
+    引数:
+        settings (dict): 設定内容
+        request (dict): 要求（op, name, type, formatを持つ辞書）
+        
+    戻り値:
+        bool: 成功したかどうか
+    """
+    try:
+        daemon = get_blender_daemon(settings)
+    except FileNotFoundError as e:
+        logger.error(f"Blenderパスが無効です: {e}")
+        return False
+    
+    export_dir = ensure_dir(settings.get("blender", {}).get("export_dir", "./exports"))
+    response = daemon.call(dict(request, export_dir=export_dir))
+    if response.get("status") != "success":
+        logger.error(f"Blenderでの処理に失敗しました: {response.get('message', 'Unknown error')}")
+        return False
+    return True
+
 def check_server_status(settings):
     """
     MCPサーバーのステータスを確認する
     
+    HEADリクエストで軽く確認し、実行中と確認できた結果はSTATUS_CACHE_TTL秒の間使い回す
+    
     引数:
         settings (dict): 設定内容
         
@@ -66,22 +575,37 @@ def check_server_status(settings):
         host = settings.get("server", {}).get("host", "127.0.0.1")
         port = settings.get("server", {}).get("port", 8000)
         
-        response = requests.get(f"http://{host}:{port}/api/status", timeout=5)
-        if response.status_code == 200:
-            status_data = response.json()
-            if status_data.get("status") == "running":
-                logger.info("MCPサーバーが実行中です")
-                return True
+        status_url = f"http://{host}:{port}/api/status"
+        
+        # 直前に実行中と確認できていればそのまま返す
+        if (_STATUS_CACHE["ok"] and _STATUS_CACHE["url"] == status_url
+                and time.monotonic() - _STATUS_CACHE["t"] < STATUS_CACHE_TTL):
+            return True
+        
+        # 本文を受け取らないHEADで確認（HEADに対応していないサーバーの場合のみGETで確認）
+        response = _SESSION.head(status_url, timeout=2)
+        if response.status_code == 405:
+            response = _SESSION.get(status_url, timeout=5)
+            running = response.status_code == 200 and response.json().get("status") == "running"
+        else:
+            running = 200 <= response.status_code < 300
         
+        if running:
+            _STATUS_CACHE.update(url=status_url, t=time.monotonic(), ok=True)
+            logger.info("MCPサーバーが実行中です")
+            return True
+        
+        _STATUS_CACHE["ok"] = False
         logger.error("MCPサーバーが実行されていません")
         return False
     except Exception as e:
+        _STATUS_CACHE["ok"] = False
         logger.error(f"サーバーステータス確認中にエラーが発生しました: {str(e)}")
         return False
 
 def run_blender_script(settings, model_name, export_format):
     """
-    Blenderスクリプトを実行してモデルをエクスポートする
+    常駐Blenderで現在のシーンをエクスポートする
     
     引数:
         settings (dict): 設定内容
@@ -92,98 +616,12 @@ def run_blender_script(settings, model_name, export_format):
         bool: 成功したかどうか
     """
     try:
-        # Blenderパスを取得
-        blender_path = settings.get("blender", {}).get("path", "")
-        if not blender_path or not os.path.exists(blender_path):
-            logger.error(f"Blenderパスが無効です: {blender_path}")
-            return False
-        
-        # エクスポートディレクトリを確認
-        export_dir = settings.get("blender", {}).get("export_dir", "./exports")
-        os.makedirs(export_dir, exist_ok=True)
-        
-        # Blenderスクリプトパス
-        script_dir = settings.get("blender", {}).get("script_dir", "./blender_scripts")
-        os.makedirs(script_dir, exist_ok=True)
-        
-        # 一時的なPythonスクリプトを作成
-        temp_script_path = os.path.join(script_dir, "export_model.py")
-        with open(temp_script_path, "w", encoding="utf-8") as f:
-            f.write("""
-import bpy
-import os
-import sys
-
-# コマンドライン引数を取得
-args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
-model_name = args[0] if len(args) > 0 else "Model"
-export_format = args[1] if len(args) > 1 else "fbx"
-export_dir = args[2] if len(args) > 2 else "./exports"
-
-# エクスポートパス
-export_path = os.path.join(export_dir, f"{model_name}.{export_format.lower()}")
-
-# 選択されているオブジェクトがあるか確認
-if not bpy.context.selected_objects:
-    # 何も選択されていない場合は全オブジェクトを選択
-    bpy.ops.object.select_all(action='SELECT')
-
-# オブジェクトモードに切り替え
-if bpy.context.object and bpy.context.object.mode != 'OBJECT':
-    bpy.ops.object.mode_set(mode='OBJECT')
-
-# エクスポート処理
-if export_format.lower() == "fbx":
-    bpy.ops.export_scene.fbx(
-        filepath=export_path,
-        use_selection=True,
-        global_scale=1.0,
-        apply_unit_scale=True,
-        apply_scale_options='FBX_SCALE_NONE',
-        bake_space_transform=False,
-        object_types={'MESH', 'ARMATURE'},
-        use_mesh_modifiers=True,
-        mesh_smooth_type='OFF',
-        use_mesh_edges=False,
-        path_mode='AUTO'
-    )
-elif export_format.lower() == "obj":
-    bpy.ops.export_scene.obj(
-        filepath=export_path,
-        use_selection=True,
-        global_scale=1.0,
-        path_mode='AUTO'
-    )
-elif export_format.lower() == "glb":
-    bpy.ops.export_scene.gltf(
-        filepath=export_path,
-        export_format='GLB',
-        use_selection=True
-    )
-
-print(f"エクスポート完了: {export_path}")
-            """)
-        
-        # Blenderを実行してモデルをエクスポート
-        cmd = [
-            blender_path,
-            "--background",
-            "--python", temp_script_path,
-            "--", model_name, export_format, export_dir
-        ]
-        
-        logger.info(f"Blenderコマンドを実行: {' '.join(cmd)}")
-        
-        # プロセスを実行して出力を取得
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        stdout, stderr = process.communicate()
-        
-        if process.returncode == 0:
-            logger.info(f"Blenderでのエクスポートに成功しました: {stdout}")
+        request = {"op": "export", "name": model_name, "format": export_format.lower()}
+        if call_blender_daemon(settings, request):
+            logger.info("Blenderでのエクスポートに成功しました")
             return True
-        else:
-            logger.error(f"Blenderでのエクスポートに失敗しました: {stderr}")
-            return False
+        logger.error("Blenderでのエクスポートに失敗しました")
+        return False
         
     except Exception as e:
         logger.exception(f"Blenderスクリプト実行中にエラーが発生しました: {str(e)}")
@@ -202,6 +640,8 @@ def import_to_ue5(settings, model_name, export_format):
         bool: 成功したかどうか
     """
     try:
+        fmt = export_format.lower()
+        
         # MCPサーバーのURLを取得
         host = settings.get("server", {}).get("host", "127.0.0.1")
         port = settings.get("server", {}).get("port", 8000)
@@ -209,7 +649,7 @@ def import_to_ue5(settings, model_name, export_format):
         
         # エクスポートディレクトリとファイルパスを取得
         export_dir = settings.get("blender", {}).get("export_dir", "./exports")
-        export_path = os.path.join(export_dir, f"{model_name}.{export_format.lower()}")
+        export_path = os.path.join(export_dir, f"{model_name}.{fmt}")
         
         # ファイルが存在するか確認
         if not os.path.exists(export_path):
@@ -219,7 +659,7 @@ def import_to_ue5(settings, model_name, export_format):
         # モック実装：実際のAPIが設定されていない場合はモックとして処理
         try:
             # まずはAPIを使用してUE5にインポートを試みる
-            response = requests.post(
+            response = _SESSION.post(
                 f"{server_url}/api/unreal/execute",
                 json={
                     "command": "import_asset",
@@ -250,25 +690,28 @@ def import_to_ue5(settings, model_name, export_format):
         # モックモードとして処理
         logger.info("モックモードでUE5インポートを実行します")
         
-        # エクスポートしたファイルをimportsディレクトリにコピー
+        # エクスポートしたファイルをimportsディレクトリに配置（ハードリンクまたはコピー）
         import_dir = settings.get("unreal", {}).get("import_dir", "./imports")
-        os.makedirs(import_dir, exist_ok=True)
+        ensure_dir(import_dir)
         
-        import_path = os.path.join(import_dir, f"{model_name}.{export_format.lower()}")
-        shutil.copy2(export_path, import_path)
-        
-        logger.info(f"エクスポートファイルをUE5インポートディレクトリにコピーしました: {import_path}")
+        # インポートディレクトリがエクスポートディレクトリと同じ場合はファイルをそのまま使う
+        if os.path.realpath(import_dir) == os.path.realpath(export_dir):
+            import_path = export_path
+            logger.info(f"エクスポートファイルをそのままUE5インポートに使用します: {import_path}")
+        else:
+            import_path = os.path.join(import_dir, f"{model_name}.{fmt}")
+            stage_file(export_path, import_path)
+            logger.info(f"エクスポートファイルをUE5インポートディレクトリに配置しました: {import_path}")
         
         # アセット情報ファイルを作成（UE5がインポートしたかのように）
         asset_info_path = os.path.join(import_dir, f"{model_name}_info.json")
-        with open(asset_info_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "name": model_name,
-                "type": export_format.upper(),
-                "path": f"/Game/Assets/{model_name}",
-                "import_time": time.time(),
-                "status": "imported"
-            }, f, indent=2)
+        write_json_atomic(asset_info_path, {
+            "name": model_name,
+            "type": fmt.upper(),
+            "path": f"/Game/Assets/{model_name}",
+            "import_time": time.time(),
+            "status": "imported"
+        })
         
         logger.info(f"{model_name}をUE5に正常にインポートしました（モック）")
         return True
@@ -279,7 +722,7 @@ def import_to_ue5(settings, model_name, export_format):
 
 def create_in_blender_and_export(settings, model_name, model_type, export_format):
     """
-    Blenderでモデルを作成してエクスポートする
+    常駐Blenderでモデルを作成してエクスポートする
     
     引数:
         settings (dict): 設定内容
@@ -290,158 +733,120 @@ def create_in_blender_and_export(settings, model_name, model_type, export_format
     戻り値:
         bool: 成功したかどうか
     """
+    try:
+        request = {"op": "create_and_export", "name": model_name, "type": model_type,
+                   "format": export_format.lower()}
+        if call_blender_daemon(settings, request):
+            logger.info("Blenderでのモデル作成とエクスポートに成功しました")
+            return True
+        logger.error("Blenderでのモデル作成とエクスポートに失敗しました")
+        return False
+        
+    except Exception as e:
+        logger.exception(f"Blenderでのモデル作成中にエラーが発生しました: {str(e)}")
+        return False
+
+def create_batch_in_blender_and_export(settings, specs):
+    """
+    1回のBlender起動で複数のモデルを作成してエクスポートする
+    
+    引数:
+        settings (dict): 設定内容
+        specs (list): 作成するモデルのリスト（name, type, formatを持つ辞書）
+        
+    戻り値:
+        dict: モデル名 -> 成功したかどうか
+    """
+    results = {spec["name"]: False for spec in specs}
     try:
         # Blenderパスを取得
         blender_path = settings.get("blender", {}).get("path", "")
-        if not blender_path or not os.path.exists(blender_path):
+        try:
+            blender_path = resolve_blender_path(blender_path)
+        except FileNotFoundError:
             logger.error(f"Blenderパスが無効です: {blender_path}")
-            return False
+            return results
         
         # エクスポートディレクトリを確認
         export_dir = settings.get("blender", {}).get("export_dir", "./exports")
-        os.makedirs(export_dir, exist_ok=True)
+        ensure_dir(export_dir)
         
         # Blenderスクリプトパス
         script_dir = settings.get("blender", {}).get("script_dir", "./blender_scripts")
-        os.makedirs(script_dir, exist_ok=True)
+        ensure_dir(script_dir)
         
-        # 一時的なPythonスクリプトを作成
-        temp_script_path = os.path.join(script_dir, "create_and_export.py")
-        with open(temp_script_path, "w", encoding="utf-8") as f:
-            f.write("""
-import bpy
-import os
-import sys
-import mathutils
-
-# コマンドライン引数を取得
-args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
-model_name = args[0] if len(args) > 0 else "Model"
-model_type = args[1] if len(args) > 1 else "cube"
-export_format = args[2] if len(args) > 2 else "fbx"
-export_dir = args[3] if len(args) > 3 else "./exports"
-
-# 既存のオブジェクトをクリア
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
-
-# モデルタイプに応じてオブジェクトを作成
-if model_type.lower() == "cube":
-    bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0))
-elif model_type.lower() == "sphere":
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5, location=(0, 0, 0))
-elif model_type.lower() == "cylinder":
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=2.0, location=(0, 0, 0))
-elif model_type.lower() == "cone":
-    bpy.ops.mesh.primitive_cone_add(radius1=0.5, radius2=0.0, depth=2.0, location=(0, 0, 0))
-elif model_type.lower() == "torus":
-    bpy.ops.mesh.primitive_torus_add(major_radius=1.0, minor_radius=0.25, location=(0, 0, 0))
-elif model_type.lower() == "sword":
-    # 剣を作成
-    # 刀身
-    bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0))
-    blade = bpy.context.active_object
-    blade.name = "blade"
-    blade.scale = (0.1, 0.1, 1.0)
-    
-    # ガード
-    bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, -0.8))
-    guard = bpy.context.active_object
-    guard.name = "guard"
-    guard.scale = (0.4, 0.05, 0.05)
-    
-    # グリップ
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.05, depth=0.4, location=(0, 0, -1.0))
-    grip = bpy.context.active_object
-    grip.name = "grip"
-    
-    # すべて選択して結合
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.join()
-else:
-    # デフォルトはキューブ
-    bpy.ops.mesh.primitive_cube_add(size=1.0, location=(0, 0, 0))
-
-# 作成したオブジェクトを選択
-obj = bpy.context.active_object
-
-# オブジェクト名を設定
-obj.name = model_name
-
-# マテリアルを追加
-mat = bpy.data.materials.new(name=f"{model_name}_Material")
-mat.use_nodes = True
-bsdf = mat.node_tree.nodes.get('Principled BSDF')
-if bsdf:
-    bsdf.inputs['Base Color'].default_value = (0.8, 0.2, 0.2, 1.0)  # 赤っぽい色
-    bsdf.inputs['Metallic'].default_value = 0.7
-    bsdf.inputs['Roughness'].default_value = 0.2
-
-# オブジェクトにマテリアルを割り当て
-if obj.data.materials:
-    obj.data.materials[0] = mat
-else:
-    obj.data.materials.append(mat)
-
-# エクスポートパス
-export_path = os.path.join(export_dir, f"{model_name}.{export_format.lower()}")
-
-# エクスポート処理
-if export_format.lower() == "fbx":
-    bpy.ops.export_scene.fbx(
-        filepath=export_path,
-        use_selection=True,
-        global_scale=1.0,
-        apply_unit_scale=True,
-        apply_scale_options='FBX_SCALE_NONE',
-        bake_space_transform=False,
-        object_types={'MESH', 'ARMATURE'},
-        use_mesh_modifiers=True,
-        mesh_smooth_type='OFF',
-        use_mesh_edges=False,
-        path_mode='AUTO'
-    )
-elif export_format.lower() == "obj":
-    bpy.ops.export_scene.obj(
-        filepath=export_path,
-        use_selection=True,
-        global_scale=1.0,
-        path_mode='AUTO'
-    )
-elif export_format.lower() == "glb":
-    bpy.ops.export_scene.gltf(
-        filepath=export_path,
-        export_format='GLB',
-        use_selection=True
-    )
-
-print(f"モデル作成とエクスポート完了: {export_path}")
-            """)
+        # Blenderで実行するスクリプトを用意
+        temp_script_path = ensure_blender_script(script_dir, "create_and_export", _CREATE_AND_EXPORT_SCRIPT)
+        
+        # エクスポート形式は小文字にそろえて渡す
+        specs = [dict(spec, format=spec.get("format", "fbx").lower()) for spec in specs]
         
         # Blenderを実行してモデルを作成・エクスポート
         cmd = [
             blender_path,
             "--background",
             "--python", temp_script_path,
-            "--", model_name, model_type, export_format, export_dir
+            "--", json.dumps(specs), export_dir
         ]
         
-        logger.info(f"Blenderコマンドを実行: {' '.join(cmd)}")
+        # コマンド文字列はログに出力される場合だけ組み立てる
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Blenderコマンドを実行: %s", shlex.join(cmd))
         
-        # プロセスを実行して出力を取得
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        stdout, stderr = process.communicate()
+        # プロセスを実行して出力をログに流し、エクスポートが完了したモデルを確認
+        returncode, exported = run_blender_process(cmd)
+        for model_name in exported:
+            results[model_name] = True
         
-        if process.returncode == 0:
-            logger.info(f"Blenderでのモデル作成とエクスポートに成功しました: {stdout}")
-            return True
+        if returncode == 0:
+            logger.info("Blenderでのモデル作成とエクスポートに成功しました")
         else:
-            logger.error(f"Blenderでのモデル作成とエクスポートに失敗しました: {stderr}")
-            return False
+            logger.error(f"Blenderでのモデル作成とエクスポートに失敗しました（終了コード: {returncode}）")
+        return results
         
     except Exception as e:
         logger.exception(f"Blenderでのモデル作成中にエラーが発生しました: {str(e)}")
-        return False
+        return results
+
+def run_batch(settings, specs):
+    """
+    複数のモデルをBlenderでまとめて作成し、UE5にインポートする
+    
+    引数:
+        settings (dict): 設定内容
+        specs (list): 作成するモデルのリスト（name, type, formatを持つ辞書）
+        
+    戻り値:
+        int: 終了コード
+    """
+    # モデルをグループに分け、グループごとにBlenderを並列に起動して作成・エクスポート
+    workers = max(1, min(BLENDER_WORKERS, len(specs)))
+    groups = [specs[i::workers] for i in range(workers)]
+    print(f"\n1. Blenderでモデルをまとめて作成してエクスポート中...（並列数: {workers}）")
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for group_results in executor.map(lambda group: create_batch_in_blender_and_export(settings, group), groups):
+            results.update(group_results)
+    
+    print("\n2. UE5にモデルをインポート中...")
+    failed = []
+    for spec in specs:
+        model_name = spec["name"]
+        if not results.get(model_name):
+            logger.error(f"Blenderでのモデル作成に失敗しました: {model_name}")
+            failed.append(model_name)
+        elif not import_to_ue5(settings, model_name, spec.get("format", "fbx")):
+            logger.error(f"UE5へのインポートに失敗しました: {model_name}")
+            failed.append(model_name)
+    
+    if failed:
+        print(f"\n✗ 失敗したモデル: {', '.join(failed)}")
+        return 1
+    
+    print("\n✓ 完了！")
+    for spec in specs:
+        print(f"/Game/Assets/{spec['name']}")
+    return 0
 
 def main():
     """
@@ -453,6 +858,7 @@ def main():
                         help="作成するモデルタイプ（指定した場合、Blenderでモデルを作成します）")
     parser.add_argument("--format", default="fbx", choices=["fbx", "obj", "glb"], help="エクスポート形式")
     parser.add_argument("--create", action="store_true", help="新しいモデルを作成する（既存モデルを使用しない）")
+    parser.add_argument("--batch", help="まとめて作成するモデルの一覧（name, type, formatを持つオブジェクトのJSON配列）のファイル")
     
     args = parser.parse_args()
     
@@ -467,6 +873,13 @@ def main():
         logger.error("MCPサーバーが実行されていません。先に `python run_mcp.py all` を実行してください。")
         return 1
     
+    # 一覧ファイルが指定された場合は1回のBlender起動でまとめて作成
+    if args.batch:
+        with open(args.batch, "r", encoding="utf-8") as f:
+            specs = json.load(f)
+        print(f"\n==== Blender to UE5 アセット転送（{len(specs)}個のモデル） ====")
+        return run_batch(settings, specs)
+    
     # 処理開始
     print(f"\n==== Blender to UE5 アセット転送 ====")
     print(f"モデル名: {args.model}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Blenderスクリプト共通処理モジュール
+
+このモジュールは、Blender内で実行するスクリプト（blender_integration.py、
+blender_direct_script.py）が共通で使うマテリアル作成と更新抑制の処理を提供します。
+
+主な機能:
+- Principled BSDFマテリアルのテンプレート作成と入力ソケットのインデックス解決
+- 作成済みマテリアルのキャッシュ
+- まとめてオブジェクトを作成する間のビューレイヤー更新の抑制
+
+制限事項:
+- BlenderのPythonインタプリタから読み込む必要があります（bpyを使用）
+- 読み込む側のスクリプトと同じディレクトリに置いてください
+"""
+
+import bpy
+from contextlib import contextmanager
+
+# マテリアルのテンプレート（Principled BSDFのノードツリーを1度だけ構築して複製する）
+_TEMPLATE_MAT = None
+_SOCKET_INDEX = {}  # Principled BSDFの入力名 -> インデックス（テンプレート作成時に1度だけ解決）
+
+# 作成済みマテリアルのキャッシュ（名前と設定値が同じマテリアルは作り直さずに再利用する）
+MATERIAL_CACHE = {}
+
+# Blender 4.0で名前が変更された入力の対応表
+SOCKET_ALIASES = {
+    "Specular": "Specular IOR Level",
+    "Transmission": "Transmission Weight",
+}
+
+def get_template():
+    """
+    Principled BSDFマテリアルのテンプレートを取得する（未作成・削除済みの場合は作成）
+    """
+    global _TEMPLATE_MAT
+    try:
+        if _TEMPLATE_MAT is not None and _TEMPLATE_MAT.name in bpy.data.materials:
+            return _TEMPLATE_MAT
+    except ReferenceError:
+        # シーンのクリアなどでテンプレートが削除された場合
+        pass
+    _TEMPLATE_MAT = bpy.data.materials.new(name="MCPTemplateMaterial")
+    _TEMPLATE_MAT.use_nodes = True
+    
+    # 入力ソケットのインデックスを解決（名前による線形探索を毎回行わないため）
+    _SOCKET_INDEX.clear()
+    bsdf = _TEMPLATE_MAT.node_tree.nodes.get('Principled BSDF')
+    if bsdf:
+        for index, socket in enumerate(bsdf.inputs):
+            _SOCKET_INDEX.setdefault(socket.name, index)
+        for old_name, new_name in SOCKET_ALIASES.items():
+            if old_name not in _SOCKET_INDEX and new_name in _SOCKET_INDEX:
+                _SOCKET_INDEX[old_name] = _SOCKET_INDEX[new_name]
+    return _TEMPLATE_MAT
+
+def set_bsdf_inputs(bsdf, inputs):
+    """
+    キャッシュしたインデックスでPrincipled BSDFの入力値を設定する
+    
+    引数:
+        bsdf (bpy.types.ShaderNode): Principled BSDFノード
+        inputs (dict): 入力名と値
+    """
+    sockets = bsdf.inputs
+    for input_name, value in inputs.items():
+        index = _SOCKET_INDEX.get(input_name)
+        if index is not None:
+            sockets[index].default_value = value
+
+def cached_material(key):
+    """
+    キャッシュからマテリアルを取得する（シーンのクリアなどで削除済みの場合はNone）
+    
+    引数:
+        key (tuple): キャッシュのキー
+    """
+    material = MATERIAL_CACHE.get(key)
+    if material is None:
+        return None
+    try:
+        if material.name in bpy.data.materials:
+            return material
+    except ReferenceError:
+        pass
+    del MATERIAL_CACHE[key]
+    return None
+
+@contextmanager
+def deferred_updates():
+    """
+    まとめてオブジェクトを作成する間、UIのロックで再描画を抑え、最後に1度だけビューレイヤーを更新する
+    """
+    scene = bpy.context.scene
+    window = bpy.context.window
+    use_lock_interface = scene.render.use_lock_interface
+    scene.render.use_lock_interface = True
+    if window:
+        window.cursor_set('WAIT')
+    try:
+        yield
+    finally:
+        scene.render.use_lock_interface = use_lock_interface
+        if window:
+            window.cursor_set('DEFAULT')
+        bpy.context.view_layer.update()
@@ -11,6 +11,7 @@ UE5エディタ内の基本的なブループリントを作成するスクリ
   python create_basic_blueprints.py
 """
 
+import json
 import logging
 from ue5_mcp_client import UE5MCPClient
 
@@ -21,199 +22,156 @@ logging.basicConfig(
 )
 logger = logging.getLogger("create_basic_blueprints")
 
-def create_player_blueprint():
-    """プレイヤーのブループリントを作成する"""
-    logger.info("プレイヤーのブループリントを作成します...")
-    
-    client = UE5MCPClient(host="127.0.0.1", port=8080)
-    
-    script = """
-import unreal
-
-# ブループリントを作成
-bp_path = "/Game/ShooterGame/Blueprints/BP_PlayerShip"
-bp_name = "BP_PlayerShip"
-bp_location = "/Game/ShooterGame/Blueprints"
-
-# ファクトリーを準備
-factory = unreal.BlueprintFactory()
-factory.parent_class = unreal.Pawn
+# まとめたスクリプトが各スクリプトの結果を出力する行の接頭辞
+RESULT_MARKER = "MCP_BLUEPRINT_RESULTS:"
 
-# アセットツールを取得
-asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+# MCPサーバーのクライアント（HTTPセッションを使い回すため1つだけ作成する）
+_client = None
 
-# ブループリントが存在するか確認
-if unreal.EditorAssetLibrary.does_asset_exist(bp_path):
-    print(f"ブループリントはすでに存在します: {bp_path}")
-    blueprint = unreal.EditorAssetLibrary.load_asset(bp_path)
-else:
-    # 新規作成
-    blueprint = asset_tools.create_asset(bp_name, bp_location, unreal.Blueprint, factory)
-    print(f"新しいブループリントを作成しました: {bp_path}")
-
-# コンポーネントを追加
-with unreal.ScopedEditorTransaction("Setup Player Blueprint") as trans:
-    # Static Meshコンポーネントを追加
-    mesh_component = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.StaticMeshComponent)
-    mesh_component.set_editor_property("collision_enabled", unreal.CollisionEnabled.QUERY_AND_PHYSICS)
-    
-    # 移動コンポーネントを追加
-    movement = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.FloatingPawnMovement)
-    movement.set_editor_property("max_speed", 1000.0)
-    
-    # カメラコンポーネントを追加
-    camera = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.CameraComponent)
-    camera.set_editor_property("relative_location", unreal.Vector(0, 0, 100))
-    camera.set_editor_property("relative_rotation", unreal.Rotator(-20, 0, 0))
-    
-    # 発射装置コンポーネントを追加
-    spawn_point = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.SceneComponent)
-    spawn_point.set_editor_property("component_name", "ProjectileSpawnPoint")
-    spawn_point.set_editor_property("relative_location", unreal.Vector(100, 0, 0))
-    
-    # コンパイル・保存
-    unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+def get_client():
+    """MCPサーバーのクライアントを取得する（初回呼び出し時に作成）"""
+    global _client
+    if _client is None:
+        _client = UE5MCPClient(host="127.0.0.1", port=8080)
+    return _client
 
-print(f"プレイヤーブループリントの設定が完了しました: {bp_path}")
-"""
-    
-    result = client.execute_unreal_command("execute_python", {"script": script})
-    
-    if result.get("status") == "success":
-        logger.info("プレイヤーブループリントの作成に成功しました")
-    else:
-        logger.error(f"プレイヤーブループリントの作成に失敗しました: {result}")
-    
-    return result
+# ブループリントの作成先
+BLUEPRINT_LOCATION = "/Game/ShooterGame/Blueprints"
 
-def create_enemy_blueprint():
-    """敵のブループリントを作成する"""
-    logger.info("敵のブループリントを作成します...")
-    
-    client = UE5MCPClient(host="127.0.0.1", port=8080)
-    
-    script = """
+# まとめたスクリプトの先頭で1回だけ定義する、ブループリント作成の共通処理
+_BLUEPRINT_HELPERS_SCRIPT = """
+import json
 import unreal
 
-# ブループリントを作成
-bp_path = "/Game/ShooterGame/Blueprints/BP_EnemyShip"
-bp_name = "BP_EnemyShip"
-bp_location = "/Game/ShooterGame/Blueprints"
-
-# ファクトリーを準備
-factory = unreal.BlueprintFactory()
-factory.parent_class = unreal.Pawn
-
-# アセットツールを取得
-asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-
-# ブループリントが存在するか確認
-if unreal.EditorAssetLibrary.does_asset_exist(bp_path):
-    print(f"ブループリントはすでに存在します: {bp_path}")
-    blueprint = unreal.EditorAssetLibrary.load_asset(bp_path)
-else:
-    # 新規作成
+def to_unreal(value):
+    # {"Vector": [x, y, z]} などの指定をUE5の値に変換する（{"enum": "列挙型.値"}は列挙値）
+    if isinstance(value, dict):
+        (kind, arg), = value.items()
+        if kind == "enum":
+            enum_name, member = arg.split(".")
+            return getattr(getattr(unreal, enum_name), member)
+        return getattr(unreal, kind)(*arg)
+    return value
+
+def find_or_create_blueprint(bp_name, bp_location, parent_class):
+    bp_path = f"{bp_location}/{bp_name}"
+    
+    # ブループリントが存在するか確認
+    if unreal.EditorAssetLibrary.does_asset_exist(bp_path):
+        print(f"ブループリントはすでに存在します: {bp_path}")
+        return unreal.EditorAssetLibrary.load_asset(bp_path)
+    
+    # ファクトリーを準備して新規作成
+    factory = unreal.BlueprintFactory()
+    factory.parent_class = parent_class
+    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
     blueprint = asset_tools.create_asset(bp_name, bp_location, unreal.Blueprint, factory)
     print(f"新しいブループリントを作成しました: {bp_path}")
-
-# コンポーネントを追加
-with unreal.ScopedEditorTransaction("Setup Enemy Blueprint") as trans:
-    # Static Meshコンポーネントを追加
-    mesh_component = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.StaticMeshComponent)
-    mesh_component.set_editor_property("collision_enabled", unreal.CollisionEnabled.QUERY_AND_PHYSICS)
-    
-    # 移動コンポーネントを追加
-    movement = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.FloatingPawnMovement)
-    movement.set_editor_property("max_speed", 500.0)
-    
-    # 発射装置コンポーネントを追加
-    spawn_point = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.SceneComponent)
-    spawn_point.set_editor_property("component_name", "ProjectileSpawnPoint")
-    spawn_point.set_editor_property("relative_location", unreal.Vector(100, 0, 0))
+    return blueprint
+
+def create_blueprint(spec):
+    bp_path = f"{spec['location']}/{spec['name']}"
+    blueprint = find_or_create_blueprint(spec["name"], spec["location"], getattr(unreal, spec["parent"]))
+    
+    # コンポーネントを追加
+    with unreal.ScopedEditorTransaction(spec["transaction"]) as trans:
+        for component in spec["components"]:
+            added = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, getattr(unreal, component["type"]))
+            for name, value in component.get("properties", {}).items():
+                added.set_editor_property(name, to_unreal(value))
+        
+        # コンパイル・保存
+        unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
     
-    # コンパイル・保存
-    unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
-
-print(f"敵ブループリントの設定が完了しました: {bp_path}")
+    print(f"{spec['label']}ブループリントの設定が完了しました: {bp_path}")
+    return blueprint
 """
-    
-    result = client.execute_unreal_command("execute_python", {"script": script})
-    
-    if result.get("status") == "success":
-        logger.info("敵ブループリントの作成に成功しました")
-    else:
-        logger.error(f"敵ブループリントの作成に失敗しました: {result}")
-    
-    return result
-
-def create_projectile_blueprint():
-    """弾丸のブループリントを作成する"""
-    logger.info("弾丸のブループリントを作成します...")
-    
-    client = UE5MCPClient(host="127.0.0.1", port=8080)
-    
-    script = """
-import unreal
-
-# ブループリントを作成
-bp_path = "/Game/ShooterGame/Blueprints/BP_Projectile"
-bp_name = "BP_Projectile"
-bp_location = "/Game/ShooterGame/Blueprints"
-
-# ファクトリーを準備
-factory = unreal.BlueprintFactory()
-factory.parent_class = unreal.Actor
 
-# アセットツールを取得
-asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+# プレイヤーのブループリント
+PLAYER_BLUEPRINT_SPEC = {
+    "name": "BP_PlayerShip",
+    "location": BLUEPRINT_LOCATION,
+    "parent": "Pawn",
+    "label": "プレイヤー",
+    "transaction": "Setup Player Blueprint",
+    "components": [
+        {"type": "StaticMeshComponent",
+         "properties": {"collision_enabled": {"enum": "CollisionEnabled.QUERY_AND_PHYSICS"}}},
+        {"type": "FloatingPawnMovement",
+         "properties": {"max_speed": 1000.0}},
+        {"type": "CameraComponent",
+         "properties": {"relative_location": {"Vector": [0, 0, 100]},
+                        "relative_rotation": {"Rotator": [-20, 0, 0]}}},
+        {"type": "SceneComponent",
+         "properties": {"component_name": "ProjectileSpawnPoint",
+                        "relative_location": {"Vector": [100, 0, 0]}}},
+    ],
+}
+
+# 敵のブループリント
+ENEMY_BLUEPRINT_SPEC = {
+    "name": "BP_EnemyShip",
+    "location": BLUEPRINT_LOCATION,
+    "parent": "Pawn",
+    "label": "敵",
+    "transaction": "Setup Enemy Blueprint",
+    "components": [
+        {"type": "StaticMeshComponent",
+         "properties": {"collision_enabled": {"enum": "CollisionEnabled.QUERY_AND_PHYSICS"}}},
+        {"type": "FloatingPawnMovement",
+         "properties": {"max_speed": 500.0}},
+        {"type": "SceneComponent",
+         "properties": {"component_name": "ProjectileSpawnPoint",
+                        "relative_location": {"Vector": [100, 0, 0]}}},
+    ],
+}
+
+# 弾丸のブループリント
+PROJECTILE_BLUEPRINT_SPEC = {
+    "name": "BP_Projectile",
+    "location": BLUEPRINT_LOCATION,
+    "parent": "Actor",
+    "label": "弾丸",
+    "transaction": "Setup Projectile Blueprint",
+    "components": [
+        {"type": "StaticMeshComponent",
+         "properties": {"collision_enabled": {"enum": "CollisionEnabled.QUERY_AND_PHYSICS"}}},
+        {"type": "SphereComponent",
+         "properties": {"sphere_radius": 30.0,
+                        "collision_enabled": {"enum": "CollisionEnabled.QUERY_ONLY"}}},
+        {"type": "ProjectileMovementComponent",
+         "properties": {"initial_speed": 2000.0,
+                        "max_speed": 2000.0,
+                        "projectile_gravity_scale": 0.0}},
+    ],
+}
+
+def blueprint_script(spec):
+    """
+    共通処理を使ってブループリントを作成するUE5 Pythonスクリプトを返す
+    
+    引数:
+        spec (dict): ブループリントの指定（name, location, parent, label, transaction, components）
+    
+    戻り値:
+        str: スクリプト（build_combined_scriptでまとめて実行する）
+    """
+    return f"create_blueprint(json.loads({json.dumps(spec)!r}))\n"
 
-# ブループリントが存在するか確認
-if unreal.EditorAssetLibrary.does_asset_exist(bp_path):
-    print(f"ブループリントはすでに存在します: {bp_path}")
-    blueprint = unreal.EditorAssetLibrary.load_asset(bp_path)
-else:
-    # 新規作成
-    blueprint = asset_tools.create_asset(bp_name, bp_location, unreal.Blueprint, factory)
-    print(f"新しいブループリントを作成しました: {bp_path}")
+def create_player_blueprint():
+    """プレイヤーのブループリントを作成するUE5 Pythonスクリプトを返す"""
+    return blueprint_script(PLAYER_BLUEPRINT_SPEC)
 
-# コンポーネントを追加
-with unreal.ScopedEditorTransaction("Setup Projectile Blueprint") as trans:
-    # Static Meshコンポーネントを追加
-    mesh_component = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.StaticMeshComponent)
-    mesh_component.set_editor_property("collision_enabled", unreal.CollisionEnabled.QUERY_AND_PHYSICS)
-    
-    # 球体コリジョンを追加
-    collision = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.SphereComponent)
-    collision.set_editor_property("sphere_radius", 30.0)
-    collision.set_editor_property("collision_enabled", unreal.CollisionEnabled.QUERY_ONLY)
-    
-    # 移動コンポーネントを追加
-    movement = unreal.EditorUtilityLibrary.add_component_to_blueprint(blueprint, unreal.ProjectileMovementComponent)
-    movement.set_editor_property("initial_speed", 2000.0)
-    movement.set_editor_property("max_speed", 2000.0)
-    movement.set_editor_property("projectile_gravity_scale", 0.0)
-    
-    # コンパイル・保存
-    unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+def create_enemy_blueprint():
+    """敵のブループリントを作成するUE5 Pythonスクリプトを返す"""
+    return blueprint_script(ENEMY_BLUEPRINT_SPEC)
 
-print(f"弾丸ブループリントの設定が完了しました: {bp_path}")
-"""
-    
-    result = client.execute_unreal_command("execute_python", {"script": script})
-    
-    if result.get("status") == "success":
-        logger.info("弾丸ブループリントの作成に成功しました")
-    else:
-        logger.error(f"弾丸ブループリントの作成に失敗しました: {result}")
-    
-    return result
+def create_projectile_blueprint():
+    """弾丸のブループリントを作成するUE5 Pythonスクリプトを返す"""
+    return blueprint_script(PROJECTILE_BLUEPRINT_SPEC)
 
 def create_game_mode_blueprint():
-    """ゲームモードのブループリントを作成する"""
-    logger.info("ゲームモードのブループリントを作成します...")
-    
-    client = UE5MCPClient(host="127.0.0.1", port=8080)
-    
+    """ゲームモードのブループリントを作成するUE5 Pythonスクリプトを返す"""
     script = """
 import unreal
 
@@ -223,21 +181,8 @@ bp_name = "BP_ShooterGameMode"
 bp_location = "/Game/ShooterGame/Blueprints"
 player_bp_path = "/Game/ShooterGame/Blueprints/BP_PlayerShip"
 
-# ファクトリーを準備
-factory = unreal.BlueprintFactory()
-factory.parent_class = unreal.GameModeBase
-
-# アセットツールを取得
-asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-
-# ブループリントが存在するか確認
-if unreal.EditorAssetLibrary.does_asset_exist(bp_path):
-    print(f"ブループリントはすでに存在します: {bp_path}")
-    blueprint = unreal.EditorAssetLibrary.load_asset(bp_path)
-else:
-    # 新規作成
-    blueprint = asset_tools.create_asset(bp_name, bp_location, unreal.Blueprint, factory)
-    print(f"新しいブループリントを作成しました: {bp_path}")
+# ブループリントを取得（存在しない場合は作成）
+blueprint = find_or_create_blueprint(bp_name, bp_location, unreal.GameModeBase)
 
 # デフォルトポーンクラスを設定
 if unreal.EditorAssetLibrary.does_asset_exist(player_bp_path):
@@ -264,21 +209,10 @@ except:
 print(f"ゲームモードブループリントの設定が完了しました: {bp_path}")
 """
     
-    result = client.execute_unreal_command("execute_python", {"script": script})
-    
-    if result.get("status") == "success":
-        logger.info("ゲームモードブループリントの作成に成功しました")
-    else:
-        logger.error(f"ゲームモードブループリントの作成に失敗しました: {result}")
-    
-    return result
+    return script
 
 def create_game_level():
-    """ゲームレベルを作成する"""
-    logger.info("ゲームレベルを作成します...")
-    
-    client = UE5MCPClient(host="127.0.0.1", port=8080)
-    
+    """ゲームレベルを作成するUE5 Pythonスクリプトを返す"""
     script = """
 import unreal
 
@@ -293,6 +227,11 @@ game_mode_bp_path = "/Game/ShooterGame/Blueprints/BP_ShooterGameMode"
 # レベルサブシステムを取得
 level_subsystem = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
 
+def batch_spawn(actor_class, transforms):
+    # 同じクラスのアクターを(位置, 回転)のリストどおりにまとめて配置する
+    spawn = unreal.EditorLevelLibrary.spawn_actor_from_class
+    return [spawn(actor_class, location, rotation) for location, rotation in transforms]
+
 try:
     # 既存のレベルを閉じる
     level_subsystem.new_level(full_level_path)
@@ -311,105 +250,159 @@ except Exception as e:
         print(f"既存レベルを開く際にエラーが発生しました: {e2}")
         exit(1)
 
-# レベルを保存
-try:
-    level_subsystem.save_current_level()
-    print("レベルを保存しました")
-except Exception as e:
-    print(f"レベル保存中にエラーが発生しました: {e}")
-
-# プレイヤーを配置
+# アクターとゲームモードを設定し、最後に1回だけレベルを保存する
+# （途中でエラーが発生しても、それまでの変更は保存する）
 try:
-    if unreal.EditorAssetLibrary.does_asset_exist(player_bp_path):
-        player_class = unreal.EditorAssetLibrary.load_blueprint_class(player_bp_path)
-        player_location = unreal.Vector(0, 0, 100)
-        player_rotation = unreal.Rotator(0, 0, 0)
-        player_actor = unreal.EditorLevelLibrary.spawn_actor_from_class(player_class, player_location, player_rotation)
-        print(f"プレイヤーを配置しました: {player_bp_path}")
-    else:
-        print(f"プレイヤーブループリントが見つかりません: {player_bp_path}")
-except Exception as e:
-    print(f"プレイヤー配置中にエラーが発生しました: {e}")
-
-# 敵を配置
-try:
-    if unreal.EditorAssetLibrary.does_asset_exist(enemy_bp_path):
-        enemy_class = unreal.EditorAssetLibrary.load_blueprint_class(enemy_bp_path)
-        
-        # 複数の敵を配置
-        enemy_positions = [
-            unreal.Vector(500, 200, 100),
-            unreal.Vector(500, -200, 100),
-            unreal.Vector(700, 0, 100),
-            unreal.Vector(900, 300, 100),
-            unreal.Vector(900, -300, 100)
-        ]
-        
-        for pos in enemy_positions:
+    # プレイヤーを配置
+    try:
+        if unreal.EditorAssetLibrary.does_asset_exist(player_bp_path):
+            player_class = unreal.EditorAssetLibrary.load_blueprint_class(player_bp_path)
+            player_location = unreal.Vector(0, 0, 100)
+            player_rotation = unreal.Rotator(0, 0, 0)
+            player_actor = unreal.EditorLevelLibrary.spawn_actor_from_class(player_class, player_location, player_rotation)
+            print(f"プレイヤーを配置しました: {player_bp_path}")
+        else:
+            print(f"プレイヤーブループリントが見つかりません: {player_bp_path}")
+    except Exception as e:
+        print(f"プレイヤー配置中にエラーが発生しました: {e}")
+    
+    # 敵を配置
+    try:
+        if unreal.EditorAssetLibrary.does_asset_exist(enemy_bp_path):
+            enemy_class = unreal.EditorAssetLibrary.load_blueprint_class(enemy_bp_path)
+            
+            # 複数の敵をまとめて配置
             enemy_rotation = unreal.Rotator(0, 180, 0)
-            enemy_actor = unreal.EditorLevelLibrary.spawn_actor_from_class(enemy_class, pos, enemy_rotation)
-        print(f"敵を配置しました: {enemy_bp_path}")
-    else:
-        print(f"敵ブループリントが見つかりません: {enemy_bp_path}")
-except Exception as e:
-    print(f"敵配置中にエラーが発生しました: {e}")
-
-# レベルを保存
-try:
-    level_subsystem.save_current_level()
-    print("レベルの変更を保存しました")
-except Exception as e:
-    print(f"変更保存中にエラーが発生しました: {e}")
-
-# ゲームモードを設定
-try:
-    if unreal.EditorAssetLibrary.does_asset_exist(game_mode_bp_path):
-        game_mode_class = unreal.EditorAssetLibrary.load_blueprint_class(game_mode_bp_path)
-        
-        # レベルのゲームモードを設定
-        with unreal.ScopedEditorTransaction("Set Level GameMode") as trans:
-            world_settings = unreal.EditorLevelLibrary.get_game_mode_settings_for_current_level()
-            if world_settings:
-                world_settings.set_editor_property("game_mode_override", game_mode_class)
-        print(f"ゲームモードを設定しました: {game_mode_bp_path}")
-    else:
-        print(f"ゲームモードブループリントが見つかりません: {game_mode_bp_path}")
-except Exception as e:
-    print(f"ゲームモード設定中にエラーが発生しました: {e}")
-
-# 最終的なレベル保存
-try:
-    level_subsystem.save_current_level()
-    print("最終レベル変更を保存しました")
-except Exception as e:
-    print(f"最終保存中にエラーが発生しました: {e}")
+            enemy_transforms = [
+                (unreal.Vector(x, y, 100), enemy_rotation)
+                for x, y in ((500, 200), (500, -200), (700, 0), (900, 300), (900, -300))
+            ]
+            enemy_actors = batch_spawn(enemy_class, enemy_transforms)
+            print(f"敵を配置しました: {enemy_bp_path}（{len(enemy_actors)}体）")
+        else:
+            print(f"敵ブループリントが見つかりません: {enemy_bp_path}")
+    except Exception as e:
+        print(f"敵配置中にエラーが発生しました: {e}")
+    
+    # ゲームモードを設定
+    try:
+        if unreal.EditorAssetLibrary.does_asset_exist(game_mode_bp_path):
+            game_mode_class = unreal.EditorAssetLibrary.load_blueprint_class(game_mode_bp_path)
+            
+            # レベルのゲームモードを設定
+            with unreal.ScopedEditorTransaction("Set Level GameMode") as trans:
+                world_settings = unreal.EditorLevelLibrary.get_game_mode_settings_for_current_level()
+                if world_settings:
+                    world_settings.set_editor_property("game_mode_override", game_mode_class)
+            print(f"ゲームモードを設定しました: {game_mode_bp_path}")
+        else:
+            print(f"ゲームモードブループリントが見つかりません: {game_mode_bp_path}")
+    except Exception as e:
+        print(f"ゲームモード設定中にエラーが発生しました: {e}")
+finally:
+    try:
+        level_subsystem.save_current_level()
+        print("レベルを保存しました")
+    except Exception as e:
+        print(f"レベル保存中にエラーが発生しました: {e}")
 
 print("ゲームレベルの作成が完了しました")
 """
     
-    result = client.execute_unreal_command("execute_python", {"script": script})
-    
-    if result.get("status") == "success":
-        logger.info("ゲームレベルの作成に成功しました")
-    else:
-        logger.error(f"ゲームレベルの作成に失敗しました: {result}")
-    
-    return result
+    return script
+
+def build_combined_script(steps, helpers_script=_BLUEPRINT_HELPERS_SCRIPT):
+    """
+    複数のUE5 Pythonスクリプトを1回のexecute_pythonで実行できるようにまとめる
+    
+    共通処理（helpers_script）は最初に1回だけ実行し、その定義を各スクリプトから使えるようにする
+    各スクリプトは独立した名前空間で実行し、1つが失敗しても残りの処理を続ける
+    最後に各スクリプトの結果をRESULT_MARKERに続くJSONとして出力する
+    
+    引数:
+        steps (list): (キー, スクリプト)のリスト
+        helpers_script (str): 各スクリプトから使う共通処理
+    
+    戻り値:
+        str: まとめたスクリプト
+    """
+    lines = [
+        "import json",
+        "import traceback",
+        "import unreal",
+        "",
+        "results = {}",
+        "helpers = {'__name__': '__main__'}",
+        f"exec(compile({helpers_script!r}, 'helpers', 'exec'), helpers)",
+    ]
+    for key, script in steps:
+        lines += [
+            "",
+            f"# {key}",
+            "try:",
+            f"    exec(compile({script!r}, {key!r}, 'exec'), dict(helpers))",
+            f"    results[{key!r}] = 'success'",
+            "except (Exception, SystemExit) as e:",
+            "    traceback.print_exc()",
+            f"    results[{key!r}] = f'error: {{e}}'",
+        ]
+    lines += [
+        "",
+        f"print({RESULT_MARKER!r} + json.dumps(results))",
+        "",
+    ]
+    return "\n".join(lines)
+
+def parse_step_results(result):
+    """
+    まとめたスクリプトの出力から各スクリプトの結果を取り出す
+    
+    引数:
+        result (dict): execute_unreal_commandの戻り値
+    
+    戻り値:
+        dict: キー -> 結果（出力に結果が含まれていない場合はNone）
+    """
+    outputs = [result.get("output")]
+    if isinstance(result.get("result"), dict):
+        outputs.append(result["result"].get("output"))
+    for output in outputs:
+        if not isinstance(output, str):
+            continue
+        for line in output.splitlines():
+            if line.startswith(RESULT_MARKER):
+                return json.loads(line[len(RESULT_MARKER):])
+    return None
 
 def main():
     """メイン実行関数"""
     logger.info("===== 基本的なブループリントの作成を開始します =====")
     
-    # ブループリントの作成
-    create_player_blueprint()
-    create_enemy_blueprint()
-    create_projectile_blueprint()
-    create_game_mode_blueprint()
-    
-    # ゲームレベルの作成
-    create_game_level()
+    # ブループリントとゲームレベルの作成スクリプトを順番どおりにまとめる
+    steps = [
+        ("player", "プレイヤーブループリント", create_player_blueprint()),
+        ("enemy", "敵ブループリント", create_enemy_blueprint()),
+        ("projectile", "弾丸ブループリント", create_projectile_blueprint()),
+        ("game_mode", "ゲームモードブループリント", create_game_mode_blueprint()),
+        ("game_level", "ゲームレベル", create_game_level()),
+    ]
+    script = build_combined_script([(key, step_script) for key, _, step_script in steps])
+    
+    # 1回のexecute_pythonですべて実行
+    logger.info(f"{'、'.join(label for _, label, _ in steps)}を作成します...")
+    result = get_client().execute_unreal_command("execute_python", {"script": script})
+    
+    # 各スクリプトの結果を出力（個別の結果が得られない場合は全体の結果を使う）
+    step_results = parse_step_results(result) or {}
+    for key, label, _ in steps:
+        status = step_results.get(key, result.get("status"))
+        if status == "success":
+            logger.info(f"{label}の作成に成功しました")
+        else:
+            logger.error(f"{label}の作成に失敗しました: {step_results.get(key, result)}")
     
     logger.info("===== 基本的なブループリントの作成が完了しました =====")
+    return result
 
 if __name__ == "__main__":
     main() 
@@ -432,6 +432,7 @@ class MCPBlenderAPI:
             with TCPServer(("0.0.0.0", port), handler) as httpd:
                 logger.info(f"APIサーバーを開始しました。ポート: {port}")
                 logger.info("Ctrl+Cで終了")
+                self._notify_ready()
                 httpd.serve_forever()
         except KeyboardInterrupt:
             logger.info("APIサーバーを終了します")
@@ -447,11 +448,26 @@ class MCPBlenderAPI:
                         with TCPServer(("0.0.0.0", new_port), handler) as httpd:
                             logger.info(f"APIサーバーを開始しました。ポート: {new_port}")
                             logger.info("Ctrl+Cで終了")
+                            self._notify_ready()
                             httpd.serve_forever()
                             break
                     except:
                         continue
     
+    def _notify_ready(self):
+        """
+        起動完了ファイルを作成して、ランチャーにAPIサーバーの準備完了を通知する
+        """
+        ready_file = os.environ.get("BLENDER_READY_FILE")
+        if not ready_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(ready_file), exist_ok=True)
+            with open(ready_file, "w", encoding="utf-8") as f:
+                f.write(str(os.getpid()))
+        except Exception as e:
+            logger.warning(f"起動完了ファイルの作成に失敗しました: {str(e)}")
+    
     def _create_api_handler(self):
         """
         APIリクエストを処理するハンドラークラスを作成
@@ -146,6 +146,21 @@ def execute_unreal_command():
                 }
             }
         },
+        "import_assets": {
+            "status": "success",
+            "command": command,
+            "result": {
+                "message": f"{len(params.get('manifest', []))}個のアセットをインポートしました",
+                "data": params,
+                "assets": [
+                    {
+                        "path": asset.get("destination", ""),
+                        "name": os.path.basename(asset.get("path", "unknown")).split(".")[0]
+                    }
+                    for asset in params.get("manifest", [])
+                ]
+            }
+        },
         "place_actor": {
             "status": "success",
             "command": command,
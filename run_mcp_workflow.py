@@ -27,6 +27,7 @@ import logging
 import argparse
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # ロギングの設定
 logging.basicConfig(
@@ -88,6 +89,26 @@ def start_mcp_server():
         logger.error(f"MCPサーバーの起動中にエラーが発生しました: {str(e)}")
         return False
 
+# blender_direct_script.pyで作成するアセット（アセットごとに別のBlenderプロセスで並列に作成する）
+BLENDER_DIRECT_ASSETS = ["chest", "potion", "coin"]
+
+def _run_blender_asset(blender_path, asset):
+    """
+    1つのアセットをヘッドレスのBlenderで作成する
+    
+    引数:
+        blender_path (str): Blenderの実行ファイルのパス
+        asset (str): アセット名
+        
+    戻り値:
+        subprocess.CompletedProcess: 実行結果
+    """
+    return subprocess.run(
+        [blender_path, "--background", "--python", "blender_direct_script.py", "--", "--asset", asset],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+
 def run_blender_direct_script():
     """
     Blenderでゲームオブジェクト作成スクリプトを実行する
@@ -98,22 +119,24 @@ def run_blender_direct_script():
         # 環境変数から取得したBlenderパス
         blender_path = os.environ.get("BLENDER_PATH", "blender")
         
-        # スクリプトをBlenderで実行
-        process = subprocess.Popen(
-            [blender_path, "--background", "--python", "blender_direct_script.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        # アセットは互いに独立しているため、アセットごとにBlenderを起動して並列に実行
+        with ThreadPoolExecutor(max_workers=len(BLENDER_DIRECT_ASSETS)) as executor:
+            results = list(executor.map(
+                lambda asset: _run_blender_asset(blender_path, asset),
+                BLENDER_DIRECT_ASSETS
+            ))
         
-        stdout, stderr = process.communicate()
+        success = True
+        for asset, result in zip(BLENDER_DIRECT_ASSETS, results):
+            if result.returncode == 0:
+                logger.debug(result.stdout.decode())
+            else:
+                logger.error(f"Blenderスクリプトの実行中にエラーが発生しました（{asset}）: {result.stderr.decode()}")
+                success = False
         
-        if process.returncode == 0:
+        if success:
             logger.info("Blenderスクリプトが正常に完了しました")
-            logger.debug(stdout.decode())
-            return True
-        else:
-            logger.error(f"Blenderスクリプトの実行中にエラーが発生しました: {stderr.decode()}")
-            return False
+        return success
     except Exception as e:
         logger.error(f"Blenderスクリプト実行中に例外が発生しました: {str(e)}")
         return False
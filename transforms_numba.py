@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+トランスフォーム計算モジュール
+
+このモジュールは、複数オブジェクトの位置・スケール・回転から
+ワールド行列（4x4）をまとめて計算する関数を提供します。
+numbaが利用可能な場合はJITコンパイルして並列に計算します。
+
+主な機能:
+- 位置・スケール・回転（XYZオイラー角）からの4x4行列の合成
+- オブジェクト単位の配列（SoA）による一括計算
+
+制限事項:
+- 回転はラジアン単位のXYZオイラー角（Blenderのrotation_eulerと同じ順序）です
+- numbaがない場合は通常のPythonとして実行されます
+"""
+
+import numpy as np
+
+# 数値計算の高速化（numbaが利用可能な場合はJITコンパイル）
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """numbaがない場合は関数をそのまま返す"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, fastmath=True, parallel=True)
+def apply_trs(locations, scales, eulers, out):
+    """
+    位置・スケール・回転から4x4のワールド行列を計算する（結果はoutに書き込む）
+    
+    行列は T * Rz * Ry * Rx * S の順に合成する
+    
+    引数:
+        locations (numpy.ndarray): 位置 (N, 3)
+        scales (numpy.ndarray): スケール (N, 3)
+        eulers (numpy.ndarray): 回転（XYZオイラー角、ラジアン） (N, 3)
+        out (numpy.ndarray): 出力先の行列 (N, 4, 4)
+    """
+    for i in prange(locations.shape[0]):
+        cx = np.cos(eulers[i, 0])
+        sx = np.sin(eulers[i, 0])
+        cy = np.cos(eulers[i, 1])
+        sy = np.sin(eulers[i, 1])
+        cz = np.cos(eulers[i, 2])
+        sz = np.sin(eulers[i, 2])
+        
+        # 回転行列 R = Rz * Ry * Rx の各列にスケールを掛ける
+        out[i, 0, 0] = cz * cy * scales[i, 0]
+        out[i, 1, 0] = sz * cy * scales[i, 0]
+        out[i, 2, 0] = -sy * scales[i, 0]
+        out[i, 0, 1] = (cz * sy * sx - sz * cx) * scales[i, 1]
+        out[i, 1, 1] = (sz * sy * sx + cz * cx) * scales[i, 1]
+        out[i, 2, 1] = cy * sx * scales[i, 1]
+        out[i, 0, 2] = (cz * sy * cx + sz * sx) * scales[i, 2]
+        out[i, 1, 2] = (sz * sy * cx - cz * sx) * scales[i, 2]
+        out[i, 2, 2] = cy * cx * scales[i, 2]
+        
+        # 平行移動
+        out[i, 0, 3] = locations[i, 0]
+        out[i, 1, 3] = locations[i, 1]
+        out[i, 2, 3] = locations[i, 2]
+        
+        out[i, 3, 0] = 0.0
+        out[i, 3, 1] = 0.0
+        out[i, 3, 2] = 0.0
+        out[i, 3, 3] = 1.0
+
+def compose_matrices(locations, scales, eulers):
+    """
+    複数オブジェクトのワールド行列をまとめて計算する
+    
+    引数:
+        locations (array_like): 位置 (N, 3)
+        scales (array_like): スケール (N, 3)
+        eulers (array_like): 回転（XYZオイラー角、ラジアン） (N, 3)
+    
+    戻り値:
+        numpy.ndarray: ワールド行列 (N, 4, 4)
+    """
+    locations = np.ascontiguousarray(locations, dtype=np.float64).reshape(-1, 3)
+    scales = np.ascontiguousarray(scales, dtype=np.float64).reshape(-1, 3)
+    eulers = np.ascontiguousarray(eulers, dtype=np.float64).reshape(-1, 3)
+    out = np.empty((locations.shape[0], 4, 4), dtype=np.float64)
+    apply_trs(locations, scales, eulers, out)
+    return out
@@ -335,6 +335,7 @@ class UE5MCP:
                 'available_commands': [
                     'create_level',
                     'import_asset',
+                    'import_assets',
                     'create_blueprint',
                     'generate_terrain',
                     'place_foliage',
@@ -373,6 +374,7 @@ class UE5MCP:
                 'available_commands': [
                     'create_level',
                     'import_asset',
+                    'import_assets',
                     'create_blueprint',
                     'generate_terrain',
                     'place_foliage',
@@ -405,6 +407,8 @@ class UE5MCP:
                 return self.createLevel(params)
             elif command == 'import_asset':
                 return self.importAsset(params)
+            elif command == 'import_assets':
+                return self.importAssets(params)
             elif command == 'create_blueprint':
                 return self.createBlueprint(params)
             elif command == 'generate_terrain':
@@ -488,6 +492,56 @@ class UE5MCP:
             }
         })
     
+    def importAssets(self, params):
+        """
+        マニフェストに含まれる複数のアセットをまとめてインポートする
+        
+        引数:
+            params (dict): パラメータ（path, destinationを持つ辞書のリストをmanifestに指定）
+            
+        戻り値:
+            JSON: 処理結果
+        """
+        manifest = params.get('manifest')
+        if not manifest:
+            return jsonify({'error': 'マニフェストが指定されていません'}), 400
+        
+        assets = []
+        missing = []
+        for asset in manifest:
+            path = asset.get('path', '')
+            destination = asset.get('destination', '/Game/Assets')
+            logger.info(f"アセットインポート: {path}, 保存先: {destination}")
+            
+            # ファイルが存在するか確認
+            if not path or not os.path.exists(path):
+                logger.warning(f"インポートするファイルが見つかりません: {path}")
+                missing.append(path)
+                continue
+            
+            # ここに実際のUE5 APIを使用したアセットインポートコードが入ります
+            asset_name = os.path.splitext(os.path.basename(path))[0]
+            assets.append({
+                'source_path': path,
+                'destination': destination,
+                'asset_name': asset_name,
+                'asset_path': f"{destination}/{asset_name}"
+            })
+        
+        if missing:
+            return jsonify({
+                'status': 'error',
+                'message': f'ファイルが見つかりません: {", ".join(missing)}',
+                'assets': assets
+            }), 404
+        
+        # デモ用の応答
+        return jsonify({
+            'status': 'success',
+            'message': f'{len(assets)}個のアセットがインポートされました',
+            'assets': assets
+        })
+    
     def createBlueprint(self, params):
         """
         Blueprintを作成する
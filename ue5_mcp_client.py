@@ -15,6 +15,8 @@ UE5-MCPクライアントモジュール
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 import sys
@@ -46,6 +48,10 @@ class UE5MCPClient:
         self.base_url = f"http://{host}:{port}"
         self.unreal_version = "Unknown"
         
+        # HTTPセッション（keep-aliveで接続を再利用し、一時的なエラーは再試行）
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.1)))
+        
         try:
             # Unrealモジュールがある場合は、バージョンを取得
             if 'unreal' in sys.modules:
@@ -65,7 +71,7 @@ class UE5MCPClient:
             dict: サーバーのステータス情報
         """
         try:
-            response = requests.get(f"{self.base_url}/api/status")
+            response = self.session.get(f"{self.base_url}/api/status")
             if response.status_code == 200:
                 status_data = response.json()
                 return status_data
@@ -108,7 +114,7 @@ class UE5MCPClient:
                 "command": command,
                 "params": params
             }
-            response = requests.post(endpoint, json=data)
+            response = self.session.post(endpoint, json=data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -170,7 +176,7 @@ class UE5MCPClient:
                 "command": command,
                 "params": params
             }
-            response = requests.post(endpoint, json=data)
+            response = self.session.post(endpoint, json=data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -235,7 +241,7 @@ class UE5MCPClient:
                     "description": description
                 }
             }
-            response = requests.post(endpoint, json=data)
+            response = self.session.post(endpoint, json=data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -142,6 +142,30 @@ class MCPPlugin:
             self.show_notification(f"アセットインポートエラー: {str(e)}", False)
             return False
     
+    def import_assets(self, manifest):
+        """複数のアセットを1回のインポート処理でまとめてインポート"""
+        try:
+            # アセットごとにインポートタスクを作成
+            tasks = []
+            for asset in manifest:
+                task = unreal.AssetImportTask()
+                task.filename = asset["path"]
+                task.destination_path = asset.get("destination", "/Game/Assets")
+                task.replace_existing = True
+                task.automated = True
+                task.save = True
+                tasks.append(task)
+            
+            # インポート実行
+            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
+            
+            self.show_notification(f"{len(tasks)}個のアセットをインポートしました", True)
+            return True
+        except Exception as e:
+            unreal.log_error(f"アセットインポートエラー: {str(e)}")
+            self.show_notification(f"アセットインポートエラー: {str(e)}", False)
+            return False
+    
     def place_asset(self, asset_path, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1), name=None):
         """アセットをレベルに配置"""
         try:
@@ -285,6 +309,18 @@ class MCPPlugin:
                     "message": f"アセット '{file_path}' をインポートしました" if success else f"アセット '{file_path}' のインポートに失敗しました"
                 }
             
+            elif command == "import_assets":
+                manifest = params.get("manifest", [])
+                
+                if not manifest or any(not asset.get("path") for asset in manifest):
+                    return {"status": "error", "message": "インポートするファイルパスが指定されていません"}
+                
+                success = self.import_assets(manifest)
+                return {
+                    "status": "success" if success else "error",
+                    "message": f"{len(manifest)}個のアセットをインポートしました" if success else "アセットのインポートに失敗しました"
+                }
+            
             elif command == "place_actor" or command == "spawn_actor":
                 asset_path = params.get("asset_path", "")
                 blueprint = params.get("blueprint", "")